@@ -25,21 +25,42 @@ INSTALLED_APPS = [
     "taggit",
     "corsheaders",
     # ----- #
+    "endobella.common",
     "endobella.articles",
     "endobella.auth",
+    "endobella.shop",
+    "endobella.faq",
+    "endobella.benchmarks",
 ]
 
 MIDDLEWARE = [
+    "endobella.common.middleware.PerformanceMiddleware",
+    "endobella.common.queries.QueryInspectionMiddleware",
+    "endobella.common.compression.CompressionMiddleware",
     "django.middleware.security.SecurityMiddleware",
-    "django.contrib.sessions.middleware.SessionMiddleware",
+    "endobella.common.middleware.LeanSessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.common.CommonMiddleware",
-    "django.middleware.csrf.CsrfViewMiddleware",
-    "django.contrib.auth.middleware.AuthenticationMiddleware",
-    "django.contrib.messages.middleware.MessageMiddleware",
-    "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "endobella.common.middleware.LeanCsrfViewMiddleware",
+    "endobella.common.middleware.LeanAuthenticationMiddleware",
+    "endobella.common.middleware.LeanMessageMiddleware",
+    "endobella.common.middleware.LeanXFrameOptionsMiddleware",
 ]
 
+# Safe requests under these prefixes skip sessions, CSRF, messages and
+# clickjacking protection (see endobella.common.middleware.is_lean_request).
+LEAN_ROUTE_PREFIXES = env.list(
+    "LEAN_ROUTE_PREFIXES",
+    default=[
+        "/api/articles/",
+        "/api/products/",
+        "/api/bootstrap/",
+        "/api/feeds/",
+        "/api/faq/",
+        "/api/autocomplete/",
+    ],
+)
+
 ROOT_URLCONF = "config.urls"
 
 TEMPLATES = [
@@ -98,6 +119,18 @@ STATIC_URL = "static/"
 STATIC_ROOT = BASE_DIR / "staticfiles"
 MEDIA_ROOT = BASE_DIR / "media"
 MEDIA_URL = "/media/"
+# Uploads (including CKEditor's) are deduplicated by content hash; see
+# endobella.common.storage.
+STORAGES = {
+    "default": {"BACKEND": "endobella.common.storage.ContentAddressedStorage"},
+    "staticfiles": {
+        "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
+    },
+}
+# Serve MEDIA_URL from Django (endobella.common.views.media) when no web
+# server or CDN origin does it.
+MEDIA_SERVE = env.bool("MEDIA_SERVE", DEBUG)
+MEDIA_CACHE_MAX_AGE = env.int("MEDIA_CACHE_MAX_AGE", 365 * 24 * 3600)
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
@@ -105,7 +138,15 @@ REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
         "rest_framework_simplejwt.authentication.JWTAuthentication",
         "rest_framework.authentication.SessionAuthentication",
-        "rest_framework.authentication.BasicAuthentication",
+    ),
+    "DEFAULT_RENDERER_CLASSES": (
+        "endobella.common.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "endobella.common.renderers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
     ),
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.LimitOffsetPagination",
     "PAGE_SIZE": 50,
@@ -117,6 +158,7 @@ SIMPLE_JWT = {
     "REFRESH_TOKEN_LIFETIME": timedelta(days=1),
     "ROTATE_REFRESH_TOKENS": False,
     "BLACKLIST_AFTER_ROTATION": True,
+    "TOKEN_REFRESH_SERIALIZER": "endobella.auth.serializers.TokenRefreshSerializer",
     "UPDATE_LAST_LOGIN": True,
     "ALGORITHM": "HS256",
     "SIGNING_KEY": "demo",
@@ -136,6 +178,114 @@ SIMPLE_JWT = {
 
 CORS_ALLOW_ALL_ORIGINS = True
 
+# Performance instrumentation
+PERFORMANCE_METRICS_ENABLED = env.bool("PERFORMANCE_METRICS_ENABLED", True)
+PERFORMANCE_SERVER_TIMING = env.bool("PERFORMANCE_SERVER_TIMING", True)
+# /metrics is served to these addresses only, and to nobody if empty
+PERFORMANCE_METRICS_ALLOWED_IPS = env.list(
+    "PERFORMANCE_METRICS_ALLOWED_IPS", default=["127.0.0.1", "::1"]
+)
+
+CACHES = {"default": env.cache("CACHE_URL", default="locmemcache://")}
+
+# Response compression, Brotli or gzip; only for LEAN_ROUTE_PREFIXES reads
+COMPRESSION_ENABLED = env.bool("COMPRESSION_ENABLED", True)
+COMPRESSION_MIN_SIZE = env.int("COMPRESSION_MIN_SIZE", 1024)
+COMPRESSION_GZIP_LEVEL = env.int("COMPRESSION_GZIP_LEVEL", 6)
+COMPRESSION_BROTLI_QUALITY = env.int("COMPRESSION_BROTLI_QUALITY", 6)
+COMPRESSION_STREAM_BROTLI_QUALITY = env.int("COMPRESSION_STREAM_BROTLI_QUALITY", 4)
+COMPRESSION_CACHE_ALIAS = env.str("COMPRESSION_CACHE_ALIAS", "default")
+COMPRESSION_CACHE_TIMEOUT = env.int("COMPRESSION_CACHE_TIMEOUT", 600)
+COMPRESSION_CACHE_MAX_SIZE = env.int("COMPRESSION_CACHE_MAX_SIZE", 1024 * 1024)
+
+# Buffered view counters and popularity ordering (endobella.common.counters)
+VIEW_COUNT_FLUSH_INTERVAL = env.int("VIEW_COUNT_FLUSH_INTERVAL", 30)
+VIEW_COUNT_MAX_KEYS = env.int("VIEW_COUNT_MAX_KEYS", 1000)
+POPULARITY_HALF_LIFE_HOURS = env.float("POPULARITY_HALF_LIFE_HOURS", 72.0)
+POPULAR_CACHE_TIMEOUT = env.int("POPULAR_CACHE_TIMEOUT", 60)
+
+# Related articles (endobella.articles.related)
+RELATED_ARTICLES_COUNT = env.int("RELATED_ARTICLES_COUNT", 5)
+RELATED_ARTICLES_AUTO_UPDATE = env.bool("RELATED_ARTICLES_AUTO_UPDATE", True)
+
+# Homepage/bootstrap endpoint (endobella.common.bootstrap)
+BOOTSTRAP_FEATURED_COUNT = env.int("BOOTSTRAP_FEATURED_COUNT", 6)
+BOOTSTRAP_LATEST_PER_CATEGORY = env.int("BOOTSTRAP_LATEST_PER_CATEGORY", 4)
+BOOTSTRAP_TAG_CLOUD_SIZE = env.int("BOOTSTRAP_TAG_CLOUD_SIZE", 30)
+BOOTSTRAP_CACHE_TIMEOUT = env.int("BOOTSTRAP_CACHE_TIMEOUT", 300)
+BOOTSTRAP_MAX_AGE = env.int("BOOTSTRAP_MAX_AGE", 60)
+
+# Frontend revalidation webhook (endobella.common.revalidation); disabled
+# while the URL is empty
+REVALIDATION_WEBHOOK_URL = env.str("REVALIDATION_WEBHOOK_URL", "")
+REVALIDATION_WEBHOOK_SECRET = env.str("REVALIDATION_WEBHOOK_SECRET", "")
+REVALIDATION_DEBOUNCE_SECONDS = env.float("REVALIDATION_DEBOUNCE_SECONDS", 2.0)
+REVALIDATION_MAX_RETRIES = env.int("REVALIDATION_MAX_RETRIES", 3)
+REVALIDATION_RETRY_BACKOFF = env.float("REVALIDATION_RETRY_BACKOFF", 0.5)
+REVALIDATION_TIMEOUT = env.float("REVALIDATION_TIMEOUT", 5.0)
+
+# Refresh-token revocation (endobella.auth.revocation)
+TOKEN_REVOCATION_REFRESH_SECONDS = env.float("TOKEN_REVOCATION_REFRESH_SECONDS", 5.0)
+TOKEN_REVOCATION_REBUILD_SECONDS = env.float("TOKEN_REVOCATION_REBUILD_SECONDS", 3600.0)
+TOKEN_REVOCATION_SYNC_OVERLAP_SECONDS = env.float(
+    "TOKEN_REVOCATION_SYNC_OVERLAP_SECONDS", 60.0
+)
+TOKEN_REVOCATION_FALSE_POSITIVE_RATE = env.float(
+    "TOKEN_REVOCATION_FALSE_POSITIVE_RATE", 0.001
+)
+TOKEN_REVOCATION_MIN_CAPACITY = env.int("TOKEN_REVOCATION_MIN_CAPACITY", 10_000)
+
+# Merchant catalog feeds (endobella.shop.feeds); FEED_PRODUCT_URL is joined
+# to FEED_SITE_URL, or to the request's host when that is empty
+FEED_SITE_URL = env.str("FEED_SITE_URL", "")
+FEED_PRODUCT_URL = env.str("FEED_PRODUCT_URL", "/products/{slug}")
+FEED_TITLE = env.str("FEED_TITLE", "Endobelle")
+FEED_BRAND = env.str("FEED_BRAND", "Endobelle")
+FEED_CURRENCY = env.str("FEED_CURRENCY", "USD")
+FEED_CHUNK_SIZE = env.int("FEED_CHUNK_SIZE", 500)
+FEED_WATERMARK_OVERLAP_SECONDS = env.int("FEED_WATERMARK_OVERLAP_SECONDS", 60)
+FEED_MAX_AGE = env.int("FEED_MAX_AGE", 900)
+
+# FAQ question search (endobella.faq.index): questions sharing the most
+# terms with the query are ranked, and those below the score are dropped
+FAQ_SEARCH_CANDIDATES = env.int("FAQ_SEARCH_CANDIDATES", 200)
+FAQ_SEARCH_MIN_SCORE = env.float("FAQ_SEARCH_MIN_SCORE", 0.25)
+
+# Description A/B tests (endobella.shop.experiments); counts are flushed with
+# the view counters, and rollups cover products with stats this recent
+EXPERIMENT_ROLLUP_LOOKBACK_SECONDS = env.int("EXPERIMENT_ROLLUP_LOOKBACK_SECONDS", 3600)
+
+# Typeahead (endobella.common.autocomplete): per-process prefix indexes,
+# caught up from updated_at and rebuilt to drop deleted rows
+AUTOCOMPLETE_REFRESH_SECONDS = env.float("AUTOCOMPLETE_REFRESH_SECONDS", 30.0)
+AUTOCOMPLETE_REBUILD_SECONDS = env.float("AUTOCOMPLETE_REBUILD_SECONDS", 3600.0)
+AUTOCOMPLETE_SYNC_OVERLAP_SECONDS = env.float("AUTOCOMPLETE_SYNC_OVERLAP_SECONDS", 60.0)
+AUTOCOMPLETE_MAX_RESULTS = env.int("AUTOCOMPLETE_MAX_RESULTS", 10)
+AUTOCOMPLETE_MAX_AGE = env.int("AUTOCOMPLETE_MAX_AGE", 60)
+# Build the indexes when a WSGI worker starts rather than on its first request
+AUTOCOMPLETE_WARM_ON_STARTUP = env.bool("AUTOCOMPLETE_WARM_ON_STARTUP", True)
+
+# Product search (endobella.shop.search): trigram similarity below the
+# minimum is no match, and the stock weight is the share of the score given
+# to being in stock. Off PostgreSQL a per-process index is refreshed like
+# the autocomplete one
+PRODUCT_SEARCH_MIN_SIMILARITY = env.float("PRODUCT_SEARCH_MIN_SIMILARITY", 0.3)
+PRODUCT_SEARCH_STOCK_WEIGHT = env.float("PRODUCT_SEARCH_STOCK_WEIGHT", 0.2)
+PRODUCT_SEARCH_MAX_RESULTS = env.int("PRODUCT_SEARCH_MAX_RESULTS", 50)
+PRODUCT_SEARCH_REFRESH_SECONDS = env.float("PRODUCT_SEARCH_REFRESH_SECONDS", 30.0)
+PRODUCT_SEARCH_REBUILD_SECONDS = env.float("PRODUCT_SEARCH_REBUILD_SECONDS", 3600.0)
+PRODUCT_SEARCH_SYNC_OVERLAP_SECONDS = env.float(
+    "PRODUCT_SEARCH_SYNC_OVERLAP_SECONDS", 60.0
+)
+
+# Admin changelists switch to planner estimates above this many rows
+ADMIN_ESTIMATED_COUNT_THRESHOLD = env.int("ADMIN_ESTIMATED_COUNT_THRESHOLD", 10_000)
+
+# Query inspection (N+1 and slow query logging)
+QUERY_INSPECTION_ENABLED = env.bool("QUERY_INSPECTION_ENABLED", DEBUG)
+QUERY_N_PLUS_ONE_THRESHOLD = env.int("QUERY_N_PLUS_ONE_THRESHOLD", 5)
+QUERY_SLOW_THRESHOLD_MS = env.int("QUERY_SLOW_THRESHOLD_MS", 100)
+
 # CK Editor
 customColorPalette = [
     {"color": "hsl(4, 90%, 58%)", "label": "Red"},
@@ -1,21 +1,32 @@
 from __future__ import annotations
 from django.conf import settings
-from django.conf.urls.static import static
 from django.contrib import admin
-from django.urls import include, path
+from django.urls import include, path, re_path
 from rest_framework.routers import DefaultRouter
 
 from endobella.articles.views import ArticleViewSet
+from endobella.common.views import AutocompleteView, BootstrapView, media, metrics
+from endobella.faq.views import QuestionSearchView
+from endobella.shop.views import ProductViewSet, product_feed
 
 router = DefaultRouter()
 router.register("articles", ArticleViewSet, basename="article")
+router.register("products", ProductViewSet, basename="product")
 
 
 urlpatterns = [
     path("admin/", admin.site.urls),
+    path("api/autocomplete/", AutocompleteView.as_view(), name="autocomplete"),
+    path("api/bootstrap/", BootstrapView.as_view(), name="bootstrap"),
+    path("api/faq/", QuestionSearchView.as_view(), name="faq-search"),
+    path("api/feeds/products.<str:format>", product_feed, name="product-feed"),
     path("api/", include(router.urls)),
+    path("api/auth/", include("endobella.auth.urls")),
     path("ckeditor5/", include("django_ckeditor_5.urls")),
+    path("metrics", metrics, name="metrics"),
 ]
 
-if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)  # type: ignore
+if settings.MEDIA_SERVE and settings.MEDIA_URL.startswith("/"):
+    urlpatterns.append(
+        re_path(rf"^{settings.MEDIA_URL.strip('/')}/(?P<path>.*)$", media, name="media")
+    )
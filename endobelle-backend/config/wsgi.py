@@ -2,9 +2,14 @@ from __future__ import annotations
 
 import os
 
+from django.conf import settings
 from django.core.wsgi import get_wsgi_application
 
-
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
 application = get_wsgi_application()
+
+if settings.AUTOCOMPLETE_WARM_ON_STARTUP:
+    from endobella.common.autocomplete import autocomplete
+
+    autocomplete.warm()
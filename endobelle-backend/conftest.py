@@ -7,6 +7,58 @@ from rest_framework.test import APIClient
 
 from endobella.articles.models import Article
 from endobella.auth.models import User
+from endobella.common.queries import record_queries
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("queries", "query budget and N+1 detection")
+    group.addoption(
+        "--query-budget",
+        type=int,
+        default=None,
+        help="Fail any test that runs more than this many queries.",
+    )
+    group.addoption(
+        "--fail-on-n-plus-one",
+        action="store_true",
+        default=False,
+        help="Fail tests that repeat the same query shape (see QUERY_N_PLUS_ONE_THRESHOLD).",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "query_budget(n): fail the test if it runs more than n queries",
+    )
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    marker = item.get_closest_marker("query_budget")
+    budget = marker.args[0] if marker else item.config.getoption("--query-budget")
+    fail_on_n_plus_one = item.config.getoption("--fail-on-n-plus-one")
+    if budget is None and not fail_on_n_plus_one:
+        return (yield)
+
+    with record_queries() as report:
+        result = yield
+
+    if budget is not None and len(report) > budget:
+        details = "\n".join(
+            f"  {group.count} x {group.shape}" for group in report.groups()
+        )
+        pytest.fail(
+            f"{len(report)} queries exceeded the budget of {budget}:\n{details}",
+            pytrace=False,
+        )
+    if fail_on_n_plus_one and (repeated := report.n_plus_one()):
+        details = "\n".join(
+            f"  {group.count} x {group.shape}\n    from {', '.join(group.locations)}"
+            for group in repeated
+        )
+        pytest.fail(f"N+1 query pattern detected:\n{details}", pytrace=False)
+    return result
 
 
 @pytest.fixture
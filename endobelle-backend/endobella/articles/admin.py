@@ -1,11 +1,25 @@
 from django.contrib import admin
+from django.utils.text import slugify
 
 from endobella.articles.models import Article
+from endobella.common.admin import PerformanceAdminMixin
 
 
 @admin.register(Article)
-class ArticleAdmin(admin.ModelAdmin):
-    list_display = ("title", "slug", "publish_date", "is_published")
+class ArticleAdmin(PerformanceAdminMixin, admin.ModelAdmin):
+    list_display = ("title", "slug", "author", "publish_date", "is_published")
     list_filter = ("is_published",)
+    list_select_related = ("author",)
     search_fields = ("title", "slug")
+    # Slugs are derived from titles, so a slug prefix also covers title prefixes.
+    prefix_search = (("slug", slugify),)
+    # Words inside the title; served by article_title_trgm_idx on PostgreSQL.
+    contains_search = ("title",)
+    changelist_defer = (
+        "content",
+        "excerpt",
+        "content_abstract",
+        "key_questions_answered",
+    )
+    autocomplete_fields = ("author",)
     prepopulated_fields = {"slug": ("title",)}
@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class ArticlesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "endobella.articles"
+
+    def ready(self):
+        from endobella.articles import signals  # noqa: F401
+        from endobella.articles.models import Article
+        from endobella.common import revalidation
+
+        revalidation.track(Article, revalidation.article_keys)
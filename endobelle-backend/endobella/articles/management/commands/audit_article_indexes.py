@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import re
+
+from django.core.management.base import BaseCommand, CommandError
+
+from endobella.articles.models import Article
+from endobella.articles.views import ArticleFilterSet, ArticleViewSet
+
+INDEX_NAME = re.compile(
+    r"(?:USING (?:COVERING )?INDEX|Index (?:Only )?Scan(?: Backward)? using) (\w+)"
+)
+FULL_SCAN = re.compile(r"Seq Scan on|SCAN articles_article(?! USING)")
+SORT = re.compile(r"\bSort\b|USE TEMP B-TREE FOR ORDER BY")
+
+
+class Command(BaseCommand):
+    help = (
+        "Run EXPLAIN for every ArticleFilterSet field and ordering combination "
+        "the public article list can produce and report full scans and sorts."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--verbose-plans", action="store_true", help="Print the full plans."
+        )
+
+    def handle(self, *args, **options):
+        queryset = ArticleViewSet.queryset
+        sample = queryset.values(*ArticleFilterSet.Meta.fields).first()
+        if sample is None:
+            raise CommandError("No published articles to sample filter values from.")
+
+        orderings = [*ArticleViewSet.ordering]
+        for field in ArticleViewSet.ordering_fields:
+            orderings.extend([field, f"-{field}"])
+        filters = [None, *ArticleFilterSet.Meta.fields]
+
+        used = set()
+        problems = 0
+        for filter_name in filters:
+            filtered = queryset
+            if filter_name:
+                filtered = filtered.filter(**{filter_name: sample[filter_name]})
+            for ordering in dict.fromkeys(orderings):
+                plan = filtered.order_by(ordering)[:50].explain()
+                indexes = INDEX_NAME.findall(plan)
+                used.update(indexes)
+                flags = [
+                    label
+                    for label, pattern in (("FULL SCAN", FULL_SCAN), ("SORT", SORT))
+                    if pattern.search(plan)
+                ]
+                problems += bool(flags)
+                self.stdout.write(
+                    f"{filter_name or '-':16} {ordering:14} "
+                    f"{', '.join(indexes) or '-':40} {' '.join(flags)}"
+                )
+                if options["verbose_plans"]:
+                    self.stdout.write(plan + "\n")
+
+        self.stdout.write(f"\n{problems} combinations need a full scan or a sort.")
+        defined = {index.name for index in Article._meta.indexes}
+        unused = sorted(defined - used)
+        if unused:
+            self.stdout.write(
+                f"Indexes not used by any combination: {', '.join(unused)}"
+            )
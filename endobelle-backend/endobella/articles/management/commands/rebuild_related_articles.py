@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from endobella.articles import related
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute text sketches and related-article lists for every published "
+        "article. Needed after bulk imports, which bypass signals."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        written = related.rebuild(batch_size=options["batch_size"])
+        self.stdout.write(
+            f"Wrote {written} related-article lists in "
+            f"{time.perf_counter() - start:.1f}s"
+        )
@@ -0,0 +1,63 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:33
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0003_uuid_tagged_item"),
+        (
+            "taggit",
+            "0006_rename_taggeditem_content_type_object_id_taggit_tagg_content_8fc721_idx",
+        ),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="article",
+            name="articles_ar_slug_452037_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="article",
+            name="articles_ar_is_publ_c4f5ce_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="article",
+            name="articles_ar_publish_0bbed0_idx",
+        ),
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(
+                condition=models.Q(("is_published", True)),
+                fields=["publish_date"],
+                name="article_pub_publish_date_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(
+                condition=models.Q(("is_published", True)),
+                fields=["is_featured", "created_at"],
+                name="article_pub_featured_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(
+                condition=models.Q(("is_published", True)),
+                fields=["article_type", "created_at"],
+                name="article_pub_type_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(
+                condition=models.Q(("is_published", True)),
+                fields=["author", "created_at"],
+                name="article_pub_author_idx",
+            ),
+        ),
+    ]
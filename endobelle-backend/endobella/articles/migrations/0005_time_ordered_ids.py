@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:33
+
+from django.db import migrations, models
+
+import endobella.common.ids
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0004_filterset_indexes"),
+    ]
+
+    # The default is applied in Python only, so no table needs rewriting.
+    # Existing rows keep their uuid4 keys; rewriting primary keys would
+    # cascade to every foreign key and tagged item and break stored URLs.
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name="article",
+                    name="id",
+                    field=models.UUIDField(
+                        default=endobella.common.ids.uuid7,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:42
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0005_time_ordered_ids"),
+        (
+            "taggit",
+            "0006_rename_taggeditem_content_type_object_id_taggit_tagg_content_8fc721_idx",
+        ),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="article",
+            name="popularity",
+            field=models.FloatField(
+                default=0.0,
+                editable=False,
+                help_text="Time-decayed view score in log space; higher is more popular.",
+            ),
+        ),
+        migrations.AddField(
+            model_name="article",
+            name="view_count",
+            field=models.PositiveBigIntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(
+                models.OrderBy(models.F("popularity"), descending=True),
+                condition=models.Q(("is_published", True)),
+                name="article_pub_popularity_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(
+                models.OrderBy(models.F("view_count"), descending=True),
+                condition=models.Q(("is_published", True)),
+                name="article_pub_view_count_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:45
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0006_view_counts"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RelatedArticles",
+            fields=[
+                (
+                    "article",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="related_index",
+                        serialize=False,
+                        to="articles.article",
+                    ),
+                ),
+                ("items", models.JSONField(blank=True, default=list)),
+                (
+                    "signature",
+                    models.JSONField(
+                        blank=True,
+                        default=list,
+                        help_text="MinHash signature of the article text.",
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Related articles",
+                "verbose_name_plural": "Related articles",
+            },
+        ),
+    ]
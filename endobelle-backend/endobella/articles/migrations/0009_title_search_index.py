@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-19 13:05
+
+from django.db import migrations
+
+TITLE_INDEX = "article_title_trgm_idx"
+
+
+def create_title_index(apps, schema_editor):
+    # Serves the admin's title__icontains, which PostgreSQL runs as
+    # UPPER(title) LIKE UPPER(%term%). Other backends scan.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    table = schema_editor.quote_name(
+        apps.get_model("articles", "Article")._meta.db_table
+    )
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        f"CREATE INDEX IF NOT EXISTS {schema_editor.quote_name(TITLE_INDEX)} "
+        f"ON {table} USING gin ((UPPER({schema_editor.quote_name('title')}::text)) "
+        "gin_trgm_ops)"
+    )
+
+
+def drop_title_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        f"DROP INDEX IF EXISTS {schema_editor.quote_name(TITLE_INDEX)}"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0008_bootstrap_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_title_index, drop_title_index),
+    ]
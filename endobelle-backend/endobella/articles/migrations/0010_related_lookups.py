@@ -0,0 +1,96 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:56
+
+import hashlib
+import uuid
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# Frozen copies of endobella.articles.related.bands() and band_key().
+BAND_SIZE = 8
+EMPTY = 1 << 53
+
+
+def band_keys(signature):
+    for i in range(0, len(signature), BAND_SIZE):
+        band = tuple(signature[i : i + BAND_SIZE])
+        if EMPTY not in band:
+            digest = hashlib.blake2b(repr((i, band)).encode(), digest_size=8)
+            yield int.from_bytes(digest.digest(), signed=True)
+
+
+def fill_lookups(apps, schema_editor):
+    RelatedArticles = apps.get_model("articles", "RelatedArticles")
+    RelatedBand = apps.get_model("articles", "RelatedBand")
+    RelatedListing = apps.get_model("articles", "RelatedListing")
+    bands, listings = [], []
+    rows = RelatedArticles.objects.filter(article__is_published=True)
+    for pk, items, signature in rows.values_list(
+        "article_id", "items", "signature"
+    ).iterator(chunk_size=500):
+        bands.extend(
+            RelatedBand(article_id=pk, key=key) for key in band_keys(signature)
+        )
+        listings.extend(
+            RelatedListing(article_id=pk, listed=uuid.UUID(item["id"]))
+            for item in items
+        )
+    RelatedBand.objects.bulk_create(bands, batch_size=1000)
+    RelatedListing.objects.bulk_create(listings, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0009_title_search_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RelatedBand",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("key", models.BigIntegerField(db_index=True)),
+                (
+                    "article",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="related_bands",
+                        to="articles.article",
+                    ),
+                ),
+            ],
+        ),
+        migrations.CreateModel(
+            name="RelatedListing",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("listed", models.UUIDField(db_index=True)),
+                (
+                    "article",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="related_listings",
+                        to="articles.article",
+                    ),
+                ),
+            ],
+        ),
+        migrations.RunPython(fill_lookups, migrations.RunPython.noop),
+    ]
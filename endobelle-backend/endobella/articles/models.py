@@ -1,12 +1,16 @@
+from functools import partial
+
 from django.db import models
-from django.utils.text import slugify
+from django.db.models import F
 from django.utils.translation import gettext_lazy as _
 
 from django_ckeditor_5.fields import CKEditor5Field
 from taggit.managers import TaggableManager
+from taggit.models import GenericUUIDTaggedItemBase, TaggedItemBase
 
 from endobella.auth.models import User
-from endobella.common.models import BaseModel
+from endobella.common.models import BaseModel, ViewCountedModel
+from endobella.common.slugs import save_with_slug
 
 
 class SeoGaioBase(models.Model):
@@ -51,7 +55,13 @@ class SeoGaioBase(models.Model):
         abstract = True
 
 
-class Article(BaseModel):
+class UUIDTaggedItem(GenericUUIDTaggedItemBase, TaggedItemBase):
+    class Meta:
+        verbose_name = _("Tag")
+        verbose_name_plural = _("Tags")
+
+
+class Article(ViewCountedModel, BaseModel):
     class Category(models.TextChoices):
         KNOWLEDGE_BASE = "knowledge_base", _("Knowledlege Base")
         WELL_BEING = "well_being", _("Well Being")
@@ -89,7 +99,7 @@ class Article(BaseModel):
         help_text=_("When this article should be published"), null=True, blank=True
     )
 
-    tags = TaggableManager(blank=True)
+    tags = TaggableManager(through=UUIDTaggedItem, blank=True)
     article_type = models.CharField(
         max_length=50,
         choices=Type.choices,
@@ -141,20 +151,103 @@ class Article(BaseModel):
 
     class Meta:
         ordering = ["-created_at"]
+        # Chosen from ``manage.py audit_article_indexes``. The public API always
+        # filters on is_published, so filter columns get partial composite
+        # indexes; slug is already covered by its unique constraint.
         indexes = [
-            models.Index(fields=["slug"]),
-            models.Index(fields=["is_published"]),
-            models.Index(fields=["publish_date"]),
             models.Index(fields=["created_at"]),
+            models.Index(fields=["updated_at"]),
+            models.Index(
+                fields=["publish_date"],
+                condition=models.Q(is_published=True),
+                name="article_pub_publish_date_idx",
+            ),
+            models.Index(
+                fields=["is_featured", "created_at"],
+                condition=models.Q(is_published=True),
+                name="article_pub_featured_idx",
+            ),
+            models.Index(
+                fields=["article_type", "created_at"],
+                condition=models.Q(is_published=True),
+                name="article_pub_type_idx",
+            ),
+            models.Index(
+                fields=["author", "created_at"],
+                condition=models.Q(is_published=True),
+                name="article_pub_author_idx",
+            ),
+            models.Index(
+                fields=["category", "created_at"],
+                condition=models.Q(is_published=True),
+                name="article_pub_category_idx",
+            ),
+            models.Index(
+                F("popularity").desc(),
+                condition=models.Q(is_published=True),
+                name="article_pub_popularity_idx",
+            ),
+            models.Index(
+                F("view_count").desc(),
+                condition=models.Q(is_published=True),
+                name="article_pub_view_count_idx",
+            ),
         ]
 
     def __str__(self):
         return self.title
 
     def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(self.title)
-        super().save(*args, **kwargs)
+        save_with_slug(self, "title", partial(super().save, *args, **kwargs))
 
     def get_absolute_url(self):
         return f"/{self.slug}/"
+
+
+class RelatedArticles(models.Model):
+    """Top related articles, maintained by ``endobella.articles.related``."""
+
+    article = models.OneToOneField(
+        Article,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="related_index",
+    )
+    items = models.JSONField(default=list, blank=True)
+    signature = models.JSONField(
+        default=list, blank=True, help_text=_("MinHash signature of the article text.")
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = _("Related articles")
+        verbose_name_plural = _("Related articles")
+
+    def __str__(self):
+        return str(self.article_id)
+
+
+class RelatedBand(models.Model):
+    """An LSH band key of a published article's signature, to find candidates."""
+
+    article = models.ForeignKey(
+        Article, on_delete=models.CASCADE, related_name="related_bands"
+    )
+    key = models.BigIntegerField(db_index=True)
+
+    def __str__(self):
+        return f"{self.article_id}: {self.key}"
+
+
+class RelatedListing(models.Model):
+    """Reverse of ``RelatedArticles.items``: ``article``'s list has ``listed``."""
+
+    article = models.ForeignKey(
+        Article, on_delete=models.CASCADE, related_name="related_listings"
+    )
+    # Not a foreign key: the rows must outlive a deleted article until the
+    # lists it was in are recomputed.
+    listed = models.UUIDField(db_index=True)
+
+    def __str__(self):
+        return f"{self.article_id} -> {self.listed}"
@@ -0,0 +1,456 @@
+"""
+Precomputed related articles.
+
+Every published article gets a ``RelatedArticles`` row holding its top
+``RELATED_ARTICLES_COUNT`` neighbours, so the detail endpoint reads one
+JSON column instead of aggregating tag overlap over ``taggit`` tables.
+
+Two articles are scored by::
+
+    TAG_WEIGHT * jaccard(tags) + TEXT_WEIGHT * similarity(text)
+        + CATEGORY_WEIGHT * same_category
+
+Text similarity is estimated from a MinHash signature of the article's word
+bigrams. Signatures are stored with the row, so rescoring never reads
+``content`` again. Candidates for an article are the ones sharing a tag or
+an LSH band (``BAND_SIZE`` consecutive signature values) with it. When there
+are too few of those, the newest articles from the same category fill the
+list. A list topped up that way keeps its fill until it is recomputed, so
+newer articles of the category only appear in it after the next rebuild.
+
+The score is symmetric. When one article changes, only its own list and the
+lists of its candidates, or of articles that currently list it, can change.
+``update_article`` recomputes the first and merges the change into the
+others. It never loads the whole corpus: ``RelatedBand`` rows index the
+band keys and ``RelatedListing`` rows which lists hold which article, so
+``Corpus.around`` reads just the articles a list could be made of.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import html
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+from itertools import pairwise
+from operator import eq
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.utils.html import strip_tags
+
+from endobella.articles.models import (
+    Article,
+    RelatedArticles,
+    RelatedBand,
+    RelatedListing,
+    UUIDTaggedItem,
+)
+
+TAG_WEIGHT = 2.0
+TEXT_WEIGHT = 1.0
+CATEGORY_WEIGHT = 0.5
+SIGNATURE_SIZE = 64
+BAND_SIZE = 8
+MAX_CANDIDATES_PER_TAG = 500
+
+_WORD = re.compile(r"\w+")
+# Shingle hashes are 53-bit, so signatures survive a round trip through any
+# JSON parser; EMPTY marks a bin no shingle fell into.
+EMPTY = 1 << 53
+
+
+def plain_text(value):
+    return html.unescape(strip_tags(value or ""))
+
+
+def _shingle_hashes(text):
+    words = _WORD.findall(text.lower())
+    shingles = {" ".join(pair) for pair in pairwise(words)} or set(words)
+    return [
+        int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8).digest()) >> 11
+        for s in shingles
+    ]
+
+
+def signature(text):
+    """
+    One-permutation MinHash of the word bigrams in ``text``.
+
+    Each shingle hash falls into one of ``SIGNATURE_SIZE`` bins and every bin
+    keeps its minimum, which needs a single pass over the shingles instead
+    of one per hash function.
+    """
+    hashes = _shingle_hashes(text)
+    if not hashes:
+        return []
+    bins = [EMPTY] * SIGNATURE_SIZE
+    for value in hashes:
+        index = value % SIGNATURE_SIZE
+        bins[index] = min(bins[index], value)
+    return bins
+
+
+def text_similarity(first, second):
+    """Estimated Jaccard similarity of two signatures."""
+    if not first or not second:
+        return 0.0
+    if EMPTY not in first or EMPTY not in second:
+        # No bin is empty in both, so every position counts.
+        return sum(map(eq, first, second)) / len(first)
+    shared = filled = 0
+    for a, b in zip(first, second):
+        if a == b:
+            if a != EMPTY:
+                shared += 1
+                filled += 1
+        else:
+            filled += 1
+    return shared / filled if filled else 0.0
+
+
+def bands(values):
+    """LSH band keys; articles sharing one are likely to be similar."""
+    keys = []
+    for i in range(0, len(values), BAND_SIZE):
+        band = tuple(values[i : i + BAND_SIZE])
+        if EMPTY not in band:
+            keys.append((i, band))
+    return keys
+
+
+def band_key(band):
+    """Signed 64-bit key of a ``bands()`` item, as stored in ``RelatedBand``."""
+    digest = hashlib.blake2b(repr(band).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, signed=True)
+
+
+@dataclass
+class Entry:
+    id: object
+    slug: str
+    title: str
+    category: str
+    created_at: object
+    tags: frozenset
+    signature: tuple
+
+    def item(self, score):
+        return {
+            "id": str(self.id),
+            "slug": self.slug,
+            "title": self.title,
+            "score": round(score, 4),
+        }
+
+
+def score(first, second):
+    value = 0.0
+    if first.tags and second.tags:
+        shared = len(first.tags & second.tags)
+        if shared:
+            value += TAG_WEIGHT * shared / len(first.tags | second.tags)
+    value += TEXT_WEIGHT * text_similarity(first.signature, second.signature)
+    if first.category == second.category:
+        value += CATEGORY_WEIGHT
+    return value
+
+
+class Corpus:
+    """In-memory snapshot of every published article's tags and signature."""
+
+    def __init__(self, entries):
+        self.entries = {entry.id: entry for entry in entries}
+        self.by_tag = defaultdict(list)
+        self.by_band = defaultdict(set)
+        self.by_category = defaultdict(list)
+        for entry in self.entries.values():
+            for tag in entry.tags:
+                self.by_tag[tag].append(entry)
+            for band in bands(entry.signature):
+                self.by_band[band].add(entry.id)
+            self.by_category[entry.category].append(entry)
+        for members in (*self.by_tag.values(), *self.by_category.values()):
+            members.sort(key=lambda entry: entry.created_at, reverse=True)
+
+    @classmethod
+    def load(cls, signatures=None, ids=None):
+        """
+        Read the published corpus, or its articles ``ids``, with three
+        queries and no ``content``.
+
+        ``signatures`` overrides stored signatures, e.g. for articles whose
+        signature has not been saved yet.
+        """
+        articles = Article.objects.filter(is_published=True)
+        tagged = UUIDTaggedItem.objects.filter(
+            content_type=ContentType.objects.get_for_model(Article)
+        )
+        stored = RelatedArticles.objects.all()
+        if ids is not None:
+            ids = list(ids)
+            articles = articles.filter(pk__in=ids)
+            tagged = tagged.filter(object_id__in=ids)
+            stored = stored.filter(article_id__in=ids)
+        articles = list(
+            articles.values_list("id", "slug", "title", "category", "created_at")
+        )
+        tags = defaultdict(set)
+        for object_id, tag_id in tagged.values_list("object_id", "tag_id"):
+            tags[object_id].add(tag_id)
+        stored = dict(stored.values_list("article_id", "signature"))
+        stored.update(signatures or {})
+        return cls(
+            Entry(
+                id=pk,
+                slug=slug,
+                title=title,
+                category=category,
+                created_at=created_at,
+                tags=frozenset(tags.get(pk, ())),
+                signature=tuple(stored.get(pk) or ()),
+            )
+            for pk, slug, title, category, created_at in articles
+        )
+
+    @classmethod
+    def around(cls, ids, signatures=None, extra=()):
+        """
+        The published articles ``ids`` and everything ``related`` may pick
+        for them: the newest articles of each of their tags, the articles
+        sharing a band, and the newest of their categories.
+
+        A superset of those gives the same lists, so ``extra`` articles and
+        the ones in ``signatures`` (whose ``RelatedBand`` rows may be stale)
+        are loaded too.
+        """
+        focus = cls.load(signatures, ids)
+        nearby = {*focus.entries, *extra, *(signatures or ())}
+        published = Article.objects.filter(is_published=True).order_by("-created_at")
+        for tag in focus.by_tag:
+            nearby.update(
+                published.filter(tags__id=tag).values_list("pk", flat=True)[
+                    :MAX_CANDIDATES_PER_TAG
+                ]
+            )
+        keys = {
+            band_key(band)
+            for entry in focus.entries.values()
+            for band in bands(entry.signature)
+        }
+        nearby.update(
+            RelatedBand.objects.filter(key__in=keys).values_list(
+                "article_id", flat=True
+            )
+        )
+        # The fill skips at most the article and the candidates chosen.
+        fill = 2 * settings.RELATED_ARTICLES_COUNT
+        for category in focus.by_category:
+            nearby.update(
+                published.filter(category=category).values_list("pk", flat=True)[:fill]
+            )
+        return cls.load(signatures, nearby)
+
+    def candidates(self, entry):
+        ids = set()
+        for tag in entry.tags:
+            # Very common tags would make every article a candidate of every
+            # other; their newest articles are enough.
+            ids.update(other.id for other in self.by_tag[tag][:MAX_CANDIDATES_PER_TAG])
+        for band in bands(entry.signature):
+            ids |= self.by_band[band]
+        ids.discard(entry.id)
+        return ids
+
+    def related(self, entry, count=None):
+        count = count or settings.RELATED_ARTICLES_COUNT
+        scored = [
+            (score(entry, self.entries[pk]), self.entries[pk])
+            for pk in self.candidates(entry)
+        ]
+        best = heapq.nlargest(
+            count, scored, key=lambda pair: (pair[0], pair[1].created_at)
+        )
+        if len(best) < count:
+            chosen = {other.id for _, other in best} | {entry.id}
+            for other in self.by_category[entry.category]:
+                if len(best) >= count:
+                    break
+                if other.id not in chosen:
+                    best.append((score(entry, other), other))
+            best.sort(key=lambda pair: pair[0], reverse=True)
+        return [other.item(value) for value, other in best]
+
+    def patch(self, entry, items, changed, count=None):
+        """
+        ``entry``'s list after ``changed`` was rescored, reusing ``items``.
+
+        Merging is exact unless ``changed`` was listed and lost score, since
+        an unlisted article may now beat it; then, or without ``items``,
+        returns None and the list has to be recomputed.
+        """
+        count = count or settings.RELATED_ARTICLES_COUNT
+        if items is None:
+            return None
+        changed_id = str(changed.id)
+        item = changed.item(score(entry, changed))
+        previous = next((i for i in items if i["id"] == changed_id), None)
+        if previous is not None and item["score"] < previous["score"]:
+            return None
+        merged = [i for i in items if i["id"] != changed_id] + [item]
+        merged.sort(key=lambda i: i["score"], reverse=True)
+        return merged[:count]
+
+
+def article_signature(article):
+    return signature(
+        " ".join(
+            (article.title, plain_text(article.excerpt), plain_text(article.content))
+        )
+    )
+
+
+def _upsert(rows, signatures):
+    """
+    Upsert ``{article_id: items}`` with one query per kind of write.
+
+    Returns the rows written and the signatures that changed.
+    """
+    existing = RelatedArticles.objects.in_bulk(list(rows))
+    changed, created, resigned = [], [], {}
+    for pk, items in rows.items():
+        row = existing.get(pk)
+        signature = signatures.get(pk)
+        if row is None:
+            created.append(
+                RelatedArticles(article_id=pk, items=items, signature=signature or [])
+            )
+            resigned[pk] = signature or []
+            continue
+        if signature is not None and row.signature != signature:
+            row.signature = resigned[pk] = signature
+        elif row.items == items:
+            continue
+        row.items = items
+        changed.append(row)
+    RelatedArticles.objects.bulk_create(created, batch_size=500)
+    RelatedArticles.objects.bulk_update(changed, ["items", "signature"], batch_size=500)
+    return created + changed, resigned
+
+
+def _save(rows, signatures=None):
+    """``_upsert``, plus the ``RelatedListing`` and ``RelatedBand`` rows."""
+    written, resigned = _upsert(rows, signatures or {})
+    _write_listings({row.article_id: row.items for row in written})
+    _write_bands(resigned)
+    return len(written)
+
+
+def _write_listings(lists, replace=True):
+    if replace:
+        RelatedListing.objects.filter(article_id__in=list(lists)).delete()
+    RelatedListing.objects.bulk_create(
+        (
+            RelatedListing(article_id=pk, listed=item["id"])
+            for pk, items in lists.items()
+            for item in items
+        ),
+        batch_size=1000,
+    )
+
+
+def _write_bands(signatures, replace=True):
+    if replace:
+        RelatedBand.objects.filter(article_id__in=list(signatures)).delete()
+    RelatedBand.objects.bulk_create(
+        (
+            RelatedBand(article_id=pk, key=band_key(band))
+            for pk, values in signatures.items()
+            for band in bands(values)
+        ),
+        batch_size=1000,
+    )
+
+
+def update_article(article):
+    """Refresh ``article``'s list and every list it could appear in."""
+    if not article.is_published:
+        return remove_article(article.pk)
+
+    own = {article.pk: article_signature(article)}
+    listing = _listing(article.pk)
+    corpus = Corpus.around([article.pk], signatures=own, extra=listing)
+    entry = corpus.entries[article.pk]
+    affected = corpus.candidates(entry) | listing
+    current = dict(
+        RelatedArticles.objects.filter(article_id__in=affected).values_list(
+            "article_id", "items"
+        )
+    )
+    rows, stale = {article.pk: corpus.related(entry)}, []
+    for pk in affected & corpus.entries.keys():
+        items = corpus.patch(corpus.entries[pk], current.get(pk), entry)
+        if items is None:
+            stale.append(pk)
+        else:
+            rows[pk] = items
+    if stale:
+        nearby = Corpus.around(stale, signatures=own)
+        rows.update((pk, nearby.related(nearby.entries[pk])) for pk in stale)
+    with transaction.atomic():
+        return _save(rows, signatures=own)
+
+
+def remove_article(pk):
+    """Drop an unpublished or deleted article from every list."""
+    listing = _listing(pk)
+    with transaction.atomic():
+        RelatedArticles.objects.filter(article_id=pk).update(items=[])
+        RelatedListing.objects.filter(article_id=pk).delete()
+        RelatedBand.objects.filter(article_id=pk).delete()
+    if not listing:
+        return 0
+    corpus = Corpus.around(listing)
+    rows = {
+        other: corpus.related(corpus.entries[other])
+        for other in listing
+        if other in corpus.entries
+    }
+    with transaction.atomic():
+        return _save(rows)
+
+
+def _listing(pk):
+    """Ids of articles whose stored list currently contains ``pk``."""
+    return set(
+        RelatedListing.objects.filter(listed=pk).values_list("article_id", flat=True)
+    )
+
+
+def rebuild(batch_size=500):
+    """
+    Recompute every signature and every list.
+
+    ``content`` is streamed in batches to build signatures, then all lists are
+    computed in memory from the corpus.
+    """
+    signatures = {}
+    queryset = Article.objects.filter(is_published=True).only(
+        "id", "title", "excerpt", "content"
+    )
+    for article in queryset.iterator(chunk_size=batch_size):
+        signatures[article.pk] = article_signature(article)
+
+    corpus = Corpus.load(signatures=signatures)
+    rows = {pk: corpus.related(entry) for pk, entry in corpus.entries.items()}
+    with transaction.atomic():
+        RelatedArticles.objects.exclude(article__is_published=True).delete()
+        written, _ = _upsert(rows, signatures)
+        RelatedListing.objects.all().delete()
+        RelatedBand.objects.all().delete()
+        _write_listings(rows, replace=False)
+        _write_bands(signatures, replace=False)
+        return len(written)
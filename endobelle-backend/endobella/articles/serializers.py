@@ -1,8 +1,39 @@
 from rest_framework import serializers
-from endobella.articles.models import Article
 
+from endobella.articles.models import Article, RelatedArticles
+from endobella.common.serializers import CachedModelSerializer
+
+
+class ArticleSerializer(CachedModelSerializer):
+    class Meta:
+        exclude = ["popularity"]
+        model = Article
+
+
+class ArticleDetailSerializer(ArticleSerializer):
+    related = serializers.SerializerMethodField()
+
+    def get_related(self, instance):
+        # Filled by select_related in ArticleViewSet; no tag joins at read time.
+        try:
+            return instance.related_index.items
+        except RelatedArticles.DoesNotExist:
+            return []
+
+
+class ArticleCardSerializer(CachedModelSerializer):
+    """The fields article teasers need, without ``content``."""
 
-class ArticleSerializer(serializers.ModelSerializer):
     class Meta:
-        fields = "__all__"
         model = Article
+        fields = [
+            "id",
+            "title",
+            "slug",
+            "category",
+            "featured_image",
+            "excerpt",
+            "publish_date",
+            "article_type",
+            "created_at",
+        ]
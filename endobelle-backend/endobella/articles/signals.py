@@ -0,0 +1,62 @@
+"""
+Keep ``RelatedArticles`` in step with article and tag changes.
+
+Updates run after the surrounding transaction commits, once per article
+even if it was saved and retagged in the same transaction (as the admin
+does). Bulk writes bypass signals; run ``rebuild_related_articles`` after
+those.
+"""
+
+from __future__ import annotations
+
+import threading
+from functools import partial
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from endobella.articles import related
+from endobella.articles.models import Article
+
+_state = threading.local()
+
+
+def _schedule(article):
+    if not settings.RELATED_ARTICLES_AUTO_UPDATE:
+        return
+    if not hasattr(_state, "pending"):
+        _state.pending = {}
+    _state.pending[article.pk] = article
+    transaction.on_commit(partial(_update, article.pk))
+
+
+def _update(pk):
+    # Later callbacks for the same article find nothing left to do.
+    article = _state.pending.pop(pk, None)
+    if article is not None:
+        related.update_article(article)
+
+
+@receiver(post_save, sender=Article, dispatch_uid="related_articles_save")
+def article_saved(sender, instance, raw=False, **kwargs):
+    if not raw:
+        _schedule(instance)
+
+
+@receiver(
+    m2m_changed, sender=Article.tags.through, dispatch_uid="related_articles_tags"
+)
+def article_tags_changed(sender, instance, action, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear") and isinstance(
+        instance, Article
+    ):
+        _schedule(instance)
+
+
+@receiver(post_delete, sender=Article, dispatch_uid="related_articles_delete")
+def article_deleted(sender, instance, **kwargs):
+    if settings.RELATED_ARTICLES_AUTO_UPDATE:
+        pk = instance.pk
+        transaction.on_commit(lambda: related.remove_article(pk))
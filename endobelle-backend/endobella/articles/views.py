@@ -1,7 +1,8 @@
 from django_filters import FilterSet
 from endobella.articles.models import Article
-from endobella.articles.serializers import ArticleSerializer
-from endobella.common.mixins import PublicItemViewMixin
+from endobella.articles.serializers import ArticleDetailSerializer, ArticleSerializer
+from endobella.common.counters import BufferedCounter
+from endobella.common.mixins import PublicItemViewMixin, ViewCountMixin
 
 
 class ArticleFilterSet(FilterSet):
@@ -19,7 +20,7 @@ class ArticleFilterSet(FilterSet):
         ]
 
 
-class ArticleViewSet(PublicItemViewMixin):
+class ArticleViewSet(ViewCountMixin, PublicItemViewMixin):
     queryset = Article.objects.filter(is_published=True)
     serializer_class = ArticleSerializer
     lookup_field = "slug"
@@ -27,3 +28,15 @@ class ArticleViewSet(PublicItemViewMixin):
     ordering_fields = ["created_at", "updated_at", "publish_date", "title"]
     ordering = ["-created_at"]
     filterset_class = ArticleFilterSet
+    view_counter = BufferedCounter(Article)
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == "retrieve":
+            queryset = queryset.select_related("related_index")
+        return queryset
+
+    def get_serializer_class(self):
+        if self.action == "retrieve":
+            return ArticleDetailSerializer
+        return super().get_serializer_class()
@@ -3,11 +3,13 @@ from __future__ import annotations
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
 
+from endobella.common.admin import PerformanceAdminMixin
+
 from .models import User
 
 
 @admin.register(User)
-class CustomUserAdmin(UserAdmin):
+class CustomUserAdmin(PerformanceAdminMixin, UserAdmin):
     model = User
 
     list_display = (
@@ -25,5 +27,7 @@ class CustomUserAdmin(UserAdmin):
         "is_active",
     )
 
-    search_fields = ("email", "id")
+    search_fields = ("email",)
+    # Emails are stored lowercased by UserManager.normalize_email.
+    prefix_search = (("email", str.lower),)
     ordering = ("email",)
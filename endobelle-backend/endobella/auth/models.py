@@ -3,6 +3,7 @@ from django.contrib.auth.base_user import BaseUserManager
 from django.contrib.auth.models import AbstractUser
 from django.db import models
 from django.db.models.functions import Lower
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from endobella.common.models import BaseModel
@@ -62,3 +63,14 @@ class User(BaseModel, AbstractUser):
     @property
     def name(self):
         return f"{self.first_name} {self.last_name}"
+
+
+class RevokedToken(models.Model):
+    """A refresh token that may no longer be used, until it expires anyway."""
+
+    jti = models.CharField(max_length=255, unique=True)
+    expires_at = models.DateTimeField(db_index=True)
+    revoked_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    def __str__(self):
+        return self.jti
@@ -0,0 +1,152 @@
+"""
+Refresh-token revocation without a database lookup per refresh.
+
+Revoked JTIs are stored in ``RevokedToken``. Each process keeps a Bloom
+filter of the unexpired ones and only queries the table when the filter
+reports a possible match, so a refresh with a valid token costs a few hash
+probes. The filter picks up rows revoked elsewhere every
+``TOKEN_REVOCATION_REFRESH_SECONDS`` with one indexed query on
+``revoked_at`` and is rebuilt every ``TOKEN_REVOCATION_REBUILD_SECONDS``
+(or when it fills up) so that expired tokens drop out of it.
+
+A token revoked by another process is therefore accepted for at most the
+refresh interval; the revoking process rejects it immediately.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from endobella.auth.models import RevokedToken
+
+
+class BloomFilter:
+    """Set membership with false positives but no false negatives."""
+
+    def __init__(self, capacity, error_rate):
+        self.capacity = max(capacity, 1)
+        self.size = max(
+            64, math.ceil(-self.capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.hashes = max(1, round(self.size / self.capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key):
+        # Double hashing: k probes from the two halves of one digest.
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, key):
+        """Add ``key``; returns False if it (probably) was there already."""
+        new = False
+        for position in self._positions(key):
+            byte, bit = position >> 3, 1 << (position & 7)
+            if not self._bits[byte] & bit:
+                self._bits[byte] |= bit
+                new = True
+        self.count += new
+        return new
+
+    def __contains__(self, key):
+        bits = self._bits
+        return all(
+            bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(key)
+        )
+
+    @property
+    def nbytes(self):
+        return len(self._bits)
+
+
+class RevocationList:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._filter = None
+        self._synced_at = None
+        self._checked_at = 0.0
+        self._built_at = 0.0
+
+    def reset(self):
+        with self._lock:
+            self._filter = None
+
+    def is_revoked(self, jti):
+        self._sync()
+        if jti not in self._filter:
+            return False
+        return RevokedToken.objects.filter(jti=jti).exists()
+
+    def revoke(self, jti, expires_at):
+        RevokedToken.objects.get_or_create(jti=jti, defaults={"expires_at": expires_at})
+        self._sync()
+        with self._lock:
+            self._filter.add(jti)
+
+    def stats(self):
+        self._sync()
+        bloom = self._filter
+        return {
+            "entries": bloom.count,
+            "capacity": bloom.capacity,
+            "bytes": bloom.nbytes,
+            "hashes": bloom.hashes,
+        }
+
+    def _sync(self):
+        now = time.monotonic()
+        if (
+            self._filter is not None
+            and now - self._checked_at < settings.TOKEN_REVOCATION_REFRESH_SECONDS
+        ):
+            return
+        with self._lock:
+            bloom = self._filter
+            if (
+                bloom is None
+                or bloom.count > bloom.capacity
+                or now - self._built_at > settings.TOKEN_REVOCATION_REBUILD_SECONDS
+            ):
+                self._rebuild()
+                self._built_at = now
+            else:
+                self._catch_up()
+            self._checked_at = now
+
+    def _rebuild(self):
+        started = timezone.now()
+        live = RevokedToken.objects.filter(expires_at__gt=started)
+        # Room to double before the next forced rebuild.
+        capacity = max(settings.TOKEN_REVOCATION_MIN_CAPACITY, 2 * live.count())
+        bloom = BloomFilter(capacity, settings.TOKEN_REVOCATION_FALSE_POSITIVE_RATE)
+        for jti in live.values_list("jti", flat=True).iterator(chunk_size=10_000):
+            bloom.add(jti)
+        self._filter = bloom
+        self._synced_at = started
+
+    def _catch_up(self):
+        # revoked_at comes from the revoking server's clock and its
+        # transaction may commit after we looked, so look back a little.
+        started = timezone.now()
+        since = self._synced_at - timedelta(
+            seconds=settings.TOKEN_REVOCATION_SYNC_OVERLAP_SECONDS
+        )
+        recent = RevokedToken.objects.filter(
+            revoked_at__gte=since, expires_at__gt=started
+        ).values_list("jti", flat=True)
+        for jti in recent.iterator():
+            self._filter.add(jti)
+        self._synced_at = started
+
+
+revocations = RevocationList()
@@ -13,16 +13,18 @@ from rest_framework.validators import UniqueValidator
 from rest_framework_simplejwt.serializers import (
     TokenObtainPairSerializer,
     TokenObtainSerializer,
+    TokenRefreshSerializer as BaseTokenRefreshSerializer,
 )
 from rest_framework_simplejwt.settings import api_settings
 
 from endobella.auth.models import User
+from endobella.auth.tokens import RefreshToken
+from endobella.common.serializers import CachedFieldsMixin, CachedModelSerializer
 
+USER_FIELDS = ["id", "email", "first_name", "last_name", "created_at", "updated_at"]
 
-USER_FIELDS = ["id", "email", "first_name", "last_name", "dt_created", "dt_updated"]
 
-
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(CachedModelSerializer):
     class Meta:
         model = User
         ref_name = "AuthUser"
@@ -39,7 +41,7 @@ class LowercaseEmailField(serializers.EmailField):
         return representation.lower()
 
 
-class UserCreateSerializer(DjoserUserCreateSerializer):
+class UserCreateSerializer(CachedFieldsMixin, DjoserUserCreateSerializer):
     email = LowercaseEmailField(
         validators=[
             UniqueValidator(
@@ -101,3 +103,15 @@ class EmailLoginTokenObtainSerializer(TokenObtainPairSerializer, UidAndTokenSeri
             "refresh": str(refresh),
             "access": str(refresh.access_token),
         }
+
+
+class TokenRefreshSerializer(BaseTokenRefreshSerializer):
+    token_class = RefreshToken
+
+
+class TokenRevokeSerializer(serializers.Serializer):
+    refresh = serializers.CharField(write_only=True)
+
+    def validate(self, attrs):
+        RefreshToken(attrs["refresh"]).revoke()
+        return {}
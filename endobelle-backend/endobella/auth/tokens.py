@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken as BaseRefreshToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+from endobella.auth.revocation import revocations
+
+
+class RefreshToken(BaseRefreshToken):
+    """Refresh token checked against ``endobella.auth.revocation``."""
+
+    def verify(self, *args, **kwargs):
+        super().verify(*args, **kwargs)
+        if revocations.is_revoked(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_("Token is revoked"))
+
+    def revoke(self):
+        revocations.revoke(
+            self.payload[api_settings.JTI_CLAIM],
+            datetime_from_epoch(self.payload["exp"]),
+        )
+
+    # Called by TokenRefreshSerializer with ROTATE_REFRESH_TOKENS and
+    # BLACKLIST_AFTER_ROTATION, in place of the token_blacklist app.
+    def blacklist(self):
+        self.revoke()
+
+    def outstand(self):
+        # Only revoked tokens are stored.
+        return None
@@ -5,7 +5,6 @@ from rest_framework.routers import DefaultRouter
 
 from endobella.auth import views
 
-
 router = DefaultRouter()
 router.register("users", views.UserViewSet, basename="user")
 
@@ -22,6 +21,7 @@ urlpatterns = [
         views.UserEmailLoginTokenObtainView.as_view(),
         name="auth-jwt-create-by-token",
     ),
+    path("jwt/logout/", views.TokenRevokeView.as_view(), name="auth-jwt-logout"),
     path("", include("djoser.urls.jwt")),
     *router.urls,
 ]
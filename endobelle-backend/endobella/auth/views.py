@@ -9,7 +9,7 @@ from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
 from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
-from rest_framework_simplejwt.views import TokenObtainPairView
+from rest_framework_simplejwt.views import TokenObtainPairView, TokenViewBase
 
 
 from endobella.auth.models import User
@@ -17,6 +17,7 @@ from endobella.auth.serializers import (
     ActivateSerializer,
     EmailLoginTokenObtainSerializer,
     ResendActivationSerializer,
+    TokenRevokeSerializer,
     UserCreateSerializer,
     UserEmailLoginSerializer,
     UserSerializer,
@@ -198,3 +199,9 @@ class UserEmailLoginTokenObtainView(TokenObtainPairView):
         }
 
         return Response(response_data, status=status.HTTP_200_OK)
+
+
+class TokenRevokeView(TokenViewBase):
+    """Revoke a refresh token, e.g. on logout."""
+
+    serializer_class = TokenRevokeSerializer
@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+from django.apps import AppConfig
+
+
+class BenchmarksConfig(AppConfig):
+    name = "endobella.benchmarks"
+    verbose_name = "Benchmarks"
@@ -0,0 +1,246 @@
+"""
+Bulk data generators for benchmark databases.
+
+Everything is inserted with ``bulk_create`` in batches and a seeded RNG, so
+the same arguments always produce the same data set.
+"""
+
+from __future__ import annotations
+
+import random
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.utils import timezone
+from taggit.models import Tag as ArticleTag
+
+from endobella.articles.models import Article, UUIDTaggedItem
+from endobella.auth.models import User
+from endobella.faq import index as faq_index
+from endobella.shop.facts import rebuild_product_facts
+from endobella.shop.models import (
+    Category,
+    Product,
+    ProductImage,
+    ProductVariant,
+    Review,
+    Tag,
+)
+from endobella.shop.search import refresh_documents
+
+BENCHMARK_PASSWORD = "benchmark-password"
+BENCHMARK_EMAIL = "bench-user-{}@example.com"
+
+WORDS = (  # noqa: SIM905 (a word list reads better as one string)
+    "endometriosis pain cycle hormone diet inflammation sleep stress doctor "
+    "diagnosis therapy fatigue nutrition exercise recovery symptom body "
+    "health wellbeing balance support energy routine magnesium omega yoga "
+    "breathing clinic research study treatment period relief gentle daily "
+    "guide habit vitamin fiber iron mood focus comfort care"
+).split()
+SIZES = ("XS", "S", "M", "L", "XL")
+COLORS = ("black", "white", "rose", "sage", "sand", "navy")
+
+
+def _sentence(rng, low=8, high=18):
+    words = rng.choices(WORDS, k=rng.randint(low, high))
+    return " ".join(words).capitalize() + "."
+
+
+def _paragraph(rng, sentences=5):
+    return " ".join(_sentence(rng) for _ in range(sentences))
+
+
+def article_content(rng, sections=6):
+    """CKEditor-like HTML, roughly 5-10 KB per article."""
+    parts = []
+    for _ in range(sections):
+        parts.append(f"<h2>{_sentence(rng, 3, 6)[:-1]}</h2>")
+        for _ in range(rng.randint(2, 3)):
+            parts.append(f"<p>{_paragraph(rng, rng.randint(4, 7))}</p>")
+        if rng.random() < 0.4:
+            items = "".join(f"<li>{_sentence(rng, 4, 8)}</li>" for _ in range(4))
+            parts.append(f"<ul>{items}</ul>")
+    return "".join(parts)
+
+
+def _batched(iterable, size):
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def create_users(count, batch_size=2000, start=0):
+    password = make_password(BENCHMARK_PASSWORD)
+    users = (
+        User(
+            email=BENCHMARK_EMAIL.format(i),
+            first_name=f"Bench{i}",
+            last_name="User",
+            password=password,
+        )
+        for i in range(start, start + count)
+    )
+    created = []
+    for batch in _batched(users, batch_size):
+        with transaction.atomic():
+            created.extend(User.objects.bulk_create(batch))
+    return created
+
+
+def create_article_tags(count=200):
+    ArticleTag.objects.bulk_create(
+        [ArticleTag(name=f"topic {i}", slug=f"topic-{i}") for i in range(count)],
+        ignore_conflicts=True,
+    )
+    return list(ArticleTag.objects.filter(slug__startswith="topic-"))
+
+
+def create_articles(count, authors=(), batch_size=1000, seed=0, start=0):
+    rng = random.Random(seed)
+    tags = list(ArticleTag.objects.all()) or create_article_tags()
+    content_type = ContentType.objects.get_for_model(Article)
+    authors = list(authors)
+    now = timezone.now()
+
+    def _articles():
+        for i in range(start, start + count):
+            yield Article(
+                title=f"{_sentence(rng, 4, 9)[:-1]} {i}",
+                slug=f"bench-article-{i}",
+                author=rng.choice(authors) if authors else None,
+                category=rng.choice(Article.Category.values),
+                article_type=rng.choice(Article.Type.values),
+                featured_image=f"uploads/bench-{i % 50}.jpg",
+                excerpt=_sentence(rng, 20, 35)[:300],
+                content=article_content(rng),
+                is_featured=rng.random() < 0.05,
+                is_published=rng.random() < 0.9,
+                publish_date=now - timedelta(minutes=rng.randint(0, 525_600)),
+                key_questions_answered="\n".join(
+                    _sentence(rng, 5, 9)[:-1] + "?" for _ in range(3)
+                ),
+            )
+
+    created = []
+    for batch in _batched(_articles(), batch_size):
+        with transaction.atomic():
+            batch = Article.objects.bulk_create(batch)
+            UUIDTaggedItem.objects.bulk_create(
+                [
+                    UUIDTaggedItem(
+                        content_type=content_type, object_id=article.pk, tag=tag
+                    )
+                    for article in batch
+                    for tag in rng.sample(tags, rng.randint(2, 6))
+                ]
+            )
+            faq_index.rebuild(articles=batch)
+        created.extend(batch)
+    return created
+
+
+def create_products(count, reviewers=(), batch_size=500, seed=0, start=0):
+    """Products with 1-6 variants, 1-4 images and up to 5 reviews each."""
+    rng = random.Random(seed)
+    categories = list(Category.objects.all()) or Category.objects.bulk_create(
+        [Category(name=f"Category {i}", slug=f"category-{i}") for i in range(20)]
+    )
+    tags = list(Tag.objects.all()) or Tag.objects.bulk_create(
+        [Tag(name=f"Tag {i}", slug=f"tag-{i}") for i in range(50)]
+    )
+    reviewers = list(reviewers)
+    product_tags = Product.tags.through
+
+    def _products():
+        for i in range(start, start + count):
+            yield Product(
+                name=f"{_sentence(rng, 2, 4)[:-1]} {i}",
+                slug=f"bench-product-{i}",
+                short_description=_sentence(rng, 10, 20),
+                long_description=_paragraph(rng, 8),
+                category=rng.choice(categories),
+                is_available=rng.random() < 0.95,
+                gaio_key_features=[
+                    {"feature": _sentence(rng, 2, 4), "benefit": _sentence(rng, 4, 8)}
+                    for _ in range(3)
+                ],
+                gaio_structured_facts={
+                    "Material": rng.choice(["Organic Cotton", "Bamboo", "Linen"]),
+                    "Origin": rng.choice(["PL", "DE", "PT"]),
+                },
+                gaio_faq_data=[
+                    {"q": _sentence(rng, 5, 9)[:-1] + "?", "a": _sentence(rng)}
+                    for _ in range(2)
+                ],
+            )
+
+    created = []
+    for batch in _batched(_products(), batch_size):
+        variants, images, reviews, links = [], [], [], []
+        with transaction.atomic():
+            batch = Product.objects.bulk_create(batch)
+            for product in batch:
+                combinations = rng.sample(
+                    [(size, color) for size in SIZES for color in COLORS],
+                    rng.randint(1, 6),
+                )
+                for n, (size, color) in enumerate(combinations):
+                    price = Decimal(rng.randint(1_000, 40_000)) / 100
+                    variants.append(
+                        ProductVariant(
+                            product=product,
+                            sku=f"{product.slug}-{size}-{color}".upper(),
+                            price=price,
+                            discount_price=(
+                                (price * Decimal("0.8")).quantize(Decimal("0.01"))
+                                if rng.random() < 0.2
+                                else None
+                            ),
+                            stock_quantity=rng.randint(0, 200),
+                            size=size,
+                            color=color,
+                            is_default=n == 0,
+                        )
+                    )
+                images.extend(
+                    ProductImage(
+                        product=product,
+                        image=f"products/bench-{rng.randint(0, 99)}.jpg",
+                        alt_text=product.name,
+                    )
+                    for _ in range(rng.randint(1, 4))
+                )
+                if reviewers:
+                    reviews.extend(
+                        Review(
+                            product=product,
+                            user=user,
+                            rating=rng.randint(1, 5),
+                            comment=_sentence(rng),
+                        )
+                        for user in rng.sample(
+                            reviewers, min(len(reviewers), rng.randint(0, 5))
+                        )
+                    )
+                links.extend(
+                    product_tags(product_id=product.pk, tag_id=tag.pk)
+                    for tag in rng.sample(tags, rng.randint(1, 4))
+                )
+            ProductVariant.objects.bulk_create(variants)
+            rebuild_product_facts(batch)
+            faq_index.rebuild(products=batch)
+            ProductImage.objects.bulk_create(images)
+            Review.objects.bulk_create(reviews)
+            product_tags.objects.bulk_create(links)
+            refresh_documents(product.pk for product in batch)
+        created.extend(batch)
+    return created
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandError
+
+from endobella.benchmarks.runner import (
+    compare,
+    load_baseline,
+    run_scenario,
+    save_baseline,
+)
+from endobella.benchmarks.scenarios import SCENARIOS, get_scenarios
+
+
+class Command(BaseCommand):
+    help = "Run API benchmark scenarios against the configured database."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "scenarios", nargs="*", help="Scenario names (default: all)."
+        )
+        parser.add_argument(
+            "-k", dest="pattern", help="Only scenarios containing this."
+        )
+        parser.add_argument("--iterations", type=int, default=100)
+        parser.add_argument("--warmup", type=int, default=5)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--list", action="store_true", help="List scenarios.")
+        parser.add_argument("--save-baseline", metavar="PATH")
+        parser.add_argument("--compare", metavar="PATH")
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=0.1,
+            help="Allowed relative regression before --compare fails (default 0.1).",
+        )
+
+    def handle(self, *args, **options):
+        if options["list"]:
+            for scenario in SCENARIOS.values():
+                self.stdout.write(f"{scenario.name:36} {scenario.description}")
+            return
+
+        try:
+            scenarios = get_scenarios(options["scenarios"], options["pattern"])
+        except KeyError as e:
+            raise CommandError(f"Unknown scenario: {e.args[0]}") from e
+
+        results = []
+        self.stdout.write(
+            f"{'scenario':36} {'req/s':>9} {'p50':>8} {'p95':>8} {'p99':>8} "
+            f"{'queries':>8} {'errors':>6}"
+        )
+        for scenario in scenarios:
+            result = run_scenario(
+                scenario, options["iterations"], options["warmup"], options["seed"]
+            )
+            results.append(result)
+            self.stdout.write(
+                f"{result.scenario:36} {result.throughput:9.1f} "
+                f"{result.p50_ms:8.2f} {result.p95_ms:8.2f} {result.p99_ms:8.2f} "
+                f"{result.queries_per_request:8.1f} {result.errors:6d}"
+            )
+
+        if options["save_baseline"]:
+            save_baseline(options["save_baseline"], results)
+            self.stdout.write(f"Baseline saved to {options['save_baseline']}")
+
+        if options["compare"]:
+            rows, regressed = compare(
+                results, load_baseline(options["compare"]), options["tolerance"]
+            )
+            self.stdout.write("")
+            for scenario, metric, before, after, change in rows:
+                self.stdout.write(
+                    f"{scenario:36} {metric:20} {before:10.2f} -> {after:10.2f} "
+                    f"({change:+.1%})"
+                )
+            if regressed:
+                raise CommandError(
+                    f"Regression beyond {options['tolerance']:.0%} against baseline."
+                )
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+
+from endobella.articles.models import Article
+from endobella.articles.serializers import ArticleSerializer
+from endobella.benchmarks.runner import percentile
+from endobella.common.renderers import FastJSONRenderer
+from endobella.shop.serializers import ProductSerializer
+from endobella.shop.views import ProductViewSet
+
+
+class Command(BaseCommand):
+    help = "Time JSON rendering of one 50-item article and product page."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=200)
+        parser.add_argument("--page-size", type=int, default=50)
+
+    def handle(self, *args, **options):
+        size = options["page_size"]
+        pages = {
+            "articles": ArticleSerializer(Article.objects.all()[:size], many=True).data,
+            "products": ProductSerializer(
+                ProductViewSet.queryset[:size], many=True
+            ).data,
+        }
+        if not all(pages.values()):
+            raise CommandError("Seed data first (manage.py seed_benchmark_data).")
+
+        for page, data in pages.items():
+            for renderer in (JSONRenderer(), FastJSONRenderer()):
+                durations = []
+                for _ in range(options["iterations"]):
+                    start = time.perf_counter()
+                    body = renderer.render({"results": data})
+                    durations.append(time.perf_counter() - start)
+                durations.sort()
+                self.stdout.write(
+                    f"{page:9} {type(renderer).__name__:17} "
+                    f"p50={percentile(durations, 50) * 1000:7.3f}ms "
+                    f"p95={percentile(durations, 95) * 1000:7.3f}ms "
+                    f"size={len(body) / 1024:7.1f}KiB"
+                )
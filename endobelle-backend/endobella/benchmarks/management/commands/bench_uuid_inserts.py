@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import time
+from uuid import uuid4
+
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError, connection, transaction
+
+from endobella.common.ids import uuid7
+
+GENERATORS = {"uuid4": uuid4, "uuid7": uuid7}
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare insert throughput and primary key index size for random (uuid4) "
+        "and time-ordered (uuid7) keys in throwaway tables."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1_000_000)
+        parser.add_argument("--batch-size", type=int, default=10_000)
+        parser.add_argument("--report-every", type=int, default=250_000)
+
+    def handle(self, *args, **options):
+        for name, generate in GENERATORS.items():
+            table = f"bench_pk_{name}"
+            self._create_table(table)
+            try:
+                self._run(table, name, generate, options)
+            finally:
+                with connection.cursor() as cursor:
+                    cursor.execute(f"DROP TABLE {connection.ops.quote_name(table)}")
+
+    def _create_table(self, table):
+        uuid_type = "uuid" if connection.vendor == "postgresql" else "char(32)"
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {connection.ops.quote_name(table)}")
+            cursor.execute(
+                f"CREATE TABLE {connection.ops.quote_name(table)} "
+                f"(id {uuid_type} PRIMARY KEY, payload varchar(64) NOT NULL)"
+            )
+
+    def _run(self, table, name, generate, options):
+        adapt = (
+            (lambda value: value)
+            if connection.vendor == "postgresql"
+            else (lambda value: value.hex)
+        )
+        sql = f"INSERT INTO {connection.ops.quote_name(table)} (id, payload) VALUES (%s, %s)"
+        inserted = 0
+        elapsed = 0.0
+        next_report = options["report_every"]
+        while inserted < options["rows"]:
+            size = min(options["batch_size"], options["rows"] - inserted)
+            rows = [(adapt(generate()), "x" * 32) for _ in range(size)]
+            start = time.perf_counter()
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.executemany(sql, rows)
+            elapsed += time.perf_counter() - start
+            inserted += size
+            if inserted >= next_report or inserted == options["rows"]:
+                next_report += options["report_every"]
+                index_size = self._index_size(table)
+                self.stdout.write(
+                    f"{name:6} rows={inserted:>10} rows/s={inserted / elapsed:10.0f} "
+                    f"pk_index={index_size / 1_048_576 if index_size else 0:8.1f} MiB"
+                )
+
+    def _index_size(self, table):
+        with connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                cursor.execute("SELECT pg_relation_size(%s)", [f"{table}_pkey"])
+                return cursor.fetchone()[0]
+            if connection.vendor == "sqlite":
+                try:
+                    cursor.execute(
+                        "SELECT SUM(pgsize) FROM dbstat WHERE name = %s",
+                        [f"sqlite_autoindex_{table}_1"],
+                    )
+                except DatabaseError:  # dbstat is a compile-time option
+                    return None
+                return cursor.fetchone()[0]
+        return None
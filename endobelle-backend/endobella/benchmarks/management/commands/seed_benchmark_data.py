@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from endobella.auth.models import User
+from endobella.benchmarks import factories
+
+
+class Command(BaseCommand):
+    help = "Fill the configured database with benchmark-sized data."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=100_000)
+        parser.add_argument("--articles", type=int, default=100_000)
+        parser.add_argument("--products", type=int, default=10_000)
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        existing = User.objects.filter(email__startswith="bench-user-").count()
+        users = self._step(
+            "users",
+            factories.create_users,
+            max(options["users"] - existing, 0),
+            start=existing,
+        )
+        authors = users[:500] or list(
+            User.objects.filter(email__startswith="bench-user-")[:500]
+        )
+        self._step(
+            "articles",
+            factories.create_articles,
+            options["articles"],
+            authors=authors,
+            seed=options["seed"],
+        )
+        self._step(
+            "products",
+            factories.create_products,
+            options["products"],
+            reviewers=authors,
+            seed=options["seed"],
+        )
+
+    def _step(self, label, factory, count, **kwargs):
+        if not count:
+            return []
+        start = time.perf_counter()
+        created = factory(count, **kwargs)
+        elapsed = time.perf_counter() - start
+        self.stdout.write(
+            f"Created {len(created)} {label} in {elapsed:.1f}s "
+            f"({len(created) / elapsed:.0f}/s)"
+        )
+        return created
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import json
+import platform
+import time
+from dataclasses import asdict, dataclass
+
+from django.db import connection
+from django.test import Client
+from django.utils import timezone
+
+from endobella.benchmarks.scenarios import make_rng
+from endobella.common.queries import record_queries
+
+
+def percentile(values, pct):
+    """Linear-interpolated percentile of an already sorted list."""
+    if not values:
+        return 0.0
+    k = (len(values) - 1) * pct / 100
+    lower = int(k)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (k - lower)
+
+
+@dataclass
+class Result:
+    scenario: str
+    iterations: int
+    errors: int
+    throughput: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+    queries_per_request: float
+
+    @classmethod
+    def from_samples(cls, scenario, durations, queries, errors, elapsed):
+        durations = sorted(durations)
+        iterations = len(durations)
+        return cls(
+            scenario=scenario,
+            iterations=iterations,
+            errors=errors,
+            throughput=iterations / elapsed if elapsed else 0.0,
+            p50_ms=percentile(durations, 50) * 1000,
+            p95_ms=percentile(durations, 95) * 1000,
+            p99_ms=percentile(durations, 99) * 1000,
+            mean_ms=sum(durations) / iterations * 1000 if iterations else 0.0,
+            queries_per_request=queries / iterations if iterations else 0.0,
+        )
+
+
+def run_scenario(scenario, iterations=100, warmup=5, seed=0):
+    """Run a scenario in-process and return its latency and query statistics."""
+    client = Client()
+    rng = make_rng(seed)
+    sample = scenario.setup()
+
+    for _ in range(warmup):
+        scenario.request(client, sample, rng)
+
+    durations = []
+    errors = 0
+    with record_queries(capture_stack=False) as report:
+        started = time.perf_counter()
+        for _ in range(iterations):
+            start = time.perf_counter()
+            response = scenario.request(client, sample, rng)
+            durations.append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                errors += 1
+        elapsed = time.perf_counter() - started
+    return Result.from_samples(scenario.name, durations, len(report), errors, elapsed)
+
+
+def environment():
+    return {
+        "created_at": timezone.now().isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "database": connection.vendor,
+    }
+
+
+def save_baseline(path, results):
+    with open(path, "w") as f:
+        json.dump(
+            {
+                "environment": environment(),
+                "results": {result.scenario: asdict(result) for result in results},
+            },
+            f,
+            indent=2,
+        )
+
+
+def load_baseline(path):
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def compare(results, baseline, tolerance=0.1):
+    """
+    Compare results with a saved baseline.
+
+    Returns rows of ``(scenario, metric, baseline, current, change)`` and
+    whether any metric regressed by more than ``tolerance`` (a fraction).
+    """
+    rows = []
+    regressed = False
+    for result in results:
+        previous = baseline.get(result.scenario)
+        if previous is None:
+            continue
+        for metric, higher_is_better in (
+            ("throughput", True),
+            ("p50_ms", False),
+            ("p95_ms", False),
+            ("p99_ms", False),
+            ("queries_per_request", False),
+        ):
+            before, after = previous[metric], getattr(result, metric)
+            change = (after - before) / before if before else 0.0
+            worse = -change if higher_is_better else change
+            if metric == "queries_per_request":
+                worse = 1.0 if after > before else 0.0
+            if worse > tolerance:
+                regressed = True
+            rows.append((result.scenario, metric, before, after, change))
+    return rows, regressed
@@ -0,0 +1,188 @@
+"""
+Benchmark scenarios for the API hot paths.
+
+A scenario is a callable that receives a ``django.test.Client`` and issues a
+single request. ``setup`` runs once before timing starts and returns the
+sample data (slugs, ids, credentials) the scenario picks from.
+"""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from django.urls import reverse
+
+from endobella.articles.models import Article
+from endobella.articles.views import ArticleFilterSet, ArticleViewSet
+from endobella.benchmarks.factories import BENCHMARK_EMAIL, BENCHMARK_PASSWORD
+from endobella.shop import search
+from endobella.shop.models import Product
+
+
+@dataclass
+class Scenario:
+    name: str
+    request: Callable
+    setup: Callable = field(default=lambda: None)
+    description: str = ""
+
+
+SCENARIOS: dict[str, Scenario] = {}
+
+
+def register(name, setup=None, description=""):
+    def decorator(func):
+        SCENARIOS[name] = Scenario(
+            name=name,
+            request=func,
+            setup=setup or (lambda: None),
+            description=description or (func.__doc__ or "").strip(),
+        )
+        return func
+
+    return decorator
+
+
+def _published_sample(size=200):
+    return list(
+        Article.objects.filter(is_published=True)
+        .order_by("?")
+        .values(*ArticleFilterSet.Meta.fields)[:size]
+    )
+
+
+@register("article-list")
+def article_list(client, sample, rng):
+    """First page of the article list."""
+    return client.get(reverse("article-list"))
+
+
+@register("article-list-offset")
+def article_list_offset(client, sample, rng):
+    """Deep pagination into the article list."""
+    return client.get(reverse("article-list"), {"offset": rng.randint(0, 5000)})
+
+
+@register("article-search")
+def article_search(client, sample, rng):
+    """``?search=`` over title, excerpt and content."""
+    return client.get(
+        reverse("article-list"), {"search": rng.choice(["diet", "sleep", "yoga"])}
+    )
+
+
+@register("article-detail", setup=_published_sample)
+def article_detail(client, sample, rng):
+    """Retrieve a random published article by slug."""
+    slug = rng.choice(sample)["slug"]
+    return client.get(reverse("article-detail", kwargs={"slug": slug}))
+
+
+def _filter_scenario(filter_name):
+    def _request(client, sample, rng):
+        value = rng.choice(sample)[filter_name]
+        if isinstance(value, bool):
+            value = str(value).lower()
+        elif hasattr(value, "isoformat"):
+            value = value.isoformat()
+        return client.get(
+            reverse("article-list"), {filter_name: "" if value is None else value}
+        )
+
+    return _request
+
+
+for _filter_name in ArticleFilterSet.Meta.fields:
+    register(
+        f"article-filter-{_filter_name}",
+        setup=_published_sample,
+        description=f"Article list filtered by ``{_filter_name}``.",
+    )(_filter_scenario(_filter_name))
+
+
+def _ordering_scenario(ordering):
+    def _request(client, sample, rng):
+        return client.get(reverse("article-list"), {"ordering": ordering})
+
+    return _request
+
+
+for _ordering in ArticleViewSet.ordering_fields:
+    for _direction in ("", "-"):
+        register(
+            f"article-ordering-{_direction}{_ordering}",
+            description=f"Article list ordered by ``{_direction}{_ordering}``.",
+        )(_ordering_scenario(f"{_direction}{_ordering}"))
+
+
+@register("product-list")
+def product_list(client, sample, rng):
+    """First page of the catalog with variants, images and tags."""
+    return client.get(reverse("product-list"))
+
+
+@register(
+    "product-detail",
+    setup=lambda: list(
+        Product.objects.filter(is_available=True).values_list("slug", flat=True)[:200]
+    ),
+)
+def product_detail(client, sample, rng):
+    """Retrieve a random available product."""
+    return client.get(reverse("product-detail", kwargs={"slug": rng.choice(sample)}))
+
+
+def _misspell(word, rng):
+    if len(word) < 4:
+        return word
+    i = rng.randrange(1, len(word) - 1)
+    if rng.random() < 0.5:
+        return word[:i] + word[i + 1 :]
+    return word[:i] + word[i + 1] + word[i] + word[i + 2 :]
+
+
+def _product_queries(size=200):
+    rng = random.Random(0)
+    names = Product.objects.filter(is_available=True).values_list("name", flat=True)
+    queries = []
+    for name in names[:size]:
+        words = name.split()[:2]
+        queries.append(" ".join(words))
+        queries.append(" ".join(_misspell(word, rng) for word in words))
+    # Build the in-memory index off PostgreSQL, so that it is not timed.
+    search.search("warm up")
+    return queries
+
+
+@register("product-search", setup=_product_queries)
+def product_search(client, sample, rng):
+    """Typo-tolerant product search; half of the queries are misspelled."""
+    return client.get(reverse("product-search"), {"q": rng.choice(sample)})
+
+
+@register("jwt-login", setup=lambda: [BENCHMARK_EMAIL.format(i) for i in range(50)])
+def jwt_login(client, sample, rng):
+    """Obtain a JWT pair with email and password (includes password hashing)."""
+    return client.post(
+        reverse("auth-jwt-create"),
+        {"email": rng.choice(sample), "password": BENCHMARK_PASSWORD},
+        content_type="application/json",
+    )
+
+
+def get_scenarios(names=None, pattern=None):
+    scenarios = list(SCENARIOS.values())
+    if names:
+        unknown = set(names) - SCENARIOS.keys()
+        if unknown:
+            raise KeyError(", ".join(sorted(unknown)))
+        scenarios = [SCENARIOS[name] for name in names]
+    if pattern:
+        scenarios = [scenario for scenario in scenarios if pattern in scenario.name]
+    return scenarios
+
+
+def make_rng(seed=0):
+    return random.Random(seed)
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import json
+from uuid import UUID
+
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q, UUIDField
+from django.utils.functional import cached_property
+
+
+def estimated_count(queryset):
+    """
+    Planner row estimate for ``queryset`` on PostgreSQL, ``None`` elsewhere.
+
+    Unfiltered tables use ``pg_class.reltuples``; filtered querysets use the
+    row estimate of the top plan node from ``EXPLAIN``.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    with connection.cursor() as cursor:
+        if not queryset.query.where:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s)",
+                [connection.ops.quote_name(queryset.model._meta.db_table)],
+            )
+            row = cursor.fetchone()
+            if row is None or row[0] < 0:
+                return None
+            return row[0]
+        sql, params = queryset.values("pk").query.sql_with_params()
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that trusts the planner's estimate for large result sets.
+
+    Exact ``COUNT(*)`` is only run when the estimate is below
+    ``ADMIN_ESTIMATED_COUNT_THRESHOLD``, where counting is cheap anyway.
+    """
+
+    @cached_property
+    def count(self):
+        threshold = getattr(settings, "ADMIN_ESTIMATED_COUNT_THRESHOLD", 10_000)
+        estimate = estimated_count(self.object_list)
+        if estimate is not None and estimate >= threshold:
+            return estimate
+        return super().count
+
+
+class PerformanceAdminMixin:
+    """
+    Changelist settings for tables too large for the admin defaults.
+
+    ``prefix_search`` lists ``(field, normalize)`` pairs searched with a
+    case-sensitive ``startswith`` on the normalized term, so B-tree indexes
+    (``varchar_pattern_ops`` on PostgreSQL) can serve the lookup. A term that
+    parses as a UUID is matched against the primary key exactly.
+    ``contains_search`` lists fields matched with ``icontains``, for words
+    inside a value; give them a trigram index on PostgreSQL.
+    ``changelist_defer`` names columns that are never shown in the list.
+    """
+
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
+    prefix_search = ()
+    contains_search = ()
+    changelist_defer = ()
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        match = request.resolver_match
+        if self.changelist_defer and match and match.url_name.endswith("changelist"):
+            queryset = queryset.defer(*self.changelist_defer)
+        return queryset
+
+    def get_search_results(self, request, queryset, search_term):
+        term = search_term.strip()
+        if not term or not (self.prefix_search or self.contains_search):
+            return super().get_search_results(request, queryset, search_term)
+
+        if isinstance(self.model._meta.pk, UUIDField):
+            try:
+                return queryset.filter(pk=UUID(term)), False
+            except ValueError:
+                pass
+
+        condition = Q()
+        for field_name, normalize in self.prefix_search:
+            condition |= Q(**{f"{field_name}__startswith": normalize(term)})
+        for field_name in self.contains_search:
+            condition |= Q(**{f"{field_name}__icontains": term})
+        return queryset.filter(condition), False
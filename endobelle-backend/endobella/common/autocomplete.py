@@ -0,0 +1,339 @@
+"""
+Typeahead over article titles, product names, categories and tags.
+
+Each process keeps one ``PrefixIndex`` per kind: the normalized labels
+from every word start onwards, sorted, so the labels matching a prefix
+(``"cotton t"`` matches "Organic Cotton Tee") are one ``bisect`` range.
+Prefixes matching more than ``DENSE_RANGE`` keys would be too slow to
+rank per request, so their best results are computed when the index is
+built. An empty prefix matches nothing. Results are ranked by popularity
+(view score for articles and products, number of items for categories and
+tags) or by recency.
+
+The indexes are a ``RefreshedIndex``: rows updated since the last look are
+read with one indexed ``updated_at`` query per kind and applied in memory.
+Article tags have no timestamp and are caught up by id. Full rebuilds drop
+deleted rows, renamed article tags and stale popularity and counts.
+"""
+
+from __future__ import annotations
+
+import copy
+import sys
+from bisect import bisect_left, bisect_right
+from heapq import nsmallest
+from typing import NamedTuple
+
+from django.conf import settings
+from django.db.models import Count
+from taggit.models import Tag as ArticleTag
+
+from endobella.articles.models import Article
+from endobella.common.indexes import RefreshedIndex
+from endobella.common.text import normalize
+from endobella.shop.models import Category, Product, Tag
+
+MAX_KEY_LENGTH = 64
+# Prefixes matching more keys than this have their results precomputed, so
+# a request never ranks more than this many keys.
+DENSE_RANGE = 256
+ORDERS = ("popular", "recent")
+
+
+class Entry(NamedTuple):
+    label: str
+    slug: str
+    popularity: float
+    recency: float
+
+
+def _keys(label):
+    words = normalize(label).split()
+    return {" ".join(words[start:])[:MAX_KEY_LENGTH] for start in range(len(words))}
+
+
+def _order_key(entry, order):
+    score = entry.popularity if order == "popular" else entry.recency
+    return -score, entry.label
+
+
+class PrefixIndex:
+    """
+    Sorted label keys of one kind; not changed once built.
+
+    Entries are numbered (``slots``) so that ranking hashes small ints and
+    sorts on precomputed keys instead of hashing primary keys.
+    """
+
+    def __init__(self, entries, top_size):
+        self.entries = entries
+        self.top_size = top_size
+        self._slots = {pk: slot for slot, pk in enumerate(entries)}
+        self._items = list(entries.values())
+        self._order_keys = {
+            order: [_order_key(entry, order) for entry in self._items]
+            for order in ORDERS
+        }
+        pairs = sorted(
+            (key, slot)
+            for slot, entry in enumerate(self._items)
+            for key in _keys(entry.label)
+        )
+        self.keys = [key for key, _ in pairs]
+        self.slots = [slot for _, slot in pairs]
+        self._top = {
+            (prefix, order): self._rank(prefix, order, top_size)
+            for prefix in self._dense_prefixes()
+            for order in ORDERS
+        }
+
+    def _range(self, prefix):
+        start = bisect_left(self.keys, prefix)
+        return start, bisect_left(self.keys, prefix + "\uffff", start)
+
+    def _dense_prefixes(self):
+        # Only extensions of a dense prefix can be dense themselves.
+        dense, level, length = [], {key[:1] for key in self.keys}, 1
+        while level:
+            extensions = set()
+            for prefix in level:
+                start, end = self._range(prefix)
+                if end - start > DENSE_RANGE:
+                    dense.append(prefix)
+                    extensions.update(
+                        key[: length + 1]
+                        for key in self.keys[start:end]
+                        if len(key) > length
+                    )
+            level, length = extensions, length + 1
+        return dense
+
+    def _rank(self, prefix, order, limit, candidates=None):
+        if candidates is None:
+            start, end = self._range(prefix)
+            candidates = set(self.slots[start:end])
+        return nsmallest(limit, candidates, key=self._order_keys[order].__getitem__)
+
+    def updated(self, changes):
+        """
+        A copy with ``changes`` (``{pk: entry}``, None to remove) applied.
+
+        Keys are removed and inserted by bisection. Precomputed results are
+        re-ranked only where a changed entry was among them, and otherwise
+        merged with the new entries. A large batch is re-sorted instead.
+        """
+        entries = {**self.entries, **changes}
+        for pk, entry in changes.items():
+            if entry is None:
+                del entries[pk]
+        if len(changes) * 10 > len(self.entries):
+            return PrefixIndex(entries, self.top_size)
+
+        index = copy.copy(self)
+        index.entries, index.keys, index.slots = (
+            entries,
+            list(self.keys),
+            list(self.slots),
+        )
+        index._slots, index._items = dict(self._slots), list(self._items)
+        index._order_keys = {
+            order: list(keys) for order, keys in self._order_keys.items()
+        }
+        index._top = dict(self._top)
+        touched, changed, added = set(), set(), {}
+        for pk, entry in changes.items():
+            old, slot = self.entries.get(pk), self._slots.get(pk)
+            for key in _keys(old.label) if old else ():
+                position = bisect_left(index.keys, key)
+                while index.slots[position] != slot:
+                    position += 1
+                del index.keys[position], index.slots[position]
+                touched.add(key)
+            if slot is not None:
+                changed.add(slot)
+            if entry is None:
+                if slot is not None:
+                    del index._slots[pk]
+                    index._items[slot] = None
+                continue
+            if slot is None:
+                slot = index._slots[pk] = len(index._items)
+                index._items.append(entry)
+                for order, keys in index._order_keys.items():
+                    keys.append(_order_key(entry, order))
+            else:
+                index._items[slot] = entry
+                for order, keys in index._order_keys.items():
+                    keys[slot] = _order_key(entry, order)
+            added[slot] = _keys(entry.label)
+            for key in added[slot]:
+                position = bisect_right(index.keys, key)
+                index.keys.insert(position, key)
+                index.slots.insert(position, slot)
+            touched.update(added[slot])
+
+        # Prefixes that become dense here are precomputed by the next rebuild.
+        affected = set()
+        for key in touched:
+            for length in range(1, len(key) + 1):
+                if (key[:length], ORDERS[0]) not in self._top:
+                    break
+                affected.add(key[:length])
+        for prefix in affected:
+            for order in ORDERS:
+                current = self._top[prefix, order]
+                candidates = None
+                if not changed.intersection(current):
+                    candidates = current + [
+                        slot
+                        for slot, keys in added.items()
+                        if any(key.startswith(prefix) for key in keys)
+                    ]
+                index._top[prefix, order] = index._rank(
+                    prefix, order, self.top_size, candidates
+                )
+        return index
+
+    def search(self, prefix, limit, order="popular"):
+        """Up to ``limit`` entries with a word starting with ``prefix``."""
+        prefix = prefix[:MAX_KEY_LENGTH]
+        if not prefix:
+            return []
+        slots = self._top.get((prefix, order))
+        if slots is None:
+            slots = self._rank(prefix, order, limit)
+        return [self._items[slot] for slot in slots[:limit]]
+
+    @property
+    def nbytes(self):
+        """Approximate size of the keys, labels and lookup tables."""
+        size = sum(
+            sys.getsizeof(container)
+            for container in (
+                self.entries,
+                self.keys,
+                self.slots,
+                self._slots,
+                self._items,
+                self._top,
+                *self._order_keys.values(),
+            )
+        )
+        size += sum(sys.getsizeof(key) for key in self.keys)
+        size += sum(sys.getsizeof(slots) for slots in self._top.values())
+        for keys in self._order_keys.values():
+            size += sum(sys.getsizeof(key) for key in keys)
+        for entry in self.entries.values():
+            size += sys.getsizeof(entry) + sys.getsizeof(entry.label)
+            size += sys.getsizeof(entry.slug)
+        return size
+
+
+def _recency(value):
+    return value.timestamp() if value else 0.0
+
+
+def _published(model, label_field, flag_field):
+    def load(since):
+        # Changed rows include hidden ones, which are removed from the index.
+        rows = model.objects.order_by()
+        if since:
+            rows = rows.filter(updated_at__gte=since)
+        else:
+            rows = rows.filter(**{flag_field: True})
+        for pk, label, slug, visible, popularity, created_at in rows.values_list(
+            "pk", label_field, "slug", flag_field, "popularity", "created_at"
+        ):
+            entry = Entry(label, slug, popularity, _recency(created_at))
+            yield pk, entry if visible and label else None
+
+    return load
+
+
+def _counted(model):
+    def load(since):
+        rows = model.objects.order_by()
+        if since:
+            rows = rows.filter(updated_at__gte=since)
+        for pk, name, slug, count, created_at in rows.annotate(
+            count=Count("products")
+        ).values_list("pk", "name", "slug", "count", "created_at"):
+            yield pk, Entry(name, slug, count, _recency(created_at)) if name else None
+
+    return load
+
+
+def _article_tags(after_id):
+    rows = ArticleTag.objects.order_by()
+    if after_id is not None:
+        rows = rows.filter(pk__gt=after_id)
+    for pk, name, slug, count in rows.annotate(
+        count=Count("articles_uuidtaggeditem_items")
+    ).values_list("pk", "name", "slug", "count"):
+        # No timestamp; ids grow with creation.
+        yield pk, Entry(name, slug, count, pk) if name else None
+
+
+SOURCES = {
+    "articles": _published(Article, "title", "is_published"),
+    "products": _published(Product, "name", "is_available"),
+    "categories": _counted(Category),
+    "product_tags": _counted(Tag),
+    "article_tags": _article_tags,
+}
+
+
+class Autocomplete(RefreshedIndex):
+    settings_prefix = "AUTOCOMPLETE"
+
+    def search(self, query, kinds=SOURCES, limit=None, order="popular"):
+        """``{kind: [{"label", "slug"}, ...]}`` for labels matching ``query``."""
+        prefix = normalize(query)
+        if not prefix:
+            return {kind: [] for kind in kinds}
+        indexes = self.current()
+        # The precomputed results hold this many entries.
+        max_results = settings.AUTOCOMPLETE_MAX_RESULTS
+        limit = min(limit or max_results, max_results)
+        return {
+            kind: [
+                {"label": entry.label, "slug": entry.slug}
+                for entry in indexes[kind].search(prefix, limit, order)
+            ]
+            for kind in kinds
+        }
+
+    def stats(self):
+        return {
+            kind: {
+                "entries": len(index.entries),
+                "keys": len(index.keys),
+                "bytes": index.nbytes,
+            }
+            for kind, index in self.current().items()
+        }
+
+    def _build(self):
+        return {
+            kind: PrefixIndex(
+                {pk: entry for pk, entry in load(None) if entry},
+                settings.AUTOCOMPLETE_MAX_RESULTS,
+            )
+            for kind, load in SOURCES.items()
+        }
+
+    def _catch_up(self, indexes, since):
+        indexes = dict(indexes)
+        for kind, load in SOURCES.items():
+            entries = indexes[kind].entries
+            if kind == "article_tags":
+                changes = list(load(max(entries, default=0)))
+            else:
+                changes = list(load(since))
+            changes = [(pk, entry) for pk, entry in changes if entries.get(pk) != entry]
+            if changes:
+                indexes[kind] = indexes[kind].updated(dict(changes))
+        return indexes
+
+
+autocomplete = Autocomplete()
@@ -0,0 +1,105 @@
+"""
+Payload of the ``/api/bootstrap/`` endpoint.
+
+Everything the frontend shell needs on every page (header menu, homepage
+featured and latest articles, tag cloud) is assembled here in a fixed
+number of queries and cached under a version derived from the content, so a
+new version is built only after something changed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.db.models import Count, Max
+from taggit.models import Tag as ArticleTag
+
+from endobella.articles.models import Article
+from endobella.articles.serializers import ArticleCardSerializer
+from endobella.shop.models import Category
+
+
+def bootstrap_version():
+    """
+    Content version for caching and ETags, from two aggregate queries.
+
+    The latest ``updated_at`` catches edits, publishing and retagging through
+    the admin (which saves the article); the row count catches deletions.
+    """
+    parts = []
+    for model in (Article, Category):
+        stats = model.objects.aggregate(updated=Max("updated_at"), count=Count("pk"))
+        updated = stats["updated"]
+        parts.append(f"{updated.isoformat() if updated else '-'}:{stats['count']}")
+    return hashlib.md5("|".join(parts).encode()).hexdigest()
+
+
+def _cards(queryset, request):
+    queryset = queryset.only(*ArticleCardSerializer.Meta.fields)
+    return ArticleCardSerializer(queryset, many=True, context={"request": request}).data
+
+
+def build_bootstrap(request):
+    """
+    Build the payload with five queries, or seven on backends that cannot
+    ``UNION`` sliced querysets (SQLite), where each category is one query.
+    """
+    published = Article.objects.filter(is_published=True)
+
+    featured = _cards(
+        published.filter(is_featured=True).order_by("-created_at")[
+            : settings.BOOTSTRAP_FEATURED_COUNT
+        ],
+        request,
+    )
+
+    # One LIMIT per category walks article_pub_category_idx; a window
+    # function over the partition would rank every published article.
+    per_category = [
+        published.filter(category=value).order_by("-created_at")[
+            : settings.BOOTSTRAP_LATEST_PER_CATEGORY
+        ]
+        for value in Article.Category.values
+    ]
+    if connection.features.supports_slicing_ordering_in_compound:
+        per_category = [per_category[0].union(*per_category[1:], all=True)]
+    latest = {value: [] for value in Article.Category.values}
+    for queryset in per_category:
+        for card in _cards(queryset, request):
+            latest[card["category"]].append(card)
+
+    counts = dict(
+        published.order_by()
+        .values("category")
+        .annotate(count=Count("pk"))
+        .values_list("category", "count")
+    )
+
+    content_type = ContentType.objects.get_for_model(Article)
+    tags = (
+        ArticleTag.objects.filter(
+            articles_uuidtaggeditem_items__content_type=content_type,
+            articles_uuidtaggeditem_items__object_id__in=published.values("pk"),
+        )
+        .annotate(count=Count("articles_uuidtaggeditem_items"))
+        .order_by("-count", "name")
+        .values("name", "slug", "count")[: settings.BOOTSTRAP_TAG_CLOUD_SIZE]
+    )
+
+    shop_categories = Category.objects.filter(parent__isnull=True).values(
+        "name", "slug"
+    )
+
+    return {
+        "featured": featured,
+        "latest": latest,
+        "categories": [
+            {"value": value, "label": str(label), "count": counts.get(value, 0)}
+            for value, label in Article.Category.choices
+        ],
+        "tags": list(tags),
+        "shop_categories": list(shop_categories),
+    }
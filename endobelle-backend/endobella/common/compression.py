@@ -0,0 +1,220 @@
+"""
+Response compression with Brotli/gzip negotiation.
+
+Brotli is used when the client accepts it, gzip otherwise. Compressed
+bodies of regular responses are kept in the cache under a digest of the
+uncompressed body, so a repeated response (the same article, the same list
+page) is hashed but not compressed again. Streaming responses are
+compressed chunk by chunk and never cached.
+
+Only reads on the public JSON routes of ``LEAN_ROUTE_PREFIXES`` are
+compressed. Admin pages and auth responses carry CSRF tokens and JWTs next
+to echoed input, which compression would expose to BREACH (recovering a
+secret from the compressed size).
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import zlib
+
+import brotli
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import MiddlewareNotUsed
+from django.utils.cache import patch_vary_headers
+
+from endobella.common.metrics import timed
+from endobella.common.middleware import is_lean_request
+
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "application/rss+xml",
+    "image/svg+xml",
+)
+
+
+# Supported content codings in order of preference.
+ENCODINGS = ("br", "gzip")
+
+
+def parse_accept_encoding(header):
+    """Map each coding in an ``Accept-Encoding`` header to its q-value."""
+    codings = {}
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        codings[coding] = quality
+    return codings
+
+
+def negotiate(header, encodings=None):
+    """
+    Pick the best coding from ``encodings`` for an ``Accept-Encoding`` header.
+
+    The client's q-values win; ties go to the first entry of ``encodings``.
+    Returns ``None`` when nothing acceptable is supported.
+    """
+    if not header:
+        return None
+    accepted = parse_accept_encoding(header)
+    wildcard = accepted.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for encoding in encodings or ENCODINGS:
+        quality = accepted.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress(encoding, data):
+    if encoding == "br":
+        return brotli.compress(data, quality=settings.COMPRESSION_BROTLI_QUALITY)
+    return gzip.compress(data, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0)
+
+
+class StreamCompressor:
+    """Incremental compressor with the same interface for gzip and Brotli."""
+
+    def __init__(self, encoding):
+        if encoding == "br":
+            self._compressor = brotli.Compressor(
+                quality=settings.COMPRESSION_STREAM_BROTLI_QUALITY
+            )
+            self._compress = self._compressor.process
+            self._finish = self._compressor.finish
+        else:
+            self._compressor = zlib.compressobj(
+                settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS
+            )
+            self._compress = self._compressor.compress
+            self._finish = self._compressor.flush
+
+    def compress(self, chunk):
+        if isinstance(chunk, str):
+            chunk = chunk.encode()
+        return self._compress(chunk)
+
+    def finish(self):
+        return self._finish()
+
+
+def compress_sequence(encoding, chunks):
+    compressor = StreamCompressor(encoding)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+async def acompress_sequence(encoding, chunks):
+    compressor = StreamCompressor(encoding)
+    async for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+def is_compressible(response):
+    content_type = response.get("Content-Type", "").lower()
+    return (
+        content_type.startswith(COMPRESSIBLE_TYPES)
+        or "+json" in content_type
+        or "+xml" in content_type
+    )
+
+
+class CompressionMiddleware:
+    """
+    Compress responses with the best coding the client accepts.
+
+    Bodies shorter than ``COMPRESSION_MIN_SIZE`` are sent as they are, since
+    the headers and CPU time outweigh the savings. Like Django's
+    ``GZipMiddleware`` this weakens strong ETags, because the compressed
+    bytes differ from the ones the ETag was computed for.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, "COMPRESSION_ENABLED", True):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        alias = settings.COMPRESSION_CACHE_ALIAS
+        self.cache = caches[alias] if alias else None
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        return self.process_response(request, response)
+
+    def process_response(self, request, response):
+        if not is_lean_request(request):
+            return response
+        if response.has_header("Content-Encoding") or not is_compressible(response):
+            return response
+        if "no-transform" in response.get("Cache-Control", ""):
+            return response
+        patch_vary_headers(response, ("Accept-Encoding",))
+
+        encoding = negotiate(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            length = response.get("Content-Length")
+            if length is not None and int(length) < settings.COMPRESSION_MIN_SIZE:
+                return response
+            if response.is_async:
+                response.streaming_content = acompress_sequence(
+                    encoding, response.streaming_content
+                )
+            else:
+                response.streaming_content = compress_sequence(
+                    encoding, response.streaming_content
+                )
+            del response["Content-Length"]
+        else:
+            content = response.content
+            if len(content) < settings.COMPRESSION_MIN_SIZE:
+                return response
+            with timed(request, "compress"):
+                compressed = self.compress(encoding, content, response.status_code)
+            if len(compressed) >= len(content):
+                return response
+            response.content = compressed
+            response["Content-Length"] = str(len(compressed))
+
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response["ETag"] = "W/" + etag
+        response["Content-Encoding"] = encoding
+        return response
+
+    def compress(self, encoding, content, status_code=200):
+        if (
+            self.cache is None
+            or status_code != 200
+            or len(content) > settings.COMPRESSION_CACHE_MAX_SIZE
+        ):
+            return compress(encoding, content)
+        digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+        key = f"compression:{encoding}:{digest}"
+        compressed = self.cache.get(key)
+        if compressed is None:
+            compressed = compress(encoding, content)
+            self.cache.set(key, compressed, settings.COMPRESSION_CACHE_TIMEOUT)
+        return compressed
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from rest_framework import filters
+
+
+class OrderingFilter(filters.OrderingFilter):
+    """
+    ``OrderingFilter`` that also accepts the view's ``ordering_aliases``.
+
+    An alias such as ``?ordering=popular`` maps to a fixed list of fields that
+    need not be in ``ordering_fields``.
+    """
+
+    def get_ordering(self, request, queryset, view):
+        aliases = getattr(view, "ordering_aliases", {})
+        alias = request.query_params.get(self.ordering_param)
+        if alias in aliases:
+            return list(aliases[alias])
+        return super().get_ordering(request, queryset, view)
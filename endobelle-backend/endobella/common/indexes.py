@@ -0,0 +1,101 @@
+"""
+Per-process in-memory indexes kept current from the database.
+
+``RefreshedIndex`` builds its data on first use and, every
+``<PREFIX>_REFRESH_SECONDS``, passes the time of the previous look to
+``_catch_up`` so that only rows changed since then are read. The look-back
+is widened by ``<PREFIX>_SYNC_OVERLAP_SECONDS`` for timestamps written by
+other servers' clocks and transactions that commit late. Every
+``<PREFIX>_REBUILD_SECONDS`` the data is built from scratch instead, which
+drops deleted rows.
+
+Requests keep using the current data while one thread refreshes it; only
+the first build is waited for. ``warm`` starts that build in the background
+when the process starts, so it is not paid by the first request.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connections
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+class RefreshedIndex:
+    """Subclasses set ``settings_prefix`` and implement ``_build`` and ``_catch_up``."""
+
+    settings_prefix = None
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data = None
+        self._synced_at = None
+        self._checked_at = 0.0
+        self._built_at = 0.0
+
+    def reset(self):
+        with self._lock:
+            self._data = None
+
+    def warm(self):
+        """Build the data in a background thread; requests wait for it."""
+
+        def build():
+            try:
+                self._sync()
+            except Exception:
+                # The first request builds it again.
+                logger.exception("Building %s failed", type(self).__name__)
+            finally:
+                connections.close_all()
+
+        thread = threading.Thread(target=build, daemon=True)
+        thread.start()
+        return thread
+
+    def current(self):
+        """The data, caught up or rebuilt first when that is due."""
+        self._sync()
+        return self._data
+
+    def _build(self):
+        raise NotImplementedError
+
+    def _catch_up(self, data, since):
+        """Return ``data`` with the rows changed since ``since`` applied."""
+        raise NotImplementedError
+
+    def _setting(self, name):
+        return getattr(settings, f"{self.settings_prefix}_{name}")
+
+    def _sync(self):
+        now = time.monotonic()
+        refresh = self._setting("REFRESH_SECONDS")
+        if self._data is not None and now - self._checked_at < refresh:
+            return
+        if not self._lock.acquire(blocking=self._data is None):
+            return
+        try:
+            if self._data is not None and now - self._checked_at < refresh:
+                return
+            started = timezone.now()
+            rebuild = self._setting("REBUILD_SECONDS")
+            if self._data is None or now - self._built_at > rebuild:
+                self._data = self._build()
+                self._built_at = now
+            else:
+                since = self._synced_at - timedelta(
+                    seconds=self._setting("SYNC_OVERLAP_SECONDS")
+                )
+                self._data = self._catch_up(self._data, since)
+            self._synced_at = started
+            self._checked_at = now
+        finally:
+            self._lock.release()
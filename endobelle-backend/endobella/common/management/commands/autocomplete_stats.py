@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from endobella.common.autocomplete import autocomplete
+
+
+class Command(BaseCommand):
+    help = "Build the typeahead index and report its size and lookup time."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "queries",
+            nargs="*",
+            default=["a", "co", "cotton", "organic cotton t"],
+            help="Prefixes to time.",
+        )
+
+    def handle(self, *args, **options):
+        autocomplete.reset()
+        start = time.perf_counter()
+        stats = autocomplete.stats()
+        self.stdout.write(f"Built in {time.perf_counter() - start:.2f}s")
+        for kind, values in stats.items():
+            self.stdout.write(
+                f"{kind}: {values['entries']} entries, {values['keys']} keys, "
+                f"{values['bytes'] / 1024 / 1024:.1f} MB"
+            )
+        total = sum(values["bytes"] for values in stats.values())
+        self.stdout.write(f"Total: {total / 1024 / 1024:.1f} MB")
+
+        for query in options["queries"]:
+            runs = 1000
+            start = time.perf_counter()
+            for _ in range(runs):
+                autocomplete.search(query)
+            elapsed = (time.perf_counter() - start) / runs
+            self.stdout.write(f"{query!r}: {elapsed * 1e6:.0f} us")
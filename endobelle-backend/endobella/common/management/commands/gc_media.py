@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import os
+import re
+import time
+from collections import Counter
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.db import models, transaction
+from django.utils import timezone
+from django_ckeditor_5.fields import CKEditor5Field
+
+from endobella.common.models import MediaBlob
+from endobella.common.storage import CAS_PREFIX
+
+
+class Command(BaseCommand):
+    help = (
+        "Recount references to content-addressed media from file fields and "
+        "CKEditor content, and delete files nothing refers to."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--min-age",
+            type=float,
+            default=24,
+            help="Keep unreferenced files younger than this many hours, since "
+            "an upload is stored before the form referring to it is saved.",
+        )
+        parser.add_argument("--dry-run", action="store_true")
+
+    def handle(self, *args, **options):
+        # Read before counting: a save that refers to a blob after the count
+        # changes its refcount, and a changed blob is left alone.
+        counted_refcounts = dict(MediaBlob.objects.values_list("name", "refcount"))
+        references = self.count_references()
+        cutoff = timezone.now() - timedelta(hours=options["min_age"])
+
+        recounted = deleted = freed = 0
+        for blob in MediaBlob.objects.iterator():
+            refcount = counted_refcounts.get(blob.name)
+            if refcount is None:
+                # Created while counting.
+                continue
+            count = references.get(blob.name, 0)
+            if count == 0 and blob.created_at < cutoff:
+                if options["dry_run"] or self.delete_blob(blob.name, refcount):
+                    deleted += 1
+                    freed += blob.size
+            elif count and count != refcount:
+                # Conditional, so that a reference added meanwhile is kept.
+                recounted += options["dry_run"] or MediaBlob.objects.filter(
+                    name=blob.name, refcount=refcount
+                ).update(refcount=count)
+
+        if not options["dry_run"]:
+            self.remove_stale_uploads(options["min_age"] * 3600)
+        self.stdout.write(
+            f"{len(references)} referenced files, {recounted} recounted, "
+            f"{deleted} deleted ({freed / 1024 / 1024:.1f} MiB)"
+        )
+
+    def count_references(self):
+        references = Counter()
+        embedded = re.compile(
+            re.escape(settings.MEDIA_URL) + r"(" + re.escape(CAS_PREFIX) + r"[\w/.]+)"
+        )
+        for model in apps.get_models():
+            for field in model._meta.concrete_fields:
+                queryset = model._base_manager.all()
+                if isinstance(field, models.FileField):
+                    names = queryset.filter(
+                        **{f"{field.attname}__startswith": CAS_PREFIX}
+                    ).values_list(field.attname, flat=True)
+                    references.update(names.iterator())
+                elif isinstance(field, CKEditor5Field):
+                    html = queryset.filter(
+                        **{f"{field.attname}__contains": CAS_PREFIX}
+                    ).values_list(field.attname, flat=True)
+                    for value in html.iterator():
+                        references.update(embedded.findall(value))
+        return references
+
+    @staticmethod
+    def delete_blob(name, refcount):
+        """Delete the blob and its file unless its refcount changed meanwhile."""
+        with transaction.atomic():
+            blob = (
+                MediaBlob.objects.select_for_update()
+                .filter(name=name, refcount=refcount)
+                .first()
+            )
+            if blob is None:
+                return False
+            blob.delete()
+            # Under the row lock, which a save referring to the file waits
+            # for. With no MediaBlob row left the storage removes the file.
+            default_storage.delete(name)
+        return True
+
+    @staticmethod
+    def remove_stale_uploads(min_age):
+        tmp_dir = default_storage.path(CAS_PREFIX + "tmp")
+        if not os.path.isdir(tmp_dir):
+            return
+        for entry in os.scandir(tmp_dir):
+            if time.time() - entry.stat().st_mtime > min_age:
+                os.unlink(entry.path)
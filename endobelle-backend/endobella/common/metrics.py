@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (1_000, 10_000, 50_000, 100_000, 500_000, 1_000_000, 5_000_000)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200)
+
+
+class Histogram:
+    """Cumulative histogram with fixed upper bounds, Prometheus style."""
+
+    __slots__ = ("buckets", "count", "counts", "sum")
+
+    def __init__(self, buckets):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        total = 0
+        for bound, count in zip((*self.buckets, float("inf")), self.counts):
+            total += count
+            yield bound, total
+
+
+class MetricsRegistry:
+    """
+    In-process, per-route aggregation of request metrics.
+
+    Each worker process keeps its own registry; the scraper is expected to sum
+    across processes, the same way it does for any multi-process exporter.
+    """
+
+    metrics = {
+        "request_duration_seconds": ("Request wall time.", DURATION_BUCKETS),
+        "db_duration_seconds": ("Time spent in database queries.", DURATION_BUCKETS),
+        "db_queries": ("Database queries per request.", QUERY_BUCKETS),
+        "serialize_duration_seconds": ("Serializer time.", DURATION_BUCKETS),
+        "render_duration_seconds": ("Response rendering time.", DURATION_BUCKETS),
+        "response_size_bytes": ("Response body size.", SIZE_BUCKETS),
+    }
+
+    def __init__(self, prefix="endobella"):
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._requests = {}
+
+    def observe(self, route, method, status, values):
+        with self._lock:
+            key = (route, method, str(status))
+            self._requests[key] = self._requests.get(key, 0) + 1
+            for name, value in values.items():
+                histogram = self._histograms.get((name, route))
+                if histogram is None:
+                    histogram = Histogram(self.metrics[name][1])
+                    self._histograms[(name, route)] = histogram
+                histogram.observe(value)
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._requests.clear()
+
+    def render(self):
+        """Render all metrics in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            name = f"{self.prefix}_requests_total"
+            lines.append(f"# HELP {name} Requests handled.")
+            lines.append(f"# TYPE {name} counter")
+            for (route, method, status), value in sorted(self._requests.items()):
+                labels = _labels(route=route, method=method, status=status)
+                lines.append(f"{name}{{{labels}}} {value}")
+
+            for metric, (help_text, _) in self.metrics.items():
+                name = f"{self.prefix}_{metric}"
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} histogram")
+                for (hist_name, route), histogram in sorted(self._histograms.items()):
+                    if hist_name != metric:
+                        continue
+                    for bound, total in histogram.cumulative():
+                        le = "+Inf" if bound == float("inf") else repr(bound)
+                        labels = _labels(route=route, le=le)
+                        lines.append(f"{name}_bucket{{{labels}}} {total}")
+                    labels = _labels(route=route)
+                    lines.append(f"{name}_sum{{{labels}}} {histogram.sum}")
+                    lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(**labels):
+    return ",".join(
+        '{}="{}"'.format(
+            key,
+            str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"),
+        )
+        for key, value in labels.items()
+    )
+
+
+registry = MetricsRegistry()
+
+
+class RequestTimings:
+    """Timings collected for a single request, attached as ``request.timings``."""
+
+    __slots__ = ("db_queries", "db_time", "phases")
+
+    def __init__(self):
+        self.db_queries = 0
+        self.db_time = 0.0
+        self.phases = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - start
+            self.db_queries += 1
+
+    def add(self, phase, duration):
+        self.phases[phase] = self.phases.get(phase, 0.0) + duration
+
+
+@contextmanager
+def timed(request, phase):
+    """Attribute the enclosed block to ``phase`` in the request's timings."""
+    timings = getattr(request, "timings", None)
+    if timings is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(phase, time.perf_counter() - start)
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.messages.middleware import MessageMiddleware
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.middleware.clickjacking import XFrameOptionsMiddleware
+from django.middleware.csrf import CsrfViewMiddleware
+
+from endobella.common.metrics import RequestTimings, registry
+
+
+class PerformanceMiddleware:
+    """
+    Records wall time, database time and query count, serialization and
+    rendering time, and response size for every request.
+
+    The numbers are returned as ``Server-Timing`` headers and aggregated into
+    per-route histograms that are exposed by ``endobella.common.views.metrics``.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, "PERFORMANCE_METRICS_ENABLED", True):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.server_timing = getattr(settings, "PERFORMANCE_SERVER_TIMING", True)
+
+    def __call__(self, request):
+        timings = request.timings = RequestTimings()
+        start = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(timings))
+            response = self.get_response(request)
+        duration = time.perf_counter() - start
+
+        size = 0 if response.streaming else len(response.content)
+        if self.server_timing:
+            response["Server-Timing"] = self.server_timing_header(timings, duration)
+
+        match = request.resolver_match
+        values = {
+            "request_duration_seconds": duration,
+            "db_duration_seconds": timings.db_time,
+            "db_queries": timings.db_queries,
+            "response_size_bytes": size,
+        }
+        for phase in ("serialize", "render"):
+            if phase in timings.phases:
+                values[f"{phase}_duration_seconds"] = timings.phases[phase]
+        registry.observe(
+            match.view_name if match else "unmatched",
+            request.method,
+            response.status_code,
+            values,
+        )
+        return response
+
+    def process_template_response(self, request, response):
+        start = time.perf_counter()
+
+        def _rendered(response):
+            request.timings.add("render", time.perf_counter() - start)
+
+        response.add_post_render_callback(_rendered)
+        return response
+
+    @staticmethod
+    def server_timing_header(timings, duration):
+        entries = [
+            f"total;dur={duration * 1000:.2f}",
+            f'db;dur={timings.db_time * 1000:.2f};desc="{timings.db_queries} queries"',
+        ]
+        entries.extend(
+            f"{phase};dur={value * 1000:.2f}" for phase, value in timings.phases.items()
+        )
+        return ", ".join(entries)
+
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+def is_lean_request(request):
+    """
+    Whether ``request`` is a read on a public JSON route.
+
+    Those routes never use sessions, CSRF, messages or frame options, so the
+    ``Lean*`` middleware below pass them straight through. Admin and auth
+    routes are not listed in ``LEAN_ROUTE_PREFIXES`` and keep the full stack.
+    """
+    prefixes = tuple(filter(None, getattr(settings, "LEAN_ROUTE_PREFIXES", ())))
+    return (
+        bool(prefixes)
+        and request.method in SAFE_METHODS
+        and request.path_info.startswith(prefixes)
+    )
+
+
+class LeanRouteMixin:
+    def __call__(self, request):
+        if is_lean_request(request):
+            return self.get_response(request)
+        return super().__call__(request)
+
+
+class LeanSessionMiddleware(LeanRouteMixin, SessionMiddleware):
+    pass
+
+
+class LeanCsrfViewMiddleware(LeanRouteMixin, CsrfViewMiddleware):
+    def process_view(self, request, callback, callback_args, callback_kwargs):
+        if is_lean_request(request):
+            return None
+        return super().process_view(request, callback, callback_args, callback_kwargs)
+
+
+class LeanAuthenticationMiddleware(LeanRouteMixin, AuthenticationMiddleware):
+    def __call__(self, request):
+        if is_lean_request(request):
+            # JWT requests are still authenticated by DRF; only the session
+            # lookup is skipped.
+            request.user = AnonymousUser()
+        return super().__call__(request)
+
+
+class LeanMessageMiddleware(LeanRouteMixin, MessageMiddleware):
+    pass
+
+
+class LeanXFrameOptionsMiddleware(LeanRouteMixin, XFrameOptionsMiddleware):
+    pass
@@ -1,10 +1,82 @@
-from rest_framework import mixins, permissions, viewsets
-from rest_framework.filters import SearchFilter, OrderingFilter
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework import mixins, permissions, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.filters import SearchFilter
+from rest_framework.response import Response
 from django_filters.rest_framework.backends import DjangoFilterBackend
 
+from endobella.common.filters import OrderingFilter
+from endobella.common.metrics import timed
+
 
 class PublicItemViewMixin(
     mixins.RetrieveModelMixin, mixins.ListModelMixin, viewsets.GenericViewSet
 ):
     permission_classes = [permissions.AllowAny]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            with timed(request, "serialize"):
+                data = serializer.data
+            return self.get_paginated_response(data)
+
+        serializer = self.get_serializer(queryset, many=True)
+        with timed(request, "serialize"):
+            data = serializer.data
+        return Response(data)
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        serializer = self.get_serializer(instance)
+        with timed(request, "serialize"):
+            data = serializer.data
+        return Response(data)
+
+
+class ViewCountMixin:
+    """
+    Adds ``POST <detail>/view/`` and popularity orderings to a public viewset.
+
+    Views go to ``view_counter`` (a ``BufferedCounter``) and are written to the
+    database in batches. Lists ordered by one of ``ordering_aliases`` change
+    only when counters flush, so they are cached for
+    ``POPULAR_CACHE_TIMEOUT`` seconds.
+    """
+
+    view_counter = None
+    ordering_aliases = {
+        "popular": ["-popularity"],
+        "most_read": ["-view_count"],
+    }
+
+    @action(
+        detail=True,
+        methods=["post"],
+        url_path="view",
+        authentication_classes=[],
+        permission_classes=[permissions.AllowAny],
+    )
+    def track_view(self, request, *args, **kwargs):
+        self.view_counter.add(kwargs[self.lookup_url_kwarg or self.lookup_field])
+        return Response(status=status.HTTP_202_ACCEPTED)
+
+    def list(self, request, *args, **kwargs):
+        ordering = request.query_params.get(OrderingFilter.ordering_param)
+        if ordering not in self.ordering_aliases:
+            return super().list(request, *args, **kwargs)
+
+        url = request.build_absolute_uri()
+        key = "popular:" + hashlib.md5(url.encode()).hexdigest()
+        data = cache.get(key)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            cache.set(key, data, settings.POPULAR_CACHE_TIMEOUT)
+        return Response(data)
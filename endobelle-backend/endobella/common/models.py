@@ -1,11 +1,38 @@
-from uuid import uuid4
 from django.db import models
 
+from endobella.common.ids import uuid7
+
 
 class BaseModel(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         abstract = True
+
+
+class ViewCountedModel(models.Model):
+    """Fields written by ``endobella.common.counters.BufferedCounter``."""
+
+    view_count = models.PositiveBigIntegerField(default=0, editable=False)
+    popularity = models.FloatField(
+        default=0.0,
+        editable=False,
+        help_text="Time-decayed view score in log space; higher is more popular.",
+    )
+
+    class Meta:
+        abstract = True
+
+
+class MediaBlob(models.Model):
+    """Reference count of a file in ``ContentAddressedStorage``."""
+
+    name = models.CharField(max_length=255, primary_key=True)
+    size = models.PositiveBigIntegerField()
+    refcount = models.PositiveIntegerField(default=1)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.name
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import logging
+import re
+import time
+import traceback
+from collections import defaultdict
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import DatabaseError, connections
+
+logger = logging.getLogger("endobella.queries")
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bIN \((?:\s*(?:%s|\?)\s*,?)+\)", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(sql: str) -> str:
+    """Reduce a statement to its shape so repeats with other values group together."""
+    sql = _STRING_LITERAL.sub("?", sql)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    sql = _IN_LIST.sub("IN (...)", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+def _project_stack(limit=8):
+    """Return the innermost frames that belong to this project, outermost first."""
+    root = str(Path(settings.BASE_DIR).resolve())
+    own = str(Path(__file__).resolve())
+    frames = []
+    for frame in traceback.extract_stack():
+        filename = frame.filename
+        if (
+            filename.startswith(root)
+            and filename != own
+            and "site-packages" not in filename
+        ):
+            frames.append(f"{filename[len(root) + 1 :]}:{frame.lineno} in {frame.name}")
+    return frames[-limit:]
+
+
+@dataclass
+class Query:
+    alias: str
+    sql: str
+    params: object
+    duration: float
+    stack: list[str]
+
+    @property
+    def shape(self):
+        return normalize_sql(self.sql)
+
+
+@dataclass
+class QueryGroup:
+    shape: str
+    queries: list[Query] = field(default_factory=list)
+
+    @property
+    def count(self):
+        return len(self.queries)
+
+    @property
+    def duration(self):
+        return sum(query.duration for query in self.queries)
+
+    @property
+    def locations(self):
+        """Distinct call sites (innermost project frame) that issued the query."""
+        return sorted({query.stack[-1] for query in self.queries if query.stack})
+
+
+class QueryRecorder:
+    """``execute_wrapper`` that records every statement with its duration and call site."""
+
+    def __init__(self, alias="default", capture_stack=True):
+        self.alias = alias
+        self.capture_stack = capture_stack
+        self.queries: list[Query] = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append(
+                Query(
+                    alias=self.alias,
+                    sql=sql,
+                    params=params,
+                    duration=time.perf_counter() - start,
+                    stack=_project_stack() if self.capture_stack else [],
+                )
+            )
+
+
+class QueryReport:
+    def __init__(self, queries):
+        self.queries = list(queries)
+
+    def __len__(self):
+        return len(self.queries)
+
+    def groups(self):
+        groups = defaultdict(list)
+        for query in self.queries:
+            groups[query.shape].append(query)
+        return [QueryGroup(shape, queries) for shape, queries in groups.items()]
+
+    def n_plus_one(self, threshold=None):
+        """Query shapes repeated at least ``threshold`` times, most repeated first."""
+        if threshold is None:
+            threshold = getattr(settings, "QUERY_N_PLUS_ONE_THRESHOLD", 5)
+        repeated = [group for group in self.groups() if group.count >= threshold]
+        return sorted(repeated, key=lambda group: group.count, reverse=True)
+
+    def slow(self, threshold=None):
+        if threshold is None:
+            threshold = getattr(settings, "QUERY_SLOW_THRESHOLD_MS", 100) / 1000
+        return [query for query in self.queries if query.duration >= threshold]
+
+    def log(self, label, n_plus_one_threshold=None, slow_threshold=None):
+        for group in self.n_plus_one(n_plus_one_threshold):
+            logger.warning(
+                "Possible N+1 in %s: %d x %s (%.1f ms) from %s",
+                label,
+                group.count,
+                group.shape,
+                group.duration * 1000,
+                ", ".join(group.locations) or "<unknown>",
+            )
+        for query in self.slow(slow_threshold):
+            logger.warning(
+                "Slow query in %s (%.1f ms) from %s: %s\n%s",
+                label,
+                query.duration * 1000,
+                query.stack[-1] if query.stack else "<unknown>",
+                query.sql,
+                explain(query),
+            )
+
+
+def explain(query: Query) -> str:
+    """Run EXPLAIN for a recorded query; only SELECT statements are explained."""
+    if not query.sql.lstrip().upper().startswith("SELECT"):
+        return ""
+    connection = connections[query.alias]
+    if not connection.features.supports_explaining_query_execution:
+        return ""
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"{connection.ops.explain_query_prefix()} {query.sql}", query.params
+            )
+            return "\n".join(" ".join(map(str, row)) for row in cursor.fetchall())
+    except DatabaseError as e:  # EXPLAIN is diagnostic only, never fail the caller
+        return f"EXPLAIN failed: {e}"
+
+
+@contextmanager
+def record_queries(capture_stack=True):
+    """Record queries on all database connections and yield a ``QueryReport``."""
+    report = QueryReport([])
+    recorders = [
+        QueryRecorder(connection.alias, capture_stack)
+        for connection in connections.all()
+    ]
+    with ExitStack() as stack:
+        for recorder in recorders:
+            stack.enter_context(connections[recorder.alias].execute_wrapper(recorder))
+        try:
+            yield report
+        finally:
+            report.queries = [
+                query for recorder in recorders for query in recorder.queries
+            ]
+
+
+class QueryInspectionMiddleware:
+    """
+    Development helper that logs N+1 patterns and slow queries per request.
+
+    Enabled by ``QUERY_INSPECTION_ENABLED`` (defaults to ``DEBUG``).
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, "QUERY_INSPECTION_ENABLED", settings.DEBUG):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with record_queries() as report:
+            response = self.get_response(request)
+        report.log(f"{request.method} {request.path}")
+        return response
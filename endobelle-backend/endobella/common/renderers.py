@@ -0,0 +1,61 @@
+"""
+JSON renderer and parser backed by orjson.
+
+orjson serializes UUIDs, datetimes, dicts and lists in C; anything it does
+not know (lazy translation strings, Decimals, querysets) goes through DRF's
+``JSONEncoder.default``. The one visible difference is that raw datetimes
+keep their microseconds, where DRF truncates them to milliseconds; values
+from serializer fields are already strings. Indented or ASCII-only output
+and non-UTF-8 or non-strict parsing are left to DRF's stdlib-based classes.
+"""
+
+from __future__ import annotations
+
+import codecs
+
+import orjson
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+from rest_framework.utils import encoders
+
+_encoder = encoders.JSONEncoder()
+_LINE_SEPARATOR = "\u2028".encode()
+_PARAGRAPH_SEPARATOR = "\u2029".encode()
+
+
+class FastJSONRenderer(JSONRenderer):
+    options = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None or not self.compact or self.ensure_ascii:
+            return super().render(data, accepted_media_type, renderer_context)
+        # Indented output (browsable API, ``; indent=4``) is rare enough to
+        # leave to the stdlib, which supports arbitrary indent widths.
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(data, default=_encoder.default, option=self.options)
+        # Match DRF: keep the output a strict JavaScript subset.
+        if _LINE_SEPARATOR in ret or _PARAGRAPH_SEPARATOR in ret:
+            ret = ret.replace(_LINE_SEPARATOR, b"\\u2028").replace(
+                _PARAGRAPH_SEPARATOR, b"\\u2029"
+            )
+        return ret
+
+
+class FastJSONParser(JSONParser):
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        encoding = (parser_context or {}).get("encoding", settings.DEFAULT_CHARSET)
+        if not api_settings.STRICT_JSON:
+            return super().parse(stream, media_type, parser_context)
+        if codecs.lookup(encoding).name != "utf-8":
+            return super().parse(stream, media_type, parser_context)
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}") from exc
@@ -0,0 +1,190 @@
+"""
+Push content changes to the frontend so it can cache API responses for long.
+
+Saving or deleting a tracked model queues a change event once the
+transaction commits; writes that send no signals, like the queryset
+``update()`` refreshing product price summaries, queue theirs with
+``notify``. Events are coalesced per object and delivered together
+``REVALIDATION_DEBOUNCE_SECONDS`` after the first one, so a bulk admin edit
+becomes a single request. The webhook receives::
+
+    {"events": [{"type": "article", "slug": "...", "action": "saved",
+                 "keys": [...]}, ...],
+     "keys": [...]}
+
+where ``keys`` are the cache keys (Next.js tags) to revalidate. The body is
+signed with HMAC-SHA256 of ``REVALIDATION_WEBHOOK_SECRET`` in the
+``X-Revalidate-Signature`` header. Failed deliveries are retried with
+exponential backoff and then logged and dropped.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import hmac
+import json
+import logging
+import threading
+import time
+import urllib.error
+import urllib.request
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+
+logger = logging.getLogger(__name__)
+
+
+def article_keys(article):
+    return [
+        "articles",
+        f"articles:category:{article.category}",
+        f"article:{article.slug}",
+        "bootstrap",
+    ]
+
+
+def product_keys(product):
+    keys = ["products", f"product:{product.slug}"]
+    if product.category_id:
+        keys.append(f"products:category:{product.category_id}")
+    return keys
+
+
+def sign(body, secret):
+    return hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+class RevalidationQueue:
+    """Coalesces change events and delivers them from a timer thread."""
+
+    def __init__(self):
+        self._events = {}
+        self._lock = threading.Lock()
+        self._timer = None
+
+    def __len__(self):
+        return len(self._events)
+
+    def add(self, event):
+        with self._lock:
+            key = (event["type"], event["slug"])
+            previous = self._events.get(key)
+            if previous is not None:
+                event = {**event, "keys": sorted({*previous["keys"], *event["keys"]})}
+            self._events[key] = event
+            if self._timer is None:
+                self._timer = threading.Timer(
+                    settings.REVALIDATION_DEBOUNCE_SECONDS, self.flush
+                )
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        """Deliver pending events now; returns whether delivery succeeded."""
+        with self._lock:
+            events, self._events = list(self._events.values()), {}
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if not events:
+            return True
+        return deliver(events)
+
+
+def deliver(events):
+    url = settings.REVALIDATION_WEBHOOK_URL
+    body = json.dumps(
+        {
+            "events": events,
+            "keys": sorted({key for event in events for key in event["keys"]}),
+        }
+    ).encode()
+    headers = {"Content-Type": "application/json"}
+    if settings.REVALIDATION_WEBHOOK_SECRET:
+        headers["X-Revalidate-Signature"] = sign(
+            body, settings.REVALIDATION_WEBHOOK_SECRET
+        )
+
+    attempts = settings.REVALIDATION_MAX_RETRIES + 1
+    for attempt in range(attempts):
+        request = urllib.request.Request(url, data=body, headers=headers)
+        try:
+            with urllib.request.urlopen(
+                request, timeout=settings.REVALIDATION_TIMEOUT
+            ) as response:
+                response.read()
+            return True
+        except (urllib.error.URLError, OSError) as exc:
+            if attempt + 1 < attempts:
+                time.sleep(settings.REVALIDATION_RETRY_BACKOFF * 2**attempt)
+            else:
+                logger.error(
+                    "Dropping %d revalidation events after %d attempts: %s",
+                    len(events),
+                    attempts,
+                    exc,
+                )
+    return False
+
+
+queue = RevalidationQueue()
+atexit.register(queue.flush)
+
+
+def _enabled():
+    return bool(settings.REVALIDATION_WEBHOOK_URL)
+
+
+def _enqueue(type_, slug, action, keys):
+    event = {"type": type_, "slug": slug, "action": action, "keys": keys}
+    transaction.on_commit(lambda: queue.add(event))
+
+
+def notify(type_, instances, keys):
+    """
+    Queue ``saved`` events for ``instances`` changed without a save, e.g. by
+    ``QuerySet.update()``. A queryset is only evaluated when enabled.
+    """
+    if _enabled():
+        for instance in instances:
+            _enqueue(type_, instance.slug, "saved", keys(instance))
+
+
+def track(model, keys, type_=None):
+    """
+    Send change events for ``model``; ``keys(instance)`` lists its cache keys.
+
+    A changed slug also revalidates the old one, at the cost of one query
+    per save that may touch the slug.
+    """
+    type_ = type_ or model._meta.model_name
+    uid = f"revalidation_{model._meta.label_lower}"
+
+    def before_save(sender, instance, raw=False, update_fields=None, **kwargs):
+        instance._revalidation_old_slug = None
+        if raw or not _enabled() or instance._state.adding:
+            return
+        if update_fields is not None and "slug" not in update_fields:
+            return
+        instance._revalidation_old_slug = (
+            sender.objects.filter(pk=instance.pk).values_list("slug", flat=True).first()
+        )
+
+    def saved(sender, instance, raw=False, **kwargs):
+        if raw or not _enabled():
+            return
+        _enqueue(type_, instance.slug, "saved", keys(instance))
+        old_slug = getattr(instance, "_revalidation_old_slug", None)
+        if old_slug and old_slug != instance.slug:
+            _enqueue(type_, old_slug, "deleted", [f"{type_}:{old_slug}"])
+
+    def deleted(sender, instance, **kwargs):
+        if _enabled():
+            _enqueue(type_, instance.slug, "deleted", keys(instance))
+
+    pre_save.connect(before_save, sender=model, weak=False, dispatch_uid=uid)
+    post_save.connect(saved, sender=model, weak=False, dispatch_uid=uid)
+    post_delete.connect(deleted, sender=model, weak=False, dispatch_uid=uid)
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import copy
+from operator import attrgetter
+
+from django.utils.functional import cached_property
+from rest_framework import serializers
+from rest_framework.fields import Field, SkipField
+from rest_framework.relations import PKOnlyObject
+
+
+class CachedFieldsMixin:
+    """
+    Build a serializer's field map once per class instead of per instance.
+
+    ``ModelSerializer.get_fields`` introspects the model and derives kwargs for
+    every field each time a serializer is created. The result only depends on
+    the class, so the first build is kept as a prototype and later instances
+    get a deep copy, which is what DRF already does for declared fields.
+    Serializers whose fields depend on ``context`` must not use this mixin.
+
+    ``to_representation`` is also specialised for output: the per-field
+    readers are resolved once per serializer instance (and so once per list,
+    since a ``ListSerializer`` reuses its child), and plain model columns are
+    read with ``operator.attrgetter``.
+    """
+
+    def get_fields(self):
+        cls = type(self)
+        prototype = cls.__dict__.get("_fields_prototype")
+        if prototype is None:
+            prototype = super().get_fields()
+            cls._fields_prototype = prototype
+        return copy.deepcopy(prototype)
+
+    @cached_property
+    def _field_readers(self):
+        model = getattr(getattr(self, "Meta", None), "model", None)
+        columns = (
+            {
+                field.attname
+                for field in model._meta.concrete_fields
+                if not field.is_relation
+            }
+            if model
+            else set()
+        )
+        readers = []
+        for field in self._readable_fields:
+            if (
+                type(field).get_attribute is Field.get_attribute
+                and field.source in columns
+            ):
+                getter = attrgetter(field.source)
+            else:
+                getter = field.get_attribute
+            readers.append((field.field_name, getter, field.to_representation))
+        return readers
+
+    def to_representation(self, instance):
+        ret = {}
+        for name, get_attribute, to_representation in self._field_readers:
+            try:
+                attribute = get_attribute(instance)
+            except SkipField:
+                continue
+            if isinstance(attribute, PKOnlyObject):
+                check_for_none = attribute.pk
+            else:
+                check_for_none = attribute
+            ret[name] = None if check_for_none is None else to_representation(attribute)
+        return ret
+
+
+class CachedModelSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    pass
@@ -0,0 +1,104 @@
+"""
+Unique slugs for single saves and whole batches.
+
+``allocate_slugs`` fills the blank slugs of a batch from a source field
+with one query: it reads the existing slugs starting with each base, and
+names that clash get the next free ``-2``, ``-3``... suffix in memory.
+Another process can take the same slug between that read and the insert;
+``save_with_slug`` and ``bulk_create_with_slugs`` then allocate again and
+retry, up to ``RETRIES`` times.
+"""
+
+from __future__ import annotations
+
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils.text import slugify
+
+RETRIES = 3
+# Bases per query; SQLite limits the depth of the OR chain.
+QUERY_CHUNK = 500
+# Room kept at the end of a base for a suffix, so "-<n>" never truncates it.
+SUFFIX_LENGTH = 8
+
+
+def _existing(model, field, bases):
+    taken = set()
+    for start in range(0, len(bases), QUERY_CHUNK):
+        condition = Q()
+        for base in bases[start : start + QUERY_CHUNK]:
+            condition |= Q(**{f"{field}__startswith": base})
+        taken.update(
+            model._base_manager.filter(condition).values_list(field, flat=True)
+        )
+    return taken
+
+
+def allocate_slugs(objs, source, field="slug"):
+    """
+    Give each object of ``objs`` with a blank ``field`` a slug of its
+    ``source`` attribute, unique in the table and within the batch.
+    Returns the objects that were given one.
+    """
+    objs = [obj for obj in objs if not getattr(obj, field)]
+    if not objs:
+        return []
+    model = type(objs[0])
+    max_length = model._meta.get_field(field).max_length - SUFFIX_LENGTH
+    pending = [
+        (
+            obj,
+            slugify(getattr(obj, source))[:max_length].strip("-")
+            or model._meta.model_name,
+        )
+        for obj in objs
+    ]
+    taken = _existing(model, field, sorted({base for _, base in pending}))
+    last_suffix = {}
+    for obj, base in pending:
+        slug, suffix = base, last_suffix.get(base, 1)
+        while slug in taken:
+            suffix += 1
+            slug = f"{base}-{suffix}"
+        last_suffix[base] = suffix
+        taken.add(slug)
+        setattr(obj, field, slug)
+    return objs
+
+
+def _clashed(model, field, objs):
+    # Only a slug taken since it was allocated is worth another attempt.
+    slugs = [getattr(obj, field) for obj in objs]
+    return model._base_manager.filter(**{f"{field}__in": slugs}).exists()
+
+
+def save_with_slug(obj, source, save, field="slug"):
+    """Call ``save()``, allocating a slug first if blank and again after a clash."""
+    for attempt in range(RETRIES):
+        allocated = allocate_slugs([obj], source, field)
+        if not allocated:
+            return save()
+        try:
+            with transaction.atomic():
+                return save()
+        except IntegrityError:
+            if attempt == RETRIES - 1 or not _clashed(type(obj), field, allocated):
+                raise
+            setattr(obj, field, "")
+
+
+def bulk_create_with_slugs(model, objs, source, field="slug", **kwargs):
+    """``bulk_create`` with blank slugs allocated for the whole batch at once."""
+    objs = list(objs)
+    for attempt in range(RETRIES):
+        allocated = allocate_slugs(objs, source, field)
+        try:
+            with transaction.atomic():
+                return model.objects.bulk_create(objs, **kwargs)
+        except IntegrityError:
+            if attempt == RETRIES - 1 or not allocated:
+                raise
+            if not _clashed(model, field, allocated):
+                raise
+            for obj in allocated:
+                setattr(obj, field, "")
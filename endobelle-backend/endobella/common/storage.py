@@ -0,0 +1,114 @@
+"""
+Content-addressed file storage.
+
+Uploads are streamed to a temporary file in ``MEDIA_ROOT`` while their
+SHA-256 is computed, then moved to ``cas/<aa>/<bb>/<sha256><ext>``.
+``MediaBlob`` counts how many saves refer to a file. Its row is locked while
+the file is moved in or deleted, so a concurrent delete of the last
+reference cannot remove a file a save has just counted. Because a name
+always means the same bytes, media can be served with immutable cache
+headers (``endobella.common.views.media``).
+
+The ``upload_to`` directory of the field is ignored for new files; existing
+files keep their names and are handled like ``FileSystemStorage`` does.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import posixpath
+import tempfile
+
+from django.core.files.storage import FileSystemStorage
+from django.db import transaction
+from django.db.models import F
+
+CAS_PREFIX = "cas/"
+
+
+def is_content_addressed(name):
+    return name.replace("\\", "/").startswith(CAS_PREFIX)
+
+
+def content_hash(name):
+    """The SHA-256 a content-addressed ``name`` was stored under."""
+    return posixpath.splitext(posixpath.basename(name))[0]
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    def get_available_name(self, name, max_length=None):
+        # The final name is only known once the content has been hashed.
+        return name
+
+    def _save(self, name, content):
+        ext = posixpath.splitext(name)[1].lower()
+        tmp_dir = self.path(CAS_PREFIX + "tmp")
+        os.makedirs(tmp_dir, exist_ok=True)
+
+        digest = hashlib.sha256()
+        size = 0
+        if hasattr(content, "seek") and content.seekable():
+            content.seek(0)
+        with tempfile.NamedTemporaryFile(dir=tmp_dir, delete=False) as tmp:
+            try:
+                for chunk in content.chunks():
+                    if isinstance(chunk, str):
+                        chunk = chunk.encode()
+                    digest.update(chunk)
+                    tmp.write(chunk)
+                    size += len(chunk)
+            except BaseException:
+                tmp.close()
+                os.unlink(tmp.name)
+                raise
+
+        sha256 = digest.hexdigest()
+        name = f"{CAS_PREFIX}{sha256[:2]}/{sha256[2:4]}/{sha256}{ext}"
+        path = self.path(name)
+        try:
+            with transaction.atomic():
+                self._reference(name, size)
+                # delete() removes the file only while holding the blob's row
+                # lock, which is ours until commit, so the file we put here
+                # stays. The bytes are identical if it already exists.
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                if self.directory_permissions_mode is not None:
+                    os.chmod(os.path.dirname(path), self.directory_permissions_mode)
+                os.replace(tmp.name, path)
+                if self.file_permissions_mode is not None:
+                    os.chmod(path, self.file_permissions_mode)
+        except BaseException:
+            if os.path.exists(tmp.name):
+                os.unlink(tmp.name)
+            raise
+        return name
+
+    def delete(self, name):
+        """Drop one reference; the file goes with the last one."""
+        if not is_content_addressed(name):
+            return super().delete(name)
+
+        from endobella.common.models import MediaBlob
+
+        with transaction.atomic():
+            blob = MediaBlob.objects.select_for_update().filter(name=name).first()
+            if blob is not None and blob.refcount > 1:
+                MediaBlob.objects.filter(name=name).update(refcount=F("refcount") - 1)
+                return
+            if blob is not None:
+                blob.delete()
+            # Still under the row lock, so no _save() can reference the file
+            # between the row and the file going away.
+            super().delete(name)
+
+    @staticmethod
+    def _reference(name, size):
+        """Count one more reference, holding the blob's row lock until commit."""
+        from endobella.common.models import MediaBlob
+
+        blob, created = MediaBlob.objects.select_for_update().get_or_create(
+            name=name, defaults={"size": size, "refcount": 1}
+        )
+        if not created:
+            MediaBlob.objects.filter(pk=blob.pk).update(refcount=F("refcount") + 1)
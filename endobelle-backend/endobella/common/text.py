@@ -0,0 +1,13 @@
+"""Text normalization shared by the search and typeahead indexes."""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+
+
+def normalize(text):
+    """Lowercase words without accents or punctuation, single-spaced."""
+    text = unicodedata.normalize("NFKD", text.lower())
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return " ".join(re.findall(r"\w+", text))
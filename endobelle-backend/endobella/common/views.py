@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import Http404, HttpResponse, HttpResponseNotModified
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
+from django.views.static import serve
+from rest_framework import permissions
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from endobella.common.autocomplete import ORDERS, SOURCES, autocomplete
+from endobella.common.bootstrap import bootstrap_version, build_bootstrap
+from endobella.common.metrics import registry, timed
+from endobella.common.storage import content_hash, is_content_addressed
+from endobella.common.text import normalize
+
+
+def metrics(request):
+    """
+    Expose the in-process request metrics in Prometheus text format.
+
+    Only to ``PERFORMANCE_METRICS_ALLOWED_IPS``; nobody when it is empty.
+    """
+    if not getattr(settings, "PERFORMANCE_METRICS_ENABLED", True):
+        raise Http404
+    allowed = getattr(settings, "PERFORMANCE_METRICS_ALLOWED_IPS", ())
+    if request.META.get("REMOTE_ADDR") not in allowed:
+        raise Http404
+    return HttpResponse(
+        registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
+def media(request, path):
+    """
+    Serve ``MEDIA_ROOT``; content-addressed files are cached as immutable.
+
+    Their name is the hash of their bytes, so the hash doubles as a strong
+    ETag and revalidation never needs to touch the disk.
+    """
+    if not is_content_addressed(path):
+        return serve(request, path, document_root=settings.MEDIA_ROOT)
+
+    etag = quote_etag(content_hash(path))
+    if get_conditional_response(request, etag=etag) is not None:
+        response = HttpResponseNotModified()
+    else:
+        response = serve(request, path, document_root=settings.MEDIA_ROOT)
+    response["ETag"] = etag
+    patch_cache_control(
+        response, public=True, max_age=settings.MEDIA_CACHE_MAX_AGE, immutable=True
+    )
+    return response
+
+
+class BootstrapView(APIView):
+    """
+    Featured and latest articles, category menu and tag cloud in one call.
+
+    Responses carry an ETag of the content version. A matching
+    ``If-None-Match`` gets a 304 after the version queries alone, and built
+    payloads are cached per version and host.
+    """
+
+    permission_classes = [permissions.AllowAny]
+
+    def get(self, request):
+        version = bootstrap_version()
+        etag = quote_etag(version)
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            return not_modified
+
+        key = f"bootstrap:{version}:{request.get_host()}"
+        data = cache.get(key)
+        if data is None:
+            with timed(request, "serialize"):
+                data = build_bootstrap(request)
+            cache.set(key, data, settings.BOOTSTRAP_CACHE_TIMEOUT)
+
+        response = Response(data)
+        response["ETag"] = etag
+        patch_cache_control(response, public=True, max_age=settings.BOOTSTRAP_MAX_AGE)
+        return response
+
+
+class AutocompleteView(APIView):
+    """
+    ``?q=<prefix>`` lists the articles, products, categories and tags with a
+    word starting with it, from the in-memory index; a ``q`` without letters
+    or digits is rejected. ``types`` picks kinds
+    (comma separated), ``order`` is ``popular`` or ``recent``.
+    """
+
+    permission_classes = [permissions.AllowAny]
+    authentication_classes = []
+
+    def get(self, request):
+        params = request.query_params
+        query = params.get("q", "")
+        if not normalize(query):
+            raise ValidationError({"q": "Expected letters or digits."})
+        kinds = params.get("types", "").split(",") if params.get("types") else SOURCES
+        if unknown := set(kinds).difference(SOURCES):
+            raise ValidationError({"types": f"Unknown: {', '.join(sorted(unknown))}."})
+        order = params.get("order", "popular")
+        if order not in ORDERS:
+            raise ValidationError({"order": f"One of {', '.join(ORDERS)}."})
+        try:
+            limit = int(params.get("limit", settings.AUTOCOMPLETE_MAX_RESULTS))
+        except ValueError as exc:
+            raise ValidationError({"limit": "Expected an integer."}) from exc
+
+        with timed(request, "serialize"):
+            data = autocomplete.search(query, kinds, max(limit, 1), order)
+        response = Response(data)
+        patch_cache_control(
+            response, public=True, max_age=settings.AUTOCOMPLETE_MAX_AGE
+        )
+        return response
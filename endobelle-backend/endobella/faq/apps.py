@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+from django.apps import AppConfig
+
+
+class FaqConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "endobella.faq"
+    verbose_name = "FAQ index"
+
+    def ready(self):
+        from endobella.faq import signals  # noqa: F401
@@ -0,0 +1,184 @@
+"""
+Question index over article ``key_questions_answered`` and product
+``gaio_faq_data``.
+
+Every question of a published article or available product is stored once
+as a ``Question`` with its normalized text, and its significant words as
+``QuestionTerm`` rows. Saves keep it current (``endobella.faq.signals``);
+readers get parsed questions and answers without touching the source
+fields.
+
+``search`` finds the questions closest to a free-text query: one indexed
+``term IN (...)`` aggregate picks the questions sharing the most terms,
+which are then ranked by Jaccard similarity of their term sets.
+"""
+
+from __future__ import annotations
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count
+
+from endobella.common.text import normalize
+from endobella.faq.models import Question, QuestionTerm
+
+STOPWORDS = frozenset(
+    "a an and are as at be by can could do does for from has have how i if in "  # noqa: SIM905 (a word list reads better as one string)
+    "is it its me my of on or should so than that the their there these this "
+    "to was what when where which who why will with would you your".split()
+)
+MAX_TERM_LENGTH = QuestionTerm._meta.get_field("term").max_length
+MAX_NORMALIZED_LENGTH = Question._meta.get_field("normalized").max_length
+
+
+def terms(normalized):
+    """The significant words of a normalized question, crudely singularized."""
+    found = set()
+    for word in normalized.split():
+        if len(word) < 2 or word in STOPWORDS:
+            continue
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        found.add(word[:MAX_TERM_LENGTH])
+    return found
+
+
+def article_entries(article):
+    """``(question, answer)`` pairs of an article; none unless published."""
+    if not article.is_published:
+        return []
+    answer = article.content_abstract or article.excerpt or ""
+    return [
+        (line.strip(), answer)
+        for line in (article.key_questions_answered or "").splitlines()
+        if line.strip()
+    ]
+
+
+def product_entries(product):
+    """``(question, answer)`` pairs of a product; none unless available."""
+    if not product.is_available or not isinstance(product.gaio_faq_data, list):
+        return []
+    return [
+        (item["q"].strip(), str(item.get("a") or ""))
+        for item in product.gaio_faq_data
+        if isinstance(item, dict)
+        and isinstance(item.get("q"), str)
+        and item["q"].strip()
+    ]
+
+
+def _build(owner, entries):
+    questions, question_terms = [], []
+    for position, (text, answer) in enumerate(entries):
+        normalized = normalize(text)
+        found = terms(normalized)
+        questions.append(
+            Question(
+                position=position,
+                text=text,
+                answer=answer,
+                normalized=normalized[:MAX_NORMALIZED_LENGTH],
+                term_count=len(found),
+                **owner,
+            )
+        )
+        question_terms.append(found)
+    return questions, question_terms
+
+
+def _write(questions, question_terms):
+    questions = Question.objects.bulk_create(questions, batch_size=1000)
+    QuestionTerm.objects.bulk_create(
+        (
+            QuestionTerm(question=question, term=term)
+            for question, found in zip(questions, question_terms)
+            for term in found
+        ),
+        batch_size=1000,
+    )
+
+
+def _sync(owner, entries):
+    current = list(
+        Question.objects.filter(**owner)
+        .order_by("position")
+        .values_list("text", "answer")
+    )
+    if current == entries:
+        return
+    with transaction.atomic():
+        Question.objects.filter(**owner).delete()
+        _write(*_build(owner, entries))
+
+
+def sync_article(article):
+    _sync({"article": article}, article_entries(article))
+
+
+def sync_product(product):
+    _sync({"product": product}, product_entries(product))
+
+
+def rebuild(articles=(), products=()):
+    """Replace the questions of ``articles`` and ``products``; for bulk writes."""
+    articles, products = list(articles), list(products)
+    questions, question_terms = [], []
+    for owner, entries in [
+        *(({"article": a}, article_entries(a)) for a in articles),
+        *(({"product": p}, product_entries(p)) for p in products),
+    ]:
+        built_questions, built_terms = _build(owner, entries)
+        questions += built_questions
+        question_terms += built_terms
+    with transaction.atomic():
+        if articles:
+            Question.objects.filter(article__in=[a.pk for a in articles]).delete()
+        if products:
+            Question.objects.filter(product__in=[p.pk for p in products]).delete()
+        _write(questions, question_terms)
+
+
+def search(query, limit=10):
+    """
+    Questions most similar to ``query``, best first, each with a ``score``
+    between 0 and 1.
+    """
+    normalized = normalize(query)
+    query_terms = terms(normalized)
+    questions = Question.objects.select_related("article", "product").only(
+        "text",
+        "answer",
+        "normalized",
+        "term_count",
+        "article",
+        "product",
+        "article__slug",
+        "article__title",
+        "product__slug",
+        "product__name",
+    )
+    if not query_terms:
+        # Only stopwords: fall back to the exact normalized question.
+        matches = list(questions.filter(normalized=normalized)[:limit])
+        for question in matches:
+            question.score = 1.0
+        return matches
+
+    hits = dict(
+        QuestionTerm.objects.filter(term__in=query_terms)
+        .values("question")
+        .annotate(hits=Count("pk"))
+        .order_by("-hits")
+        .values_list("question", "hits")[: settings.FAQ_SEARCH_CANDIDATES]
+    )
+    ranked = []
+    for question in questions.filter(pk__in=hits):
+        shared = hits[question.pk]
+        question.score = shared / (len(query_terms) + question.term_count - shared)
+        if question.normalized == normalized:
+            question.score = 1.0
+        if question.score >= settings.FAQ_SEARCH_MIN_SCORE:
+            ranked.append(question)
+    ranked.sort(key=lambda question: (-question.score, question.pk))
+    return ranked[:limit]
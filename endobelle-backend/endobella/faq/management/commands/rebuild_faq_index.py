@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from endobella.articles.models import Article
+from endobella.faq import index
+from endobella.faq.models import Question
+from endobella.shop.models import Product
+
+
+class Command(BaseCommand):
+    help = (
+        "Re-extract FAQ questions from every article and product. Needed "
+        "after bulk writes, which bypass signals."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        size = options["batch_size"]
+        sources = [
+            (
+                "articles",
+                Article.objects.only(
+                    "is_published",
+                    "key_questions_answered",
+                    "content_abstract",
+                    "excerpt",
+                ),
+            ),
+            ("products", Product.objects.only("is_available", "gaio_faq_data")),
+        ]
+        for label, queryset in sources:
+            batch = []
+            for item in queryset.order_by("pk").iterator(chunk_size=size):
+                batch.append(item)
+                if len(batch) == size:
+                    index.rebuild(**{label: batch})
+                    batch = []
+            index.rebuild(**{label: batch})
+        self.stdout.write(
+            f"Indexed {Question.objects.count()} questions in "
+            f"{time.perf_counter() - start:.1f}s"
+        )
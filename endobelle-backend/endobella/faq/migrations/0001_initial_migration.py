@@ -0,0 +1,187 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:13
+
+import re
+import unicodedata
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# Frozen copies of endobella.faq.index as of this migration.
+STOPWORDS = frozenset(
+    "a an and are as at be by can could do does for from has have how i if in "  # noqa: SIM905 (a word list reads better as one string)
+    "is it its me my of on or should so than that the their there these this "
+    "to was what when where which who why will with would you your".split()
+)
+MAX_TERM_LENGTH = 64
+MAX_NORMALIZED_LENGTH = 255
+
+
+def normalize(text):
+    text = unicodedata.normalize("NFKD", text.lower())
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return " ".join(re.findall(r"\w+", text))
+
+
+def terms(normalized):
+    found = set()
+    for word in normalized.split():
+        if len(word) < 2 or word in STOPWORDS:
+            continue
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        found.add(word[:MAX_TERM_LENGTH])
+    return found
+
+
+def article_entries(article):
+    if not article.is_published:
+        return []
+    answer = article.content_abstract or article.excerpt or ""
+    return [
+        (line.strip(), answer)
+        for line in (article.key_questions_answered or "").splitlines()
+        if line.strip()
+    ]
+
+
+def product_entries(product):
+    if not product.is_available or not isinstance(product.gaio_faq_data, list):
+        return []
+    return [
+        (item["q"].strip(), str(item.get("a") or ""))
+        for item in product.gaio_faq_data
+        if isinstance(item, dict)
+        and isinstance(item.get("q"), str)
+        and item["q"].strip()
+    ]
+
+
+def index_existing_questions(apps, schema_editor):
+    Question = apps.get_model("faq", "Question")
+    QuestionTerm = apps.get_model("faq", "QuestionTerm")
+    sources = [
+        ("article", apps.get_model("articles", "Article"), article_entries),
+        ("product", apps.get_model("shop", "Product"), product_entries),
+    ]
+    for owner, model, entries in sources:
+        questions, question_terms = [], []
+        for item in model.objects.iterator(chunk_size=500):
+            for position, (text, answer) in enumerate(entries(item)):
+                normalized = normalize(text)
+                found = terms(normalized)
+                questions.append(
+                    Question(
+                        position=position,
+                        text=text,
+                        answer=answer,
+                        normalized=normalized[:MAX_NORMALIZED_LENGTH],
+                        term_count=len(found),
+                        **{f"{owner}_id": item.pk},
+                    )
+                )
+                question_terms.append(found)
+        questions = Question.objects.bulk_create(questions, batch_size=1000)
+        QuestionTerm.objects.bulk_create(
+            (
+                QuestionTerm(question=question, term=term)
+                for question, found in zip(questions, question_terms)
+                for term in found
+            ),
+            batch_size=1000,
+        )
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("articles", "0008_bootstrap_indexes"),
+        ("shop", "0005_product_facts"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Question",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("position", models.PositiveSmallIntegerField()),
+                ("text", models.TextField()),
+                ("answer", models.TextField(blank=True)),
+                ("normalized", models.CharField(db_index=True, max_length=255)),
+                ("term_count", models.PositiveSmallIntegerField()),
+                (
+                    "article",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="faq_questions",
+                        to="articles.article",
+                    ),
+                ),
+                (
+                    "product",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="faq_questions",
+                        to="shop.product",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["position"],
+            },
+        ),
+        migrations.CreateModel(
+            name="QuestionTerm",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("term", models.CharField(max_length=64)),
+                (
+                    "question",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="terms",
+                        to="faq.question",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="question",
+            constraint=models.CheckConstraint(
+                condition=models.Q(
+                    models.Q(("article__isnull", False), ("product__isnull", True)),
+                    models.Q(("article__isnull", True), ("product__isnull", False)),
+                    _connector="OR",
+                ),
+                name="faq_question_single_owner",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="questionterm",
+            constraint=models.UniqueConstraint(
+                fields=("term", "question"), name="unique_faq_question_term"
+            ),
+        ),
+        migrations.RunPython(index_existing_questions, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,63 @@
+from django.db import models
+
+from endobella.articles.models import Article
+from endobella.shop.models import Product
+
+
+class Question(models.Model):
+    """
+    A question answered by a published article or an available product,
+    extracted by ``endobella.faq.index``.
+    """
+
+    article = models.ForeignKey(
+        Article,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="faq_questions",
+    )
+    product = models.ForeignKey(
+        Product,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="faq_questions",
+    )
+    position = models.PositiveSmallIntegerField()
+    text = models.TextField()
+    answer = models.TextField(blank=True)
+    normalized = models.CharField(max_length=255, db_index=True)
+    term_count = models.PositiveSmallIntegerField()
+
+    class Meta:
+        ordering = ["position"]
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(article__isnull=False, product__isnull=True)
+                | models.Q(article__isnull=True, product__isnull=False),
+                name="faq_question_single_owner",
+            )
+        ]
+
+    def __str__(self):
+        return self.text
+
+
+class QuestionTerm(models.Model):
+    """Inverted index entry: ``term`` occurs in ``question``."""
+
+    question = models.ForeignKey(
+        Question, on_delete=models.CASCADE, related_name="terms"
+    )
+    term = models.CharField(max_length=64)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["term", "question"], name="unique_faq_question_term"
+            )
+        ]
+
+    def __str__(self):
+        return self.term
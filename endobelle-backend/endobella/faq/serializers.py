@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from rest_framework import serializers
+
+from endobella.articles.models import Article
+from endobella.faq.models import Question
+from endobella.shop.models import Product
+
+
+class QuestionArticleSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Article
+        fields = ["slug", "title"]
+
+
+class QuestionProductSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Product
+        fields = ["slug", "name"]
+
+
+class QuestionSerializer(serializers.ModelSerializer):
+    article = QuestionArticleSerializer(read_only=True)
+    product = QuestionProductSerializer(read_only=True)
+    score = serializers.FloatField(read_only=True, required=False)
+
+    class Meta:
+        model = Question
+        fields = ["text", "answer", "score", "article", "product"]
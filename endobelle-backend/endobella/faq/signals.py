@@ -0,0 +1,36 @@
+"""
+Keep the question index in step with article and product saves.
+
+The index is rewritten in the same transaction as the save, and only when
+the parsed questions or answers changed. Bulk writes bypass signals; run
+``rebuild_faq_index`` after them. Deletes cascade.
+"""
+
+from __future__ import annotations
+
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from endobella.articles.models import Article
+from endobella.faq import index
+from endobella.shop.models import Product
+
+ARTICLE_FIELDS = {
+    "key_questions_answered",
+    "is_published",
+    "content_abstract",
+    "excerpt",
+}
+PRODUCT_FIELDS = {"gaio_faq_data", "is_available"}
+
+
+@receiver(post_save, sender=Article, dispatch_uid="faq_index_article")
+def article_saved(sender, instance, raw=False, update_fields=None, **kwargs):
+    if not raw and (update_fields is None or ARTICLE_FIELDS & set(update_fields)):
+        index.sync_article(instance)
+
+
+@receiver(post_save, sender=Product, dispatch_uid="faq_index_product")
+def product_saved(sender, instance, raw=False, update_fields=None, **kwargs):
+    if not raw and (update_fields is None or PRODUCT_FIELDS & set(update_fields)):
+        index.sync_product(instance)
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from rest_framework import permissions
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from endobella.common.metrics import timed
+from endobella.faq import index
+from endobella.faq.models import Question
+from endobella.faq.serializers import QuestionSerializer
+
+MAX_LIMIT = 50
+
+
+class QuestionSearchView(APIView):
+    """
+    ``?q=<question>`` lists the indexed questions closest to it with the
+    content that answers them. ``?article=<slug>`` or ``?product=<slug>``
+    lists that item's questions in order, e.g. for FAQPage markup.
+    """
+
+    permission_classes = [permissions.AllowAny]
+
+    def get(self, request):
+        params = request.query_params
+        if "article" in params or "product" in params:
+            owner = "article" if "article" in params else "product"
+            questions = (
+                Question.objects.filter(**{f"{owner}__slug": params[owner]})
+                .select_related(owner)
+                .order_by("position")
+            )
+        elif params.get("q", "").strip():
+            try:
+                limit = min(int(params.get("limit", 10)), MAX_LIMIT)
+            except ValueError as exc:
+                raise ValidationError({"limit": "Expected an integer."}) from exc
+            questions = index.search(params["q"], limit=max(limit, 1))
+        else:
+            raise ValidationError({"q": "A question, article or product is required."})
+
+        with timed(request, "serialize"):
+            data = QuestionSerializer(questions, many=True).data
+        return Response(data)
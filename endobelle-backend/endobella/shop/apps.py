@@ -6,3 +6,10 @@ from django.apps import AppConfig
 class ShopConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "endobella.shop"
+
+    def ready(self):
+        from endobella.common import revalidation
+        from endobella.shop import signals  # noqa: F401
+        from endobella.shop.models import Product
+
+        revalidation.track(Product, revalidation.product_keys)
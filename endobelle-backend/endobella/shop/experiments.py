@@ -0,0 +1,189 @@
+"""
+A/B tests of product descriptions.
+
+The variants live in ``Product.gaio_description_variants``::
+
+    {
+        "salt": "spring",  # optional; change it to reshuffle visitors
+        "variants": [
+            {"key": "a", "description": "...", "weight": 1},
+            {"key": "b", "description": "...", "weight": 2},
+        ],
+    }
+
+A visitor is assigned by hashing the salt, product and visitor id onto the
+cumulative weights, so the same visitor always sees the same variant and
+assignment needs nothing beyond the product row already being served.
+
+Impressions and conversions are counted in memory by ``ExperimentCounter``
+and flushed in batches to ``DescriptionVariantStats``, one row per variant
+and day. The product row is only written by ``rollup``, which copies the
+totals into the ``stats`` key of the JSON field.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import defaultdict
+from itertools import accumulate
+
+from django.db import transaction
+from django.db.models import F, Sum
+from django.db.models.functions import Now
+from django.utils import timezone
+
+from endobella.common.counters import BufferedCounter
+from endobella.shop.models import DescriptionVariantStats, Product
+
+IMPRESSIONS = "impressions"
+CONVERSIONS = "conversions"
+MAX_KEY_LENGTH = DescriptionVariantStats._meta.get_field("variant").max_length
+
+
+def variants(data):
+    """The usable variants of a ``gaio_description_variants`` value."""
+    if not isinstance(data, dict) or not isinstance(data.get("variants"), list):
+        return []
+    usable = []
+    for variant in data["variants"]:
+        if not isinstance(variant, dict):
+            continue
+        key, weight = variant.get("key"), variant.get("weight", 1)
+        if (
+            isinstance(key, str)
+            and 0 < len(key) <= MAX_KEY_LENGTH
+            and isinstance(weight, (int, float))
+            and weight > 0
+        ):
+            usable.append(variant)
+    return usable
+
+
+def assign(product_id, data, visitor):
+    """The variant dict ``visitor`` sees for this product, or None."""
+    options = variants(data)
+    if not options:
+        return None
+    digest = hashlib.blake2b(
+        f"{data.get('salt', '')}:{product_id}:{visitor}".encode(), digest_size=8
+    ).digest()
+    bounds = list(accumulate(variant.get("weight", 1) for variant in options))
+    point = int.from_bytes(digest, "big") / 2**64 * bounds[-1]
+    for variant, bound in zip(options, bounds):
+        if point < bound:
+            return variant
+    return options[-1]
+
+
+class ExperimentCounter(BufferedCounter):
+    """
+    Impressions and conversions per ``(product_id, variant)``, flushed on the
+    ``VIEW_COUNT_*`` schedule into the stats row of the current day.
+    """
+
+    def __init__(self):
+        super().__init__(DescriptionVariantStats)
+
+    def impression(self, product_id, variant):
+        self.add((product_id, variant, IMPRESSIONS))
+
+    def conversion(self, product_id, variant):
+        self.add((product_id, variant, CONVERSIONS))
+
+    def _write(self, counts):
+        day = timezone.now().date()
+        product_ids = set(
+            Product.objects.filter(
+                pk__in={product_id for product_id, _, _ in counts}
+            ).values_list("pk", flat=True)
+        )
+        # Counts of deleted products are dropped rather than retried forever.
+        pairs = sorted(
+            {
+                (product_id, variant)
+                for product_id, variant, _ in counts
+                if product_id in product_ids
+            }
+        )
+        DescriptionVariantStats.objects.bulk_create(
+            [
+                DescriptionVariantStats(product_id=product_id, variant=variant, day=day)
+                for product_id, variant in pairs
+            ],
+            ignore_conflicts=True,
+        )
+        rows = {
+            (product_id, variant): pk
+            for pk, product_id, variant in DescriptionVariantStats.objects.filter(
+                product__in=product_ids, day=day
+            ).values_list("pk", "product_id", "variant")
+        }
+
+        # Rows with the same increment share one UPDATE, as in BufferedCounter.
+        groups = defaultdict(list)
+        for (product_id, variant, event), count in counts.items():
+            if (product_id, variant) in rows:
+                groups[event, count].append(rows[product_id, variant])
+        for event, count in sorted(groups):
+            DescriptionVariantStats.objects.filter(
+                pk__in=sorted(groups[event, count])
+            ).update(**{event: F(event) + count}, updated_at=Now())
+        return len(pairs)
+
+
+def rollup(since=None, batch_size=500):
+    """
+    Write the variant totals into ``gaio_description_variants["stats"]`` of
+    the products with stats changed since ``since`` (all when None).
+    Returns the number of products updated.
+    """
+    stats = DescriptionVariantStats.objects.order_by()
+    if since is not None:
+        stats = stats.filter(updated_at__gte=since)
+    product_ids = sorted(set(stats.values_list("product_id", flat=True)))
+    updated = 0
+    for start in range(0, len(product_ids), batch_size):
+        batch = product_ids[start : start + batch_size]
+        totals = defaultdict(dict)
+        for row in (
+            DescriptionVariantStats.objects.filter(product__in=batch)
+            .values("product", "variant")
+            .annotate(total_impressions=Sum(IMPRESSIONS))
+            .annotate(total_conversions=Sum(CONVERSIONS))
+            .order_by()
+        ):
+            totals[row["product"]][row["variant"]] = row
+        rolled_up_at = timezone.now().isoformat()
+        with transaction.atomic():
+            # Locked so a concurrent edit of the variants is not overwritten.
+            products = list(
+                Product.objects.select_for_update()
+                .filter(pk__in=batch)
+                .only("pk", "gaio_description_variants")
+            )
+            products = [
+                product
+                for product in products
+                if isinstance(product.gaio_description_variants, dict)
+            ]
+            for product in products:
+                data = product.gaio_description_variants
+                data["stats"] = {}
+                for variant in variants(data):
+                    row = totals[product.pk].get(variant["key"])
+                    if row is None:
+                        continue
+                    impressions = row["total_impressions"]
+                    conversions = row["total_conversions"]
+                    data["stats"][variant["key"]] = {
+                        IMPRESSIONS: impressions,
+                        CONVERSIONS: conversions,
+                        "conversion_rate": (
+                            round(conversions / impressions, 4) if impressions else 0.0
+                        ),
+                    }
+                data["stats_updated_at"] = rolled_up_at
+            updated += Product.objects.bulk_update(
+                products, ["gaio_description_variants"]
+            )
+    return updated
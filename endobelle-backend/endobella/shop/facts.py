@@ -0,0 +1,157 @@
+"""
+Indexed lookups on the GAIO JSON fields of ``Product``.
+
+``gaio_filter(kind, key, value)`` matches products whose JSON holds that
+value exactly:
+
+* ``fact``: ``gaio_structured_facts[key] == value`` (or a list containing it);
+* ``feature``, ``persona``, ``faq``: an item of ``gaio_key_features``,
+  ``gaio_target_personas`` or ``gaio_faq_data`` with ``item[key] == value``.
+
+On PostgreSQL this is a JSON containment (``@>``) query served by the
+``jsonb_path_ops`` GIN indexes of migration ``shop.0005``. Elsewhere it is a
+lookup in ``ProductFact``, a side table of the same values kept in sync
+on save, which also backs facet counts on every backend.
+
+Scalars are compared as text, so ``"5"`` finds ``5``. Values longer than
+``MAX_VALUE_LENGTH`` are not extracted and only match on PostgreSQL.
+"""
+
+from __future__ import annotations
+
+import json
+
+from django.db import connection, transaction
+from django.db.models import Count, Q
+
+from endobella.shop.models import ProductFact
+
+Kind = ProductFact.Kind
+
+# Kind -> JSON field; the list fields hold one dict per item.
+FIELDS = {
+    Kind.FACT: "gaio_structured_facts",
+    Kind.FEATURE: "gaio_key_features",
+    Kind.PERSONA: "gaio_target_personas",
+    Kind.FAQ: "gaio_faq_data",
+}
+# The item key each list kind is usually filtered on.
+DEFAULT_KEYS = {Kind.FEATURE: "feature", Kind.PERSONA: "persona", Kind.FAQ: "q"}
+
+MAX_KEY_LENGTH = ProductFact._meta.get_field("key").max_length
+MAX_VALUE_LENGTH = ProductFact._meta.get_field("value").max_length
+
+
+def _text(value):
+    return value if isinstance(value, str) else json.dumps(value)
+
+
+def _scalars(value):
+    if isinstance(value, list):
+        for item in value:
+            if not isinstance(item, (list, dict)):
+                yield item
+    elif not isinstance(value, dict) and value is not None:
+        yield value
+
+
+def extract_facts(product):
+    """Yield the ``(kind, key, value)`` triples indexed for ``product``."""
+    for kind, field in FIELDS.items():
+        data = getattr(product, field) or {}
+        if kind == Kind.FACT:
+            pairs = data.items() if isinstance(data, dict) else ()
+        else:
+            items = data if isinstance(data, list) else ()
+            pairs = (
+                pair
+                for item in items
+                if isinstance(item, dict)
+                for pair in item.items()
+            )
+        for key, value in pairs:
+            for scalar in _scalars(value):
+                text = _text(scalar)
+                if len(key) <= MAX_KEY_LENGTH and len(text) <= MAX_VALUE_LENGTH:
+                    yield kind, key, text
+
+
+def sync_product_facts(product):
+    """Bring the side table of one product in line with its JSON fields."""
+    wanted = set(extract_facts(product))
+    existing = {
+        (kind, key, value): pk
+        for pk, kind, key, value in ProductFact.objects.filter(
+            product=product
+        ).values_list("pk", "kind", "key", "value")
+    }
+    stale = [pk for fact, pk in existing.items() if fact not in wanted]
+    new = wanted.difference(existing)
+    if not stale and not new:
+        return
+    with transaction.atomic():
+        if stale:
+            ProductFact.objects.filter(pk__in=stale).delete()
+        ProductFact.objects.bulk_create(
+            ProductFact(product=product, kind=kind, key=key, value=value)
+            for kind, key, value in new
+        )
+
+
+def rebuild_product_facts(products):
+    """Replace the side-table rows of ``products``; for bulk writes."""
+    products = list(products)
+    with transaction.atomic():
+        ProductFact.objects.filter(product__in=[p.pk for p in products]).delete()
+        ProductFact.objects.bulk_create(
+            (
+                ProductFact(product=product, kind=kind, key=key, value=value)
+                for product in products
+                for kind, key, value in set(extract_facts(product))
+            ),
+            batch_size=1000,
+        )
+
+
+def _json_candidates(value):
+    """``value`` as given plus the JSON scalar it spells, if any."""
+    candidates = [value]
+    try:
+        parsed = json.loads(value)
+    except ValueError:
+        return candidates
+    if not isinstance(parsed, (str, list, dict)):
+        candidates.append(parsed)
+    return candidates
+
+
+def gaio_filter(kind, key, value):
+    """A ``Q`` for products whose ``kind`` JSON field has ``key == value``."""
+    kind = Kind(kind)
+    if connection.vendor != "postgresql":
+        # IN rather than a correlated EXISTS, so that matching products are
+        # found through product_fact_lookup_idx instead of probing per row.
+        matching = ProductFact.objects.filter(kind=kind, key=key, value=value)
+        return Q(pk__in=matching.values("product_id"))
+    lookup = f"{FIELDS[kind]}__contains"
+    condition = Q()
+    for candidate in _json_candidates(value):
+        if kind == Kind.FACT:
+            condition |= Q(**{lookup: {key: candidate}})
+            condition |= Q(**{lookup: {key: [candidate]}})
+        else:
+            condition |= Q(**{lookup: [{key: candidate}]})
+            condition |= Q(**{lookup: [{key: [candidate]}]})
+    return condition
+
+
+def facet_counts(products, kind=Kind.FACT, limit=50):
+    """The most common ``(key, value)`` pairs among ``products``, with counts."""
+    return list(
+        ProductFact.objects.filter(
+            kind=kind, product__in=products.order_by().values("pk")
+        )
+        .values("key", "value")
+        .annotate(count=Count("product"))
+        .order_by("-count", "key", "value")[:limit]
+    )
@@ -0,0 +1,172 @@
+"""
+Apply ERP stock and price exports to ``ProductVariant``.
+
+Rows are read lazily from CSV or JSON Lines and handled in SKU batches: one
+query loads the current values of a batch, and only the variants that
+differ are written with ``bulk_update`` in the batch's own transaction.
+Product price summaries are refreshed once at the end for every product
+that had a variant changed, instead of once per row or batch.
+
+A row needs a ``sku``. ``stock_quantity``, ``price`` and ``discount_price``
+are optional; a missing column leaves the field alone, and an empty
+``discount_price`` removes the discount. A JSONL line that does not parse
+to an object is reported as an invalid row with its line number, like a
+row with a bad value, instead of stopping the sync.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+from collections import Counter
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+
+from django.db import transaction
+
+from endobella.shop.models import Product, ProductVariant
+
+SYNC_FIELDS = ("stock_quantity", "price", "discount_price")
+CENT = Decimal("0.01")
+
+
+class InvalidRow(ValueError):
+    pass
+
+
+@dataclass
+class SyncReport:
+    rows: int = 0
+    matched: int = 0
+    changed: int = 0
+    unknown: int = 0
+    invalid: int = 0
+    products: int = 0
+    fields: Counter = field(default_factory=Counter)
+    errors: list = field(default_factory=list)
+
+
+def read_rows(stream, format="csv"):
+    """
+    Yield row dicts from a text stream of CSV (with header) or JSONL.
+
+    A JSONL line that is not a JSON object is yielded as an ``InvalidRow``,
+    which ``parse_row`` raises.
+    """
+    if format == "csv":
+        yield from csv.DictReader(stream)
+    elif format == "jsonl":
+        for number, line in enumerate(stream, 1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as exc:
+                row = InvalidRow(f"line {number}: invalid JSON ({exc})")
+            else:
+                if not isinstance(row, dict):
+                    row = InvalidRow(
+                        f"line {number}: expected an object, "
+                        f"got {type(row).__name__}"
+                    )
+            yield row
+    else:
+        raise ValueError(f"Unknown inventory format: {format}")
+
+
+def _price(value):
+    try:
+        price = Decimal(str(value).strip()).quantize(CENT)
+    except InvalidOperation as exc:
+        raise InvalidRow(f"invalid price {value!r}") from exc
+    if price < 0:
+        raise InvalidRow(f"negative price {value!r}")
+    return price
+
+
+def parse_row(row):
+    """Return ``(sku, {field: value})`` with only the fields present."""
+    if isinstance(row, InvalidRow):
+        raise row
+    sku = str(row.get("sku") or "").strip()
+    if not sku:
+        raise InvalidRow("missing sku")
+    values = {}
+    if row.get("stock_quantity") not in (None, ""):
+        try:
+            values["stock_quantity"] = int(row["stock_quantity"])
+        except (TypeError, ValueError) as exc:
+            raise InvalidRow(f"invalid stock {row['stock_quantity']!r}") from exc
+        if values["stock_quantity"] < 0:
+            raise InvalidRow(f"negative stock {row['stock_quantity']!r}")
+    if row.get("price") not in (None, ""):
+        values["price"] = _price(row["price"])
+    if "discount_price" in row:
+        discount = row["discount_price"]
+        values["discount_price"] = None if discount in (None, "") else _price(discount)
+    return sku, values
+
+
+def sync(rows, batch_size=1000, dry_run=False, max_errors=20):
+    """Apply ``rows`` and return a ``SyncReport``."""
+    report = SyncReport()
+    product_ids = set()
+    rows = iter(rows)
+    try:
+        while batch := list(islice(rows, batch_size)):
+            updates = {}
+            for row in batch:
+                report.rows += 1
+                try:
+                    sku, values = parse_row(row)
+                except InvalidRow as exc:
+                    report.invalid += 1
+                    if len(report.errors) < max_errors:
+                        report.errors.append(f"row {report.rows}: {exc}")
+                    continue
+                # A SKU repeated in the file: later columns win.
+                updates.setdefault(sku, {}).update(values)
+            changed = _apply_batch(updates, report, dry_run)
+            product_ids.update(variant.product_id for variant in changed)
+    finally:
+        # Also refresh what earlier batches committed if a later one fails.
+        report.products = len(product_ids)
+        if product_ids and not dry_run:
+            _refresh(product_ids, batch_size)
+    return report
+
+
+def _apply_batch(updates, report, dry_run):
+    variants = ProductVariant.objects.filter(sku__in=updates).only(
+        "pk", "sku", "product_id", *SYNC_FIELDS
+    )
+    changed, fields = [], set()
+    for variant in variants:
+        report.matched += 1
+        dirty = False
+        for name, value in updates.pop(variant.sku).items():
+            if getattr(variant, name) != value:
+                setattr(variant, name, value)
+                fields.add(name)
+                report.fields[name] += 1
+                dirty = True
+        if dirty:
+            changed.append(variant)
+    report.unknown += len(updates)
+    report.changed += len(changed)
+
+    if changed and not dry_run:
+        with transaction.atomic():
+            ProductVariant.objects.without_summary_refresh().bulk_update(
+                changed, sorted(fields)
+            )
+    return changed
+
+
+def _refresh(product_ids, batch_size):
+    product_ids = sorted(product_ids)
+    for start in range(0, len(product_ids), batch_size):
+        Product.objects.filter(
+            pk__in=product_ids[start : start + batch_size]
+        ).refresh_price_summaries()
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from endobella.shop.facts import FIELDS, rebuild_product_facts
+from endobella.shop.models import Product
+
+
+class Command(BaseCommand):
+    help = (
+        "Re-extract the ProductFact side table from the GAIO JSON fields of "
+        "every product. Needed after bulk writes, which bypass signals."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        products = Product.objects.order_by("pk").only("pk", *FIELDS.values())
+        batch, done = [], 0
+        for product in products.iterator(chunk_size=options["batch_size"]):
+            batch.append(product)
+            if len(batch) == options["batch_size"]:
+                rebuild_product_facts(batch)
+                done += len(batch)
+                batch = []
+        rebuild_product_facts(batch)
+        done += len(batch)
+        self.stdout.write(
+            f"Rebuilt facts of {done} products in {time.perf_counter() - start:.1f}s"
+        )
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from endobella.shop.models import Product
+from endobella.shop.search import refresh_documents
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the search document of every product. Needed after bulk "
+        "writes, which bypass signals."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        product_ids = Product.objects.order_by("pk").values_list("pk", flat=True)
+        batch, done, changed = [], 0, 0
+        for product_id in product_ids.iterator(chunk_size=options["batch_size"]):
+            batch.append(product_id)
+            if len(batch) == options["batch_size"]:
+                changed += refresh_documents(batch)
+                done += len(batch)
+                batch = []
+        changed += refresh_documents(batch)
+        done += len(batch)
+        self.stdout.write(
+            f"Checked {done} products, updated {changed}, "
+            f"in {time.perf_counter() - start:.1f}s"
+        )
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from endobella.shop.models import Product
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the price range, discount and stock flags of every product "
+        "from its variants. Needed after raw SQL or fixture loads."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        ids = Product.objects.order_by("pk").values_list("pk", flat=True)
+        refreshed = 0
+        last = None
+        while True:
+            batch = ids.filter(pk__gt=last) if last is not None else ids
+            batch = list(batch[: options["batch_size"]])
+            if not batch:
+                break
+            refreshed += Product.objects.filter(pk__in=batch).refresh_price_summaries()
+            last = batch[-1]
+        self.stdout.write(
+            f"Refreshed {refreshed} products in {time.perf_counter() - start:.1f}s"
+        )
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from endobella.shop import experiments
+
+
+class Command(BaseCommand):
+    help = (
+        "Copy description A/B test totals into the products' "
+        "gaio_description_variants. Run periodically, more often than "
+        "EXPERIMENT_ROLLUP_LOOKBACK_SECONDS."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Roll up every product with stats, not only recent ones.",
+        )
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        since = None
+        if not options["all"]:
+            since = timezone.now() - timedelta(
+                seconds=settings.EXPERIMENT_ROLLUP_LOOKBACK_SECONDS
+            )
+        updated = experiments.rollup(since, batch_size=options["batch_size"])
+        self.stdout.write(
+            f"Rolled up {updated} products in {time.perf_counter() - start:.1f}s"
+        )
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import sys
+import time
+from contextlib import ExitStack
+
+from django.core.management.base import BaseCommand, CommandError
+
+from endobella.shop import inventory
+
+
+class Command(BaseCommand):
+    help = (
+        "Update variant stock and prices from a CSV or JSONL export keyed by "
+        "SKU, writing only rows that changed. Use '-' to read stdin."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument("--format", choices=["csv", "jsonl"])
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--dry-run", action="store_true")
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        format = options["format"] or ("jsonl" if path.endswith(".jsonl") else "csv")
+        start = time.perf_counter()
+        with ExitStack() as stack:
+            if path == "-":
+                stream = sys.stdin
+            else:
+                try:
+                    stream = stack.enter_context(open(path, newline=""))
+                except OSError as exc:
+                    raise CommandError(exc) from exc
+            report = inventory.sync(
+                inventory.read_rows(stream, format),
+                batch_size=options["batch_size"],
+                dry_run=options["dry_run"],
+            )
+        elapsed = time.perf_counter() - start
+
+        for error in report.errors:
+            self.stderr.write(error)
+        fields = ", ".join(f"{name} {n}" for name, n in sorted(report.fields.items()))
+        self.stdout.write(
+            f"{'Would change' if options['dry_run'] else 'Changed'} "
+            f"{report.changed} of {report.matched} matched variants"
+            f"{f' ({fields})' if fields else ''} on {report.products} products; "
+            f"{report.unknown} unknown SKUs, {report.invalid} invalid rows"
+        )
+        self.stdout.write(
+            f"{report.rows} rows in {elapsed:.2f}s "
+            f"({report.rows / elapsed if elapsed else 0:.0f} rows/s)"
+        )
@@ -0,0 +1,405 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:29
+
+import uuid
+
+import django.core.validators
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Tag",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "name",
+                    models.CharField(
+                        help_text="The name of the object.", max_length=255
+                    ),
+                ),
+                (
+                    "slug",
+                    models.SlugField(
+                        blank=True,
+                        help_text="A URL-friendly version of the name. Auto-generated if left blank.",
+                        max_length=255,
+                        unique=True,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["name"],
+            },
+        ),
+        migrations.CreateModel(
+            name="Category",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "name",
+                    models.CharField(
+                        help_text="The name of the object.", max_length=255
+                    ),
+                ),
+                (
+                    "slug",
+                    models.SlugField(
+                        blank=True,
+                        help_text="A URL-friendly version of the name. Auto-generated if left blank.",
+                        max_length=255,
+                        unique=True,
+                    ),
+                ),
+                (
+                    "parent",
+                    models.ForeignKey(
+                        blank=True,
+                        help_text="The parent category, for creating a hierarchy.",
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="children",
+                        to="shop.category",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Category",
+                "verbose_name_plural": "Categories",
+                "ordering": ["name"],
+            },
+        ),
+        migrations.CreateModel(
+            name="Product",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "name",
+                    models.CharField(
+                        help_text="The name of the object.", max_length=255
+                    ),
+                ),
+                (
+                    "slug",
+                    models.SlugField(
+                        blank=True,
+                        help_text="A URL-friendly version of the name. Auto-generated if left blank.",
+                        max_length=255,
+                        unique=True,
+                    ),
+                ),
+                (
+                    "short_description",
+                    models.TextField(
+                        blank=True,
+                        help_text="A concise, punchy summary for list views.",
+                    ),
+                ),
+                (
+                    "long_description",
+                    models.TextField(
+                        blank=True,
+                        help_text="The detailed, comprehensive description for the product page.",
+                    ),
+                ),
+                (
+                    "is_available",
+                    models.BooleanField(
+                        default=True,
+                        help_text="Is this product available for purchase?",
+                    ),
+                ),
+                (
+                    "meta_title",
+                    models.CharField(
+                        blank=True,
+                        help_text="Custom <title> tag for SEO. If blank, the product name will be used.",
+                        max_length=255,
+                    ),
+                ),
+                (
+                    "meta_description",
+                    models.CharField(
+                        blank=True,
+                        help_text="Custom <meta name='description'> tag for SEO.",
+                        max_length=300,
+                    ),
+                ),
+                (
+                    "gaio_brand_voice",
+                    models.CharField(
+                        choices=[
+                            ("PLAYFUL", "Playful & Witty"),
+                            ("PROFESSIONAL", "Professional & Technical"),
+                            ("MINIMALIST", "Minimalist & Elegant"),
+                            ("ADVENTUROUS", "Adventurous & Bold"),
+                        ],
+                        default="PROFESSIONAL",
+                        help_text="Defines the tone for AI-generated content.",
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "gaio_target_personas",
+                    models.JSONField(
+                        blank=True,
+                        default=list,
+                        help_text="Structured data on target audiences (e.g., [{'persona': '...', 'pain_point': '...'}]).",
+                    ),
+                ),
+                (
+                    "gaio_key_features",
+                    models.JSONField(
+                        blank=True,
+                        default=list,
+                        help_text="Benefit-oriented features for AI input (e.g., [{'feature': '...', 'benefit': '...'}]).",
+                    ),
+                ),
+                (
+                    "gaio_structured_facts",
+                    models.JSONField(
+                        blank=True,
+                        default=dict,
+                        help_text="Verifiable, citable product data points (e.g., {'Material': 'Organic Cotton'}).",
+                    ),
+                ),
+                (
+                    "gaio_faq_data",
+                    models.JSONField(
+                        blank=True,
+                        default=list,
+                        help_text="Q&A pairs for conversational search (e.g., [{'q': '...', 'a': '...'}]).",
+                    ),
+                ),
+                (
+                    "gaio_description_variants",
+                    models.JSONField(
+                        blank=True,
+                        default=dict,
+                        help_text="Stores A/B test variations of descriptions and their performance data.",
+                    ),
+                ),
+                (
+                    "category",
+                    models.ForeignKey(
+                        blank=True,
+                        help_text="The primary category for this product.",
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="products",
+                        to="shop.category",
+                    ),
+                ),
+                (
+                    "tags",
+                    models.ManyToManyField(
+                        blank=True,
+                        help_text="Tags for non-hierarchical classification.",
+                        related_name="products",
+                        to="shop.tag",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["-created_at"],
+            },
+        ),
+        migrations.CreateModel(
+            name="ProductImage",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("image", models.ImageField(upload_to="products/")),
+                (
+                    "alt_text",
+                    models.CharField(
+                        blank=True,
+                        help_text="Descriptive text for accessibility and SEO.",
+                        max_length=255,
+                    ),
+                ),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="images",
+                        to="shop.product",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="ProductVariant",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "sku",
+                    models.CharField(
+                        help_text="Unique Stock Keeping Unit for this specific variant.",
+                        max_length=100,
+                        unique=True,
+                    ),
+                ),
+                (
+                    "price",
+                    models.DecimalField(
+                        decimal_places=2,
+                        help_text="The price of this specific variant.",
+                        max_digits=10,
+                    ),
+                ),
+                (
+                    "discount_price",
+                    models.DecimalField(
+                        blank=True,
+                        decimal_places=2,
+                        help_text="Optional promotional price.",
+                        max_digits=10,
+                        null=True,
+                    ),
+                ),
+                (
+                    "stock_quantity",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Inventory level for this variant."
+                    ),
+                ),
+                ("size", models.CharField(blank=True, max_length=50)),
+                ("color", models.CharField(blank=True, max_length=50)),
+                (
+                    "is_default",
+                    models.BooleanField(
+                        default=False,
+                        help_text="Should this variant be shown by default on the product page?",
+                    ),
+                ),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="variants",
+                        to="shop.product",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["size", "color"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        condition=models.Q(("is_default", True)),
+                        fields=("product",),
+                        name="unique_default_variant",
+                    )
+                ],
+                "unique_together": {("product", "size", "color")},
+            },
+        ),
+        migrations.CreateModel(
+            name="Review",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "rating",
+                    models.PositiveSmallIntegerField(
+                        help_text="Rating from 1 to 5.",
+                        validators=[
+                            django.core.validators.MinValueValidator(1),
+                            django.core.validators.MaxValueValidator(5),
+                        ],
+                    ),
+                ),
+                ("comment", models.TextField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="reviews",
+                        to="shop.product",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="reviews",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["-created_at"],
+                "unique_together": {("product", "user")},
+            },
+        ),
+    ]
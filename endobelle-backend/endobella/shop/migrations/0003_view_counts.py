@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shop", "0002_time_ordered_ids"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="popularity",
+            field=models.FloatField(
+                default=0.0,
+                editable=False,
+                help_text="Time-decayed view score in log space; higher is more popular.",
+            ),
+        ),
+        migrations.AddField(
+            model_name="product",
+            name="view_count",
+            field=models.PositiveBigIntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(
+                models.OrderBy(models.F("popularity"), descending=True),
+                condition=models.Q(("is_available", True)),
+                name="product_avail_popularity_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(
+                models.OrderBy(models.F("view_count"), descending=True),
+                condition=models.Q(("is_available", True)),
+                name="product_avail_view_count_idx",
+            ),
+        ),
+    ]
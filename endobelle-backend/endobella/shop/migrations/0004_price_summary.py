@@ -0,0 +1,90 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:02
+
+from django.db import migrations, models
+from django.db.models import Exists, F, Max, Min, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_price_summary(apps, schema_editor):
+    Product = apps.get_model("shop", "Product")
+    ProductVariant = apps.get_model("shop", "ProductVariant")
+    variants = ProductVariant.objects.filter(product=OuterRef("pk")).order_by()
+    per_product = variants.values("product")
+    effective_price = Coalesce("discount_price", "price")
+    Product.objects.update(
+        min_price=Subquery(
+            per_product.annotate(value=Min(effective_price)).values("value")
+        ),
+        max_price=Subquery(
+            per_product.annotate(value=Max(effective_price)).values("value")
+        ),
+        has_discount=Exists(variants.filter(discount_price__lt=F("price"))),
+        in_stock=Exists(variants.filter(stock_quantity__gt=0)),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shop", "0003_view_counts"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="has_discount",
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddField(
+            model_name="product",
+            name="in_stock",
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddField(
+            model_name="product",
+            name="max_price",
+            field=models.DecimalField(
+                decimal_places=2,
+                editable=False,
+                help_text="Highest effective variant price.",
+                max_digits=10,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="product",
+            name="min_price",
+            field=models.DecimalField(
+                decimal_places=2,
+                editable=False,
+                help_text="Lowest effective (discounted if set) variant price.",
+                max_digits=10,
+                null=True,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(
+                condition=models.Q(("is_available", True)),
+                fields=["min_price"],
+                name="product_avail_min_price_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(
+                condition=models.Q(("is_available", True)),
+                fields=["max_price"],
+                name="product_avail_max_price_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(
+                condition=models.Q(("has_discount", True), ("is_available", True)),
+                fields=["min_price"],
+                name="product_discount_price_idx",
+            ),
+        ),
+        migrations.RunPython(backfill_price_summary, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,147 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:10
+
+import json
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+GIN_INDEXES = {
+    "product_gaio_facts_gin": "gaio_structured_facts",
+    "product_gaio_features_gin": "gaio_key_features",
+    "product_gaio_personas_gin": "gaio_target_personas",
+    "product_gaio_faq_gin": "gaio_faq_data",
+}
+
+
+def create_gin_indexes(apps, schema_editor):
+    # jsonb_path_ops only exists on PostgreSQL; other backends use the
+    # ProductFact table alone.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    table = schema_editor.quote_name(apps.get_model("shop", "Product")._meta.db_table)
+    for name, column in GIN_INDEXES.items():
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {schema_editor.quote_name(name)} "
+            f"ON {table} USING gin ({schema_editor.quote_name(column)} jsonb_path_ops)"
+        )
+
+
+def drop_gin_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name in GIN_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {schema_editor.quote_name(name)}")
+
+
+# A frozen copy of endobella.shop.facts.extract_facts as of this migration.
+FACT_FIELDS = {
+    "fact": "gaio_structured_facts",
+    "feature": "gaio_key_features",
+    "persona": "gaio_target_personas",
+    "faq": "gaio_faq_data",
+}
+MAX_KEY_LENGTH = 255
+MAX_VALUE_LENGTH = 500
+
+
+def _scalars(value):
+    if isinstance(value, list):
+        for item in value:
+            if not isinstance(item, (list, dict)):
+                yield item
+    elif not isinstance(value, dict) and value is not None:
+        yield value
+
+
+def extract_facts(product):
+    for kind, field in FACT_FIELDS.items():
+        data = getattr(product, field) or {}
+        if kind == "fact":
+            pairs = data.items() if isinstance(data, dict) else ()
+        else:
+            items = data if isinstance(data, list) else ()
+            pairs = (
+                pair
+                for item in items
+                if isinstance(item, dict)
+                for pair in item.items()
+            )
+        for key, value in pairs:
+            for scalar in _scalars(value):
+                text = scalar if isinstance(scalar, str) else json.dumps(scalar)
+                if len(key) <= MAX_KEY_LENGTH and len(text) <= MAX_VALUE_LENGTH:
+                    yield kind, key, text
+
+
+def extract_existing_facts(apps, schema_editor):
+    Product = apps.get_model("shop", "Product")
+    ProductFact = apps.get_model("shop", "ProductFact")
+    ProductFact.objects.bulk_create(
+        (
+            ProductFact(product_id=product.pk, kind=kind, key=key, value=value)
+            for product in Product.objects.iterator(chunk_size=500)
+            for kind, key, value in set(extract_facts(product))
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shop", "0004_price_summary"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProductFact",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("fact", "Structured fact"),
+                            ("feature", "Key feature"),
+                            ("persona", "Target persona"),
+                            ("faq", "FAQ"),
+                        ],
+                        max_length=10,
+                    ),
+                ),
+                ("key", models.CharField(max_length=255)),
+                ("value", models.CharField(max_length=500)),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="facts",
+                        to="shop.product",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["kind", "key", "value"], name="product_fact_lookup_idx"
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("product", "kind", "key", "value"),
+                        name="unique_product_fact",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(create_gin_indexes, drop_gin_indexes),
+        migrations.RunPython(extract_existing_facts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:17
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+import endobella.common.ids
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shop", "0005_product_facts"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DescriptionVariantStats",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=endobella.common.ids.uuid7,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("variant", models.CharField(max_length=32)),
+                ("day", models.DateField()),
+                ("impressions", models.PositiveBigIntegerField(default=0)),
+                ("conversions", models.PositiveBigIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True, db_index=True)),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="description_stats",
+                        to="shop.product",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "Description variant stats",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("product", "variant", "day"),
+                        name="unique_description_variant_day",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,84 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:36
+
+import re
+import unicodedata
+from collections import defaultdict
+
+from django.db import migrations, models
+
+TRIGRAM_INDEX = "product_search_trgm_idx"
+
+
+def create_trigram_index(apps, schema_editor):
+    # pg_trgm only exists on PostgreSQL; other backends search in memory.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    table = schema_editor.quote_name(apps.get_model("shop", "Product")._meta.db_table)
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        f"CREATE INDEX IF NOT EXISTS {schema_editor.quote_name(TRIGRAM_INDEX)} "
+        f"ON {table} USING gin ({schema_editor.quote_name('search_text')} gin_trgm_ops)"
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        f"DROP INDEX IF EXISTS {schema_editor.quote_name(TRIGRAM_INDEX)}"
+    )
+
+
+# Frozen copies of endobella.common.text.normalize and
+# endobella.shop.search.document as of this migration.
+def normalize(text):
+    text = unicodedata.normalize("NFKD", text.lower())
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return " ".join(re.findall(r"\w+", text))
+
+
+def document(name, short_description, tags=(), skus=()):
+    text = normalize(" ".join([name, short_description, *sorted(tags), *sorted(skus)]))
+    return " ".join(dict.fromkeys(text.split()))
+
+
+def fill_search_text(apps, schema_editor):
+    Product = apps.get_model("shop", "Product")
+    ProductVariant = apps.get_model("shop", "ProductVariant")
+    tags, skus = defaultdict(list), defaultdict(list)
+    for product_id, tag in Product.tags.through.objects.values_list(
+        "product_id", "tag__name"
+    ):
+        tags[product_id].append(tag)
+    for product_id, sku in ProductVariant.objects.values_list("product_id", "sku"):
+        skus[product_id].append(sku)
+    products = []
+    for product in Product.objects.only("pk", "name", "short_description").iterator(
+        chunk_size=500
+    ):
+        product.search_text = document(
+            product.name, product.short_description, tags[product.pk], skus[product.pk]
+        )
+        products.append(product)
+    Product.objects.bulk_update(products, ["search_text"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shop", "0006_description_variant_stats"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="search_text",
+            field=models.TextField(
+                blank=True,
+                editable=False,
+                help_text="Normalized name, short description, tag names and SKUs.",
+            ),
+        ),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+        migrations.RunPython(fill_search_text, migrations.RunPython.noop),
+    ]
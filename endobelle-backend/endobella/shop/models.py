@@ -1,12 +1,15 @@
 from django.db import models
 
-from endobella.common.models import BaseModel
+from endobella.common import revalidation
+from endobella.common.models import BaseModel, ViewCountedModel
+from endobella.common.slugs import save_with_slug
 
 import json
-from django.contrib.auth.models import User
-from django.utils.text import slugify
+from functools import partial
+from django.conf import settings
 from django.core.validators import MinValueValidator, MaxValueValidator
-from django.db.models import Avg
+from django.db.models import Avg, Exists, F, Max, Min, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Now
 
 
 class SlugModelBase(BaseModel):
@@ -25,9 +28,7 @@ class SlugModelBase(BaseModel):
         return self.name
 
     def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(self.name)
-        super().save(*args, **kwargs)
+        save_with_slug(self, "name", partial(super().save, *args, **kwargs))
 
 
 class Category(SlugModelBase):
@@ -61,7 +62,41 @@ class Tag(SlugModelBase):
         ordering = ["name"]
 
 
-class Product(SlugModelBase):
+# Variant fields the price summary on Product is derived from.
+PRICE_SUMMARY_FIELDS = frozenset(
+    {"product", "product_id", "price", "discount_price", "stock_quantity"}
+)
+
+
+class ProductQuerySet(models.QuerySet):
+    def refresh_price_summaries(self):
+        """
+        Recompute ``min_price``, ``max_price``, ``has_discount`` and
+        ``in_stock`` from the variants in one UPDATE; returns the row count.
+        The products are revalidated, since the UPDATE sends no signals.
+        """
+        variants = ProductVariant.objects.filter(product=OuterRef("pk")).order_by()
+        per_product = variants.values("product")
+        effective_price = Coalesce("discount_price", "price")
+        rows = self.order_by().update(
+            min_price=Subquery(
+                per_product.annotate(value=Min(effective_price)).values("value")
+            ),
+            max_price=Subquery(
+                per_product.annotate(value=Max(effective_price)).values("value")
+            ),
+            has_discount=Exists(variants.filter(discount_price__lt=F("price"))),
+            in_stock=Exists(variants.filter(stock_quantity__gt=0)),
+            # The nested variants are part of the product's representation.
+            updated_at=Now(),
+        )
+        revalidation.notify(
+            "product", self.only("slug", "category_id"), revalidation.product_keys
+        )
+        return rows
+
+
+class Product(ViewCountedModel, SlugModelBase):
     """
     The main product model, acting as a "template" for its variants.
     It holds all the shared information across different versions of a product.
@@ -97,6 +132,31 @@ class Product(SlugModelBase):
         default=True, help_text="Is this product available for purchase?"
     )
 
+    # --- Price summary, maintained from the variants ---
+    min_price = models.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        null=True,
+        editable=False,
+        help_text="Lowest effective (discounted if set) variant price.",
+    )
+    max_price = models.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        null=True,
+        editable=False,
+        help_text="Highest effective variant price.",
+    )
+    has_discount = models.BooleanField(default=False, editable=False)
+    in_stock = models.BooleanField(default=False, editable=False)
+
+    # --- Search document, maintained by endobella.shop.search ---
+    search_text = models.TextField(
+        blank=True,
+        editable=False,
+        help_text="Normalized name, short description, tag names and SKUs.",
+    )
+
     # --- Advanced SEO Fields ---
     meta_title = models.CharField(
         max_length=255,
@@ -150,6 +210,35 @@ class Product(SlugModelBase):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                F("popularity").desc(),
+                condition=models.Q(is_available=True),
+                name="product_avail_popularity_idx",
+            ),
+            models.Index(
+                F("view_count").desc(),
+                condition=models.Q(is_available=True),
+                name="product_avail_view_count_idx",
+            ),
+            models.Index(
+                fields=["min_price"],
+                condition=models.Q(is_available=True),
+                name="product_avail_min_price_idx",
+            ),
+            models.Index(
+                fields=["max_price"],
+                condition=models.Q(is_available=True),
+                name="product_avail_max_price_idx",
+            ),
+            models.Index(
+                fields=["min_price"],
+                condition=models.Q(is_available=True, has_discount=True),
+                name="product_discount_price_idx",
+            ),
+        ]
+
+    objects = ProductQuerySet.as_manager()
 
     def get_average_rating(self):
         """Calculates the average rating from all reviews."""
@@ -208,6 +297,100 @@ class Product(SlugModelBase):
         return reverse("product_detail", kwargs={"slug": self.slug})
 
 
+class ProductFact(models.Model):
+    """
+    One value from a product's GAIO JSON fields, extracted by
+    ``endobella.shop.facts`` for indexed lookups and facet counts.
+    """
+
+    class Kind(models.TextChoices):
+        FACT = "fact", "Structured fact"
+        FEATURE = "feature", "Key feature"
+        PERSONA = "persona", "Target persona"
+        FAQ = "faq", "FAQ"
+
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name="facts")
+    kind = models.CharField(max_length=10, choices=Kind.choices)
+    key = models.CharField(max_length=255)
+    value = models.CharField(max_length=500)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["product", "kind", "key", "value"],
+                name="unique_product_fact",
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["kind", "key", "value"], name="product_fact_lookup_idx"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.key}: {self.value}"
+
+
+class ProductVariantQuerySet(models.QuerySet):
+    """
+    Keeps the product price summary current through bulk writes, which do
+    not send the signals ``endobella.shop.signals`` listens to.
+    """
+
+    _refresh_summaries = True
+
+    def _clone(self):
+        clone = super()._clone()
+        clone._refresh_summaries = self._refresh_summaries
+        return clone
+
+    def without_summary_refresh(self):
+        """For callers that refresh the products themselves, e.g. once at the end."""
+        clone = self._chain()
+        clone._refresh_summaries = False
+        return clone
+
+    def _refresh_products(self, product_ids, fields):
+        if self._refresh_summaries and not PRICE_SUMMARY_FIELDS.isdisjoint(fields):
+            Product.objects.filter(pk__in=product_ids).refresh_price_summaries()
+
+    def update(self, **kwargs):
+        if not self._refresh_summaries or PRICE_SUMMARY_FIELDS.isdisjoint(kwargs):
+            return super().update(**kwargs)
+        product_ids = set(self.values_list("product_id", flat=True))
+        rows = super().update(**kwargs)
+        if "product" in kwargs or "product_id" in kwargs:
+            target = kwargs.get("product", kwargs.get("product_id"))
+            product_ids.add(getattr(target, "pk", target))
+        self._refresh_products(product_ids, kwargs)
+        return rows
+
+    update.alters_data = True
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = super(
+            ProductVariantQuerySet, self.without_summary_refresh()
+        ).bulk_create(objs, *args, **kwargs)
+        self._refresh_products({obj.product_id for obj in objs}, PRICE_SUMMARY_FIELDS)
+        return objs
+
+    bulk_create.alters_data = True
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        objs = list(objs)
+        # bulk_update() goes through update(); refresh once afterwards instead.
+        rows = super(
+            ProductVariantQuerySet, self.without_summary_refresh()
+        ).bulk_update(objs, fields, *args, **kwargs)
+        product_ids = set()
+        for obj in objs:
+            product_ids.update(obj.product_ids_to_refresh())
+        self._refresh_products(product_ids, fields)
+        return rows
+
+    bulk_update.alters_data = True
+
+
 class ProductVariant(BaseModel):
     """
     Represents a specific, sellable version of a product.
@@ -258,6 +441,21 @@ class ProductVariant(BaseModel):
         ]
         ordering = ["size", "color"]
 
+    objects = ProductVariantQuerySet.as_manager()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # The product the row was loaded with, refreshed too if it moves.
+        instance._saved_product_id = instance.__dict__.get("product_id")
+        return instance
+
+    def product_ids_to_refresh(self):
+        """The current product and, after a move, the previous one; once."""
+        product_ids = {self.product_id, getattr(self, "_saved_product_id", None)}
+        self._saved_product_id = self.product_id
+        return product_ids - {None}
+
     def __str__(self):
         attributes = filter(None, [self.size, self.color])
         return f"{self.product.name} ({', '.join(attributes)})"
@@ -291,7 +489,9 @@ class Review(BaseModel):
     product = models.ForeignKey(
         Product, on_delete=models.CASCADE, related_name="reviews"
     )
-    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="reviews")
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="reviews"
+    )
     rating = models.PositiveSmallIntegerField(
         validators=[MinValueValidator(1), MaxValueValidator(5)],
         help_text="Rating from 1 to 5.",
@@ -305,3 +505,31 @@ class Review(BaseModel):
 
     def __str__(self):
         return f"Review by {self.user.username} for {self.product.name}"
+
+
+class DescriptionVariantStats(BaseModel):
+    """
+    Daily impressions and conversions of one description variant, written in
+    batches by ``endobella.shop.experiments.ExperimentCounter``.
+    """
+
+    product = models.ForeignKey(
+        Product, on_delete=models.CASCADE, related_name="description_stats"
+    )
+    variant = models.CharField(max_length=32)
+    day = models.DateField()
+    impressions = models.PositiveBigIntegerField(default=0)
+    conversions = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["product", "variant", "day"],
+                name="unique_description_variant_day",
+            )
+        ]
+        verbose_name_plural = "Description variant stats"
+
+    def __str__(self):
+        return f"{self.variant} on {self.day}"
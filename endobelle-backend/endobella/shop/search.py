@@ -0,0 +1,261 @@
+"""
+Typo-tolerant product search by trigram similarity.
+
+Each product has a ``search_text``: its normalized name, short
+description, tag names and SKUs, refreshed after saves (see
+``endobella.shop.signals``). A product's text score is the better of the
+name's similarity to the query and ``FIELD_WEIGHT`` times the query's word
+similarity to ``search_text``. The final score blends in stock:
+
+    (1 - PRODUCT_SEARCH_STOCK_WEIGHT) * text score
+    + PRODUCT_SEARCH_STOCK_WEIGHT * in_stock
+
+On PostgreSQL the candidates come from ``search_text <% query`` (``<%``
+is the pg_trgm word similarity operator) through the GIN trigram index of
+migration ``shop.0007``. Elsewhere a per-process ``TrigramIndex`` is used:
+query words are matched to similar words of the catalog through their
+trigrams, which approximates the same scores.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections import Counter, defaultdict
+from heapq import nlargest
+from itertools import chain
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import BooleanField, Case, F, FloatField, Func, Value, When
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from endobella.common.indexes import RefreshedIndex
+from endobella.common.text import normalize
+from endobella.shop.models import Product, ProductVariant
+
+# Weight of matches outside the name.
+FIELD_WEIGHT = 0.8
+# Catalog words a misspelled query word may stand for.
+MAX_EXPANSIONS = 20
+MAX_QUERY_WORDS = 8
+
+
+def document(name, short_description, tags=(), skus=()):
+    """The ``search_text`` of a product: normalized words, each once."""
+    text = normalize(" ".join([name, short_description, *sorted(tags), *sorted(skus)]))
+    return " ".join(dict.fromkeys(text.split()))
+
+
+def refresh_documents(product_ids):
+    """Recompute ``search_text``; changed rows also get a new ``updated_at``."""
+    product_ids = list(product_ids)
+    tags, skus = defaultdict(list), defaultdict(list)
+    for product_id, tag in Product.tags.through.objects.filter(
+        product_id__in=product_ids
+    ).values_list("product_id", "tag__name"):
+        tags[product_id].append(tag)
+    for product_id, sku in ProductVariant.objects.filter(
+        product_id__in=product_ids
+    ).values_list("product_id", "sku"):
+        skus[product_id].append(sku)
+
+    now = timezone.now()
+    changed = []
+    for product in Product.objects.filter(pk__in=product_ids).only(
+        "pk", "name", "short_description", "search_text"
+    ):
+        text = document(
+            product.name, product.short_description, tags[product.pk], skus[product.pk]
+        )
+        if text != product.search_text:
+            product.search_text, product.updated_at = text, now
+            changed.append(product)
+    Product.objects.bulk_update(changed, ["search_text", "updated_at"], batch_size=500)
+    return len(changed)
+
+
+def _blend(text_score, in_stock):
+    weight = settings.PRODUCT_SEARCH_STOCK_WEIGHT
+    return (1 - weight) * text_score + weight * in_stock
+
+
+def search(query, limit=20):
+    """``[(product_id, score), ...]`` of available products, best first."""
+    query = " ".join(normalize(query).split()[:MAX_QUERY_WORDS])
+    if not query:
+        return []
+    if connection.vendor == "postgresql":
+        return _postgres_search(query, limit)
+    return trigram_index.search(query, limit)
+
+
+class _WordSimilar(Func):
+    # "query <% text": word similarity above the threshold; GIN-indexable.
+    arg_joiner = " <%% "
+    template = "%(expressions)s"
+    output_field = BooleanField()
+
+
+def _postgres_search(query, limit):
+    def similarity(function, *expressions):
+        return Func(*expressions, function=function, output_field=FloatField())
+
+    text_score = Greatest(
+        similarity("similarity", F("name"), Value(query)),
+        similarity("word_similarity", Value(query), F("search_text")) * FIELD_WEIGHT,
+    )
+    in_stock = Case(When(in_stock=True, then=Value(1.0)), default=Value(0.0))
+    results = (
+        Product.objects.filter(is_available=True)
+        .filter(_WordSimilar(Value(query), F("search_text")))
+        .annotate(score=_blend(text_score, in_stock))
+        .order_by("-score", "pk")
+        .values_list("pk", "score")[:limit]
+    )
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT set_config('pg_trgm.word_similarity_threshold', %s, true)",
+            [str(settings.PRODUCT_SEARCH_MIN_SIMILARITY)],
+        )
+        return list(results)
+
+
+def trigrams(word):
+    """pg_trgm style trigrams: the word padded with two spaces before, one after."""
+    padded = f"  {word} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    """
+    The words of the available products, with the trigrams of each word
+    and the products that have it in their name or ``search_text``.
+
+    Products are numbered by slot. A changed product gets a new slot and
+    its old one is only marked dead, so postings are append-only until the
+    next rebuild.
+    """
+
+    def __init__(self):
+        self.words = {}
+        self._word_sizes = []
+        self._by_trigram = defaultdict(list)
+        self._in_names = []
+        self._in_texts = []
+        self._slots = {}
+        self._pks = []
+        self._in_stock = array("b")
+
+    def __len__(self):
+        return len(self._slots)
+
+    def _word(self, word):
+        word_id = self.words.get(word)
+        if word_id is None:
+            word_id = self.words[word] = len(self._word_sizes)
+            grams = trigrams(word)
+            self._word_sizes.append(len(grams))
+            for gram in grams:
+                self._by_trigram[gram].append(word_id)
+            self._in_names.append(array("I"))
+            self._in_texts.append(array("I"))
+        return word_id
+
+    def add(self, pk, name, text, in_stock):
+        self.remove(pk)
+        slot = self._slots[pk] = len(self._pks)
+        self._pks.append(pk)
+        self._in_stock.append(in_stock)
+        name_words = set(normalize(name).split())
+        for word in set(text.split()):
+            word_id = self._word(word)
+            self._in_texts[word_id].append(slot)
+            if word in name_words:
+                self._in_names[word_id].append(slot)
+
+    def remove(self, pk):
+        slot = self._slots.pop(pk, None)
+        if slot is not None:
+            self._pks[slot] = None
+
+    def similar_words(self, word):
+        """``(similarity, word_id)`` of the catalog words closest to ``word``."""
+        grams = trigrams(word)
+        shared = Counter(
+            chain.from_iterable(self._by_trigram.get(gram, ()) for gram in grams)
+        )
+        minimum = settings.PRODUCT_SEARCH_MIN_SIMILARITY
+        sizes = self._word_sizes
+        similar = []
+        for word_id, count in shared.items():
+            score = count / (len(grams) + sizes[word_id] - count)
+            if score >= minimum:
+                similar.append((score, word_id))
+        return nlargest(MAX_EXPANSIONS, similar)
+
+    def search(self, query, limit):
+        words = query.split()
+        totals = Counter()
+        for word in words:
+            postings = []
+            for score, word_id in self.similar_words(word):
+                postings.append((score, self._in_names[word_id]))
+                postings.append((score * FIELD_WEIGHT, self._in_texts[word_id]))
+            # Ascending, so that each product keeps its best match.
+            best = {}
+            for score, slots in sorted(postings, key=lambda posting: posting[0]):
+                best.update(dict.fromkeys(slots, score))
+            totals.update(best)
+
+        minimum = settings.PRODUCT_SEARCH_MIN_SIMILARITY
+        pks, in_stock = self._pks, self._in_stock
+        return [
+            (pks[slot], score)
+            for score, slot in nlargest(
+                limit,
+                (
+                    (_blend(total / len(words), in_stock[slot]), slot)
+                    for slot, total in totals.items()
+                    if total / len(words) >= minimum and pks[slot] is not None
+                ),
+            )
+        ]
+
+
+def _changed_products(since=None):
+    products = Product.objects.order_by()
+    if since is None:
+        products = products.filter(is_available=True)
+    else:
+        products = products.filter(updated_at__gte=since)
+    return products.values_list(
+        "pk", "name", "search_text", "in_stock", "is_available"
+    ).iterator(chunk_size=2000)
+
+
+class ProductTrigramIndex(RefreshedIndex):
+    """The ``TrigramIndex`` of this process; only used off PostgreSQL."""
+
+    settings_prefix = "PRODUCT_SEARCH"
+
+    def search(self, query, limit):
+        return self.current().search(query, limit)
+
+    def _build(self):
+        index = TrigramIndex()
+        for pk, name, text, in_stock, _ in _changed_products():
+            index.add(pk, name, text, in_stock)
+        return index
+
+    def _catch_up(self, index, since):
+        # Readers may see a product half-added; it is complete next request.
+        for pk, name, text, in_stock, available in _changed_products(since):
+            if available:
+                index.add(pk, name, text, in_stock)
+            else:
+                index.remove(pk)
+        return index
+
+
+trigram_index = ProductTrigramIndex()
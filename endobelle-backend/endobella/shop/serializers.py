@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from rest_framework import serializers
+
+from endobella.shop.models import Product, ProductImage, ProductVariant
+
+
+class ProductVariantSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ProductVariant
+        fields = [
+            "id",
+            "sku",
+            "price",
+            "discount_price",
+            "stock_quantity",
+            "size",
+            "color",
+            "is_default",
+        ]
+
+
+class ProductImageSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ProductImage
+        fields = ["id", "image", "alt_text"]
+
+
+class ProductSerializer(serializers.ModelSerializer):
+    variants = ProductVariantSerializer(many=True, read_only=True)
+    images = ProductImageSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = Product
+        exclude = ["gaio_description_variants", "popularity", "search_text"]
@@ -0,0 +1,100 @@
+"""
+Keep data derived from products in step with them.
+
+``ProductFact`` rows are rewritten, where they changed, in the same
+transaction as the product save. Bulk product writes bypass this; run
+``rebuild_product_facts`` after them.
+
+For the price summary on ``Product``, variant saves and deletes are
+collected per thread and applied with one UPDATE after the transaction
+commits, so saving a product with its variant inlines refreshes it once.
+Bulk writes through ``ProductVariant.objects`` refresh directly (see
+``ProductVariantQuerySet``). A variant moved to another product refreshes
+both, the previous one as recorded when the variant was loaded.
+
+The search document (``Product.search_text``) is refreshed the same way
+after product, variant, tag and tag assignment changes. Bulk writes bypass
+this; run ``rebuild_product_search`` after them.
+"""
+
+from __future__ import annotations
+
+import threading
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from endobella.shop import facts, search
+from endobella.shop.models import Product, ProductVariant, Tag
+
+_state = threading.local()
+
+
+@receiver(post_save, sender=Product, dispatch_uid="product_facts_save")
+def product_saved(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    if update_fields is not None and set(facts.FIELDS.values()).isdisjoint(
+        update_fields
+    ):
+        return
+    facts.sync_product_facts(instance)
+
+
+def _schedule(product_ids, summaries=False, documents=False):
+    if not hasattr(_state, "summaries"):
+        _state.summaries, _state.documents = set(), set()
+    if summaries:
+        _state.summaries.update(product_ids)
+    if documents:
+        _state.documents.update(product_ids)
+    transaction.on_commit(_refresh)
+
+
+def _refresh():
+    # The first callback of a transaction refreshes everything pending.
+    summaries, _state.summaries = _state.summaries, set()
+    documents, _state.documents = _state.documents, set()
+    if summaries:
+        Product.objects.filter(pk__in=summaries).refresh_price_summaries()
+    if documents:
+        search.refresh_documents(documents)
+
+
+@receiver(post_save, sender=Product, dispatch_uid="search_text_save")
+def product_text_saved(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    if update_fields is None or {"name", "short_description"} & set(update_fields):
+        _schedule([instance.pk], documents=True)
+
+
+@receiver(post_save, sender=Tag, dispatch_uid="search_text_tag_save")
+def tag_saved(sender, instance, raw=False, created=False, **kwargs):
+    if not raw and not created:
+        _schedule(instance.products.values_list("pk", flat=True), documents=True)
+
+
+@receiver(m2m_changed, sender=Product.tags.through, dispatch_uid="search_text_tags")
+def product_tags_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    if not reverse:
+        product_ids = [instance.pk]
+    elif action == "pre_clear":
+        product_ids = instance.products.values_list("pk", flat=True)
+    else:
+        product_ids = pk_set
+    _schedule(product_ids, documents=True)
+
+
+@receiver(post_save, sender=ProductVariant, dispatch_uid="price_summary_save")
+def variant_saved(sender, instance, raw=False, **kwargs):
+    if not raw:
+        _schedule(instance.product_ids_to_refresh(), summaries=True, documents=True)
+
+
+@receiver(post_delete, sender=ProductVariant, dispatch_uid="price_summary_delete")
+def variant_deleted(sender, instance, **kwargs):
+    _schedule([instance.product_id], summaries=True, documents=True)
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from django.conf import settings
+from django.http import Http404, StreamingHttpResponse
+from django.utils.cache import patch_cache_control
+from django.utils.dateparse import parse_datetime
+from django_filters import CharFilter, FilterSet
+from rest_framework import permissions, status
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from endobella.common.counters import BufferedCounter
+from endobella.common.mixins import PublicItemViewMixin, ViewCountMixin
+from endobella.shop import experiments, facts, feeds, search
+from endobella.shop.models import Product
+from endobella.shop.serializers import ProductSerializer
+
+
+class ProductFilterSet(FilterSet):
+    fact = CharFilter(
+        method="filter_fact", help_text="A structured fact as 'Key:Value'."
+    )
+    feature = CharFilter(method="filter_gaio", help_text="A key feature name.")
+    persona = CharFilter(method="filter_gaio", help_text="A target persona.")
+    faq = CharFilter(method="filter_gaio", help_text="An FAQ question.")
+
+    class Meta:
+        model = Product
+        fields = {
+            "slug": ["exact"],
+            "category": ["exact"],
+            "tags": ["exact"],
+            "gaio_brand_voice": ["exact"],
+            "min_price": ["gte", "lte"],
+            "max_price": ["gte", "lte"],
+            "has_discount": ["exact"],
+            "in_stock": ["exact"],
+        }
+
+    def filter_fact(self, queryset, name, value):
+        key, separator, fact = value.partition(":")
+        if not separator:
+            raise ValidationError({name: "Expected 'Key:Value'."})
+        return queryset.filter(
+            facts.gaio_filter(facts.Kind.FACT, key.strip(), fact.strip())
+        )
+
+    def filter_gaio(self, queryset, name, value):
+        return queryset.filter(facts.gaio_filter(name, facts.DEFAULT_KEYS[name], value))
+
+
+class ProductViewSet(ViewCountMixin, PublicItemViewMixin):
+    queryset = Product.objects.filter(is_available=True).prefetch_related(
+        "tags", "variants", "images"
+    )
+    serializer_class = ProductSerializer
+    lookup_field = "slug"
+    search_fields = ["name", "short_description"]
+    ordering_fields = ["created_at", "updated_at", "name", "min_price", "max_price"]
+    ordering = ["-created_at"]
+    filterset_class = ProductFilterSet
+    view_counter = BufferedCounter(Product)
+    experiment_counter = experiments.ExperimentCounter()
+
+    @action(detail=False, url_path="facets")
+    def facets(self, request, *args, **kwargs):
+        """Most common GAIO values among the filtered products, with counts."""
+        kind = request.query_params.get("kind", facts.Kind.FACT)
+        if kind not in facts.Kind.values:
+            raise ValidationError({"kind": f"One of {', '.join(facts.Kind.values)}."})
+        queryset = self.filter_queryset(self.get_queryset())
+        return Response(facts.facet_counts(queryset, kind))
+
+    @action(detail=False, url_path="search")
+    def search(self, request, *args, **kwargs):
+        """Products matching ``?q=`` despite typos, best first, with a ``score``."""
+        try:
+            limit = int(request.query_params.get("limit", 20))
+        except ValueError as exc:
+            raise ValidationError({"limit": "A number."}) from exc
+        limit = max(1, min(limit, settings.PRODUCT_SEARCH_MAX_RESULTS))
+        results = search.search(request.query_params.get("q", ""), limit)
+        products = self.get_queryset().in_bulk([pk for pk, _ in results])
+        data = []
+        for pk, score in results:
+            if pk in products:
+                item = self.get_serializer(products[pk]).data
+                item["score"] = round(score, 4)
+                data.append(item)
+        return Response(data)
+
+    def _assigned_variant(self, request, slug):
+        visitor = request.query_params.get("visitor") or request.data.get("visitor")
+        if not visitor:
+            raise ValidationError({"visitor": "A visitor id is required."})
+        product = (
+            Product.objects.filter(is_available=True, slug=slug)
+            .values_list("pk", "long_description", "gaio_description_variants")
+            .first()
+        )
+        if product is None:
+            raise Http404
+        pk, description, data = product
+        return pk, description, experiments.assign(pk, data, visitor)
+
+    @action(
+        detail=True,
+        url_path="description",
+        authentication_classes=[],
+        permission_classes=[permissions.AllowAny],
+    )
+    def description_variant(self, request, slug=None):
+        """The description variant ``?visitor=<id>`` is assigned; counts an impression."""
+        pk, description, variant = self._assigned_variant(request, slug)
+        if variant is None:
+            return Response({"variant": None, "description": description})
+        self.experiment_counter.impression(pk, variant["key"])
+        return Response(
+            {"variant": variant["key"], "description": variant.get("description", "")}
+        )
+
+    @action(
+        detail=True,
+        methods=["post"],
+        url_path="convert",
+        authentication_classes=[],
+        permission_classes=[permissions.AllowAny],
+    )
+    def convert(self, request, slug=None):
+        """Counts a conversion for the variant the visitor was shown."""
+        pk, _, variant = self._assigned_variant(request, slug)
+        if variant is not None:
+            self.experiment_counter.conversion(pk, variant["key"])
+        return Response(status=status.HTTP_202_ACCEPTED)
+
+
+def product_feed(request, format):
+    """
+    Stream the merchant feed as XML or CSV; ``?since=<ISO datetime>`` limits
+    it to products changed since then.
+    """
+    if format not in feeds.CONTENT_TYPES:
+        raise Http404
+    since = None
+    if "since" in request.GET:
+        try:
+            since = parse_datetime(request.GET["since"])
+        except ValueError:
+            # Well formed but impossible, e.g. month 13.
+            since = None
+        if since is None:
+            raise Http404
+    response = StreamingHttpResponse(
+        feeds.render(format, since, request.build_absolute_uri("/")),
+        content_type=feeds.CONTENT_TYPES[format],
+    )
+    patch_cache_control(response, public=True, max_age=settings.FEED_MAX_AGE)
+    return response
@@ -0,0 +1,57 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from endobella.auth.models import User
+
+
+@pytest.fixture
+def admin_client(client, dummy_user):
+    admin = dummy_user(email="admin@user.com", is_staff=True, is_superuser=True)
+    client.force_login(admin)
+    return client
+
+
+@pytest.mark.django_db
+class TestPerformanceAdmin:
+    def test_user_search_by_email_prefix(self, admin_client, test_user):
+        url = reverse("admin:user_auth_user_changelist")
+        response = admin_client.get(url, {"q": "TEST@us"})
+        assert response.status_code == status.HTTP_200_OK
+        assert list(response.context["cl"].result_list) == [test_user]
+
+    def test_user_search_by_uuid(self, admin_client, test_user):
+        url = reverse("admin:user_auth_user_changelist")
+        response = admin_client.get(url, {"q": str(test_user.pk)})
+        assert list(response.context["cl"].result_list) == [test_user]
+
+    def test_article_changelist_defers_content(self, admin_client, test_article):
+        url = reverse("admin:articles_article_changelist")
+        response = admin_client.get(url, {"q": "Test Art"})
+        assert response.status_code == status.HTTP_200_OK
+        (article,) = response.context["cl"].result_list
+        assert article == test_article
+        assert "content" in article.get_deferred_fields()
+        assert response.context["cl"].full_result_count is None
+
+    def test_article_search_by_word_in_title(self, admin_client, test_article):
+        url = reverse("admin:articles_article_changelist")
+        word = test_article.title.split()[-1].lower()
+        response = admin_client.get(url, {"q": word})
+        assert list(response.context["cl"].result_list) == [test_article]
+
+    def test_author_autocomplete(self, admin_client, test_user):
+        response = admin_client.get(
+            reverse("admin:autocomplete"),
+            {
+                "term": "test",
+                "app_label": "articles",
+                "model_name": "article",
+                "field_name": "author",
+            },
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in response.json()["results"]] == [
+            str(test_user.pk)
+        ]
+        assert User.objects.count() == 2
@@ -0,0 +1,122 @@
+import random
+
+import pytest
+from django.test import override_settings
+from django.urls import reverse
+
+from endobella.common import autocomplete as autocomplete_module
+from endobella.common.autocomplete import Entry, PrefixIndex, autocomplete
+from endobella.shop.models import Category, Product, Tag
+
+
+@pytest.fixture
+def index(db):
+    autocomplete.reset()
+    yield autocomplete
+    autocomplete.reset()
+
+
+def test_prefix_index_matches_word_starts_and_ranks():
+    entries = {
+        1: Entry("Organic Cotton Tee", "tee", 5.0, 1.0),
+        2: Entry("Cotton Scarf", "scarf", 1.0, 3.0),
+        3: Entry("Linen Shirt", "shirt", 9.0, 2.0),
+    }
+    prefix_index = PrefixIndex(entries, top_size=10)
+    labels = [entry.label for entry in prefix_index.search("cotton", 10)]
+    assert labels == ["Organic Cotton Tee", "Cotton Scarf"]
+    assert [e.slug for e in prefix_index.search("cotton t", 10)] == ["tee"]
+    assert [e.slug for e in prefix_index.search("c", 1, "recent")] == ["scarf"]
+    assert prefix_index.search("wool", 10) == []
+    assert prefix_index.nbytes > 0
+
+
+def test_incremental_update_matches_a_rebuild(monkeypatch):
+    monkeypatch.setattr(autocomplete_module, "DENSE_RANGE", 8)
+    words = ["cotton", "linen", "tee", "care", "calm", "cycle", "lift"]
+    rng = random.Random(7)
+
+    def entry(pk):
+        label = " ".join(rng.choice(words) for _ in range(3))
+        return Entry(label, f"item-{pk}", rng.random(), rng.random())
+
+    entries = {pk: entry(pk) for pk in range(100)}
+    prefix_index = PrefixIndex(entries, top_size=5)
+    changes = {1: None, 2: entry(2), 3: entry(3), 100: entry(100), 101: entry(101)}
+    updated = prefix_index.updated(changes)
+    rebuilt = PrefixIndex(
+        {pk: e for pk, e in {**entries, **changes}.items() if e}, top_size=5
+    )
+    assert updated.keys == rebuilt.keys
+    assert len(rebuilt._top) > 20
+    for prefix, order in rebuilt._top:
+        assert updated.search(prefix, 5, order) == rebuilt.search(prefix, 5, order)
+    assert len(prefix_index.entries) == 100
+
+
+@pytest.mark.django_db
+def test_autocomplete_endpoint(client, index, test_article, test_article_unpublished):
+    category = Category.objects.create(name="Cotton Basics")
+    tag = Tag.objects.create(name="Cotton")
+    product = Product.objects.create(name="Organic Cotton Tee", category=category)
+    product.tags.add(tag)
+    Product.objects.create(name="Cotton Socks", is_available=False)
+    test_article.tags.add("cotton care")
+
+    response = client.get(reverse("autocomplete"), {"q": "Cott"})
+    assert response.status_code == 200
+    assert response["Cache-Control"].startswith("public")
+    data = response.json()
+    assert data["products"] == [{"label": "Organic Cotton Tee", "slug": product.slug}]
+    assert data["categories"] == [{"label": "Cotton Basics", "slug": "cotton-basics"}]
+    assert data["product_tags"] == [{"label": "Cotton", "slug": "cotton"}]
+    assert data["article_tags"] == [{"label": "cotton care", "slug": "cotton-care"}]
+
+    response = client.get(
+        reverse("autocomplete"), {"q": test_article.title[:4], "types": "articles"}
+    )
+    assert list(response.json()) == ["articles"]
+    assert response.json()["articles"][0]["slug"] == test_article.slug
+    assert client.get(reverse("autocomplete"), {"types": "users"}).status_code == 400
+
+
+@pytest.mark.django_db
+@override_settings(AUTOCOMPLETE_REFRESH_SECONDS=0, AUTOCOMPLETE_SYNC_OVERLAP_SECONDS=0)
+def test_index_catches_up_from_updated_at(index, django_assert_num_queries):
+    product = Product.objects.create(name="Linen Shirt")
+    assert index.search("linen", ["products"])["products"]
+
+    product.name = "Hemp Shirt"
+    product.save()
+    Product.objects.create(name="Linen Trousers")
+    # One query per kind, no full reload.
+    with django_assert_num_queries(5):
+        results = index.search("linen", ["products"])["products"]
+    assert [result["label"] for result in results] == ["Linen Trousers"]
+
+    product.is_available = False
+    product.save()
+    assert index.search("hemp", ["products"])["products"] == []
+
+
+@pytest.mark.django_db
+def test_blank_query_is_rejected_without_ranking(client, index, monkeypatch):
+    Product.objects.create(name="Cotton Tee")
+
+    def rank(*args, **kwargs):
+        raise AssertionError("ranked the whole index")
+
+    monkeypatch.setattr(PrefixIndex, "_rank", rank)
+    for query in ("", " ?!", None):
+        params = {} if query is None else {"q": query}
+        response = client.get(reverse("autocomplete"), params)
+        assert response.status_code == 400
+    assert index.search("--", ["products"]) == {"products": []}
+
+
+@pytest.mark.django_db(transaction=True)
+def test_warm_builds_the_index_in_the_background(index, django_assert_num_queries):
+    Product.objects.create(name="Cotton Tee")
+    index.warm().join()
+    with django_assert_num_queries(0):
+        assert index.search("cot", ["products"])["products"]
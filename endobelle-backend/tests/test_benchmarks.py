@@ -0,0 +1,45 @@
+import pytest
+
+from endobella.articles.models import Article
+from endobella.benchmarks import factories
+from endobella.benchmarks.runner import Result, compare, percentile, run_scenario
+from endobella.benchmarks.scenarios import SCENARIOS
+from endobella.shop.models import Product
+
+
+def test_percentile():
+    values = [1, 2, 3, 4, 5]
+    assert percentile(values, 50) == 3
+    assert percentile(values, 95) == pytest.approx(4.8)
+    assert percentile([], 99) == 0.0
+
+
+def test_compare_flags_regressions():
+    result = Result.from_samples("article-list", [0.02] * 10, 20, 0, 0.2)
+    baseline = {"article-list": {**vars(result), "p95_ms": 10.0}}
+    _, regressed = compare([result], baseline, tolerance=0.1)
+    assert regressed
+
+    _, regressed = compare([result], {"article-list": vars(result)}, tolerance=0.1)
+    assert not regressed
+
+
+@pytest.mark.django_db
+def test_factories_and_scenarios():
+    users = factories.create_users(5)
+    factories.create_articles(20, authors=users)
+    factories.create_products(5, reviewers=users)
+
+    assert Article.objects.count() == 20
+    assert Article.objects.first().tags.exists()
+    assert Product.objects.filter(variants__is_default=True).count() == 5
+
+    for name in (
+        "article-list",
+        "article-detail",
+        "article-filter-author",
+        "product-search",
+    ):
+        result = run_scenario(SCENARIOS[name], iterations=3, warmup=0)
+        assert result.errors == 0
+        assert result.queries_per_request >= 1
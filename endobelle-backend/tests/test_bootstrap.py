@@ -0,0 +1,53 @@
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+
+from endobella.articles.models import Article
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+
+
+@pytest.mark.django_db
+def test_bootstrap_payload(client, test_article, test_article_unpublished):
+    test_article.tags.add("diet")
+    response = client.get(reverse("bootstrap"))
+    assert response.status_code == 200
+    data = response.json()
+
+    assert [card["slug"] for card in data["featured"]] == [test_article.slug]
+    assert "content" not in data["featured"][0]
+    knowledge_base = Article.Category.KNOWLEDGE_BASE
+    assert [card["slug"] for card in data["latest"][knowledge_base]] == [
+        test_article.slug
+    ]
+    assert {"value": knowledge_base, "label": "Knowledlege Base", "count": 1} in data[
+        "categories"
+    ]
+    assert data["tags"] == [{"name": "diet", "slug": "diet", "count": 1}]
+
+
+@pytest.mark.django_db
+def test_bootstrap_queries_and_conditional_get(
+    client, test_article, django_assert_max_num_queries
+):
+    with django_assert_max_num_queries(10):
+        response = client.get(reverse("bootstrap"))
+    etag = response["ETag"]
+    assert "max-age" in response["Cache-Control"]
+
+    with django_assert_max_num_queries(2):
+        cached = client.get(reverse("bootstrap"))
+    assert cached.json() == response.json()
+
+    not_modified = client.get(reverse("bootstrap"), HTTP_IF_NONE_MATCH=etag)
+    assert not_modified.status_code == 304
+
+    test_article.title = "Changed"
+    test_article.save()
+    changed = client.get(reverse("bootstrap"), HTTP_IF_NONE_MATCH=etag)
+    assert changed.status_code == 200
+    assert changed["ETag"] != etag
+    assert changed.json()["featured"][0]["title"] == "Changed"
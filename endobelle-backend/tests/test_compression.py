@@ -0,0 +1,120 @@
+import gzip
+
+import brotli
+import pytest
+from django.core.cache import cache
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, override_settings
+from django.urls import reverse
+
+from endobella.common import compression
+from endobella.common.compression import CompressionMiddleware, negotiate
+
+BODY = b'{"content": "' + b"<p>endometriosis diet sleep</p>" * 200 + b'"}'
+
+
+def _middleware(response):
+    return CompressionMiddleware(lambda request: response)
+
+
+def _get(accept_encoding="gzip", path="/api/articles/"):
+    return RequestFactory().get(path, HTTP_ACCEPT_ENCODING=accept_encoding)
+
+
+def test_negotiate():
+    assert negotiate("gzip, deflate", ("br", "gzip")) == "gzip"
+    assert negotiate("gzip;q=0.5, br", ("br", "gzip")) == "br"
+    assert negotiate("br;q=0, *", ("br", "gzip")) == "gzip"
+    assert negotiate("identity", ("br", "gzip")) is None
+    assert negotiate("", ("br", "gzip")) is None
+
+
+def test_compresses_and_caches_body(monkeypatch):
+    cache.clear()
+    response = HttpResponse(BODY, content_type="application/json")
+    response["ETag"] = '"abc"'
+    response = _middleware(response)(_get())
+
+    assert response["Content-Encoding"] == "gzip"
+    assert response["Vary"] == "Accept-Encoding"
+    assert response["ETag"] == 'W/"abc"'
+    assert gzip.decompress(response.content) == BODY
+    assert int(response["Content-Length"]) == len(response.content)
+
+    def fail(*args):
+        raise AssertionError("compressed again")
+
+    # The same body is served from the cache without compressing it again.
+    monkeypatch.setattr(compression, "compress", fail)
+    again = _middleware(HttpResponse(BODY, content_type="application/json"))(_get())
+    assert again.content == response.content
+
+
+@override_settings(COMPRESSION_CACHE_ALIAS="")
+def test_brotli_is_preferred():
+    response = _middleware(HttpResponse(BODY, content_type="application/json"))(
+        _get(accept_encoding="gzip, deflate, br")
+    )
+    assert response["Content-Encoding"] == "br"
+    assert brotli.decompress(response.content) == BODY
+
+    chunks = [BODY[i : i + 500] for i in range(0, len(BODY), 500)]
+    response = StreamingHttpResponse(iter(chunks), content_type="text/csv")
+    response = _middleware(response)(_get(accept_encoding="br"))
+    assert brotli.decompress(b"".join(response.streaming_content)) == BODY
+
+
+def test_skips_small_and_binary_bodies():
+    small = _middleware(HttpResponse(b"{}", content_type="application/json"))(_get())
+    assert not small.has_header("Content-Encoding")
+
+    image = _middleware(HttpResponse(BODY, content_type="image/jpeg"))(_get())
+    assert not image.has_header("Content-Encoding")
+
+    plain = _middleware(HttpResponse(BODY, content_type="application/json"))(
+        _get(accept_encoding="")
+    )
+    assert plain.content == BODY
+
+
+@override_settings(COMPRESSION_CACHE_ALIAS="")
+def test_streaming_response():
+    chunks = [BODY[i : i + 500] for i in range(0, len(BODY), 500)]
+    response = StreamingHttpResponse(iter(chunks), content_type="text/csv")
+    response = CompressionMiddleware(lambda request: response)(_get())
+
+    assert response["Content-Encoding"] == "gzip"
+    assert gzip.decompress(b"".join(response.streaming_content)) == BODY
+
+
+@pytest.mark.django_db
+def test_article_detail_is_compressed(client, test_article, settings):
+    test_article.content = "<p>endometriosis diet sleep</p>" * 200
+    test_article.save()
+    url = reverse("article-detail", kwargs={"slug": test_article.slug})
+    response = client.get(url, HTTP_ACCEPT_ENCODING="gzip")
+    assert response["Vary"].endswith("Accept-Encoding")
+    assert response["Content-Encoding"] == "gzip"
+    body = gzip.decompress(response.content)
+    assert len(body) > settings.COMPRESSION_MIN_SIZE
+    assert body.startswith(b"{")
+
+
+@pytest.mark.django_db
+def test_pages_with_secrets_are_not_compressed(client, settings):
+    # BREACH: admin forms hold a CSRF token, auth responses hold JWTs.
+    response = client.get(
+        reverse("admin:login"), {"q": "x" * 2000}, HTTP_ACCEPT_ENCODING="gzip"
+    )
+    assert response.status_code == 200
+    assert len(response.content) > settings.COMPRESSION_MIN_SIZE
+    assert not response.has_header("Content-Encoding")
+
+    for path in ("/api/auth/jwt/create/", "/admin/"):
+        request = _get(path=path)
+        response = _middleware(HttpResponse(BODY, content_type="text/html"))(request)
+        assert not response.has_header("Content-Encoding")
+
+    post = RequestFactory().post("/api/articles/", HTTP_ACCEPT_ENCODING="gzip")
+    response = _middleware(HttpResponse(BODY, content_type="application/json"))(post)
+    assert not response.has_header("Content-Encoding")
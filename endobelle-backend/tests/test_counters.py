@@ -0,0 +1,81 @@
+import math
+
+import pytest
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+
+from endobella.articles.models import Article
+from endobella.articles.views import ArticleViewSet
+from endobella.common.counters import BufferedCounter, popularity_increment
+
+
+@pytest.fixture
+def counter():
+    counter = BufferedCounter(Article)
+    yield counter
+    counter._counts.clear()
+
+
+@pytest.mark.django_db
+@override_settings(VIEW_COUNT_FLUSH_INTERVAL=3600)
+def test_views_are_buffered_and_flushed(
+    counter, test_article, django_assert_num_queries
+):
+    for _ in range(3):
+        counter.add(test_article.slug)
+    counter.add("missing-article")
+    test_article.refresh_from_db()
+    assert test_article.view_count == 0
+
+    # One UPDATE per distinct count, inside a transaction.
+    with django_assert_num_queries(4):
+        assert counter.flush() == 1
+    test_article.refresh_from_db()
+    assert test_article.view_count == 3
+    assert test_article.popularity == pytest.approx(
+        math.log(1 + math.exp(popularity_increment(3))), rel=1e-3
+    )
+    assert counter.flush() == 0
+
+
+@pytest.mark.django_db
+@override_settings(VIEW_COUNT_MAX_KEYS=2, VIEW_COUNT_FLUSH_INTERVAL=3600)
+def test_flushes_when_buffer_is_full(counter, test_article):
+    counter.add(test_article.slug)
+    counter.add("other")
+    assert len(counter) == 0
+    test_article.refresh_from_db()
+    assert test_article.view_count == 1
+
+
+def test_recent_views_outweigh_old_ones():
+    from datetime import timedelta
+
+    from endobella.common.counters import POPULARITY_EPOCH
+
+    old = popularity_increment(10, POPULARITY_EPOCH + timedelta(days=30))
+    new = popularity_increment(2, POPULARITY_EPOCH + timedelta(days=40))
+    assert new > old
+
+
+@pytest.mark.django_db
+@override_settings(VIEW_COUNT_FLUSH_INTERVAL=3600)
+def test_track_view_and_popular_ordering(
+    client, test_article, test_article_unpublished
+):
+    cache.clear()
+    counter = ArticleViewSet.view_counter
+    url = reverse("article-track-view", kwargs={"slug": test_article.slug})
+    assert client.post(url).status_code == 202
+    assert counter._counts[test_article.slug] == 1
+    counter.flush()
+
+    response = client.get(reverse("article-list"), {"ordering": "popular"})
+    assert response.status_code == 200
+    assert response.json()["results"][0]["view_count"] == 1
+    assert "popularity" not in response.json()["results"][0]
+
+    Article.objects.update(view_count=100)
+    cached = client.get(reverse("article-list"), {"ordering": "popular"})
+    assert cached.json() == response.json()
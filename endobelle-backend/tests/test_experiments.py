@@ -0,0 +1,111 @@
+from collections import Counter
+
+import pytest
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+
+from endobella.shop import experiments
+from endobella.shop.models import DescriptionVariantStats, Product
+from endobella.shop.views import ProductViewSet
+
+VARIANTS = {
+    "variants": [
+        {"key": "a", "description": "Soft and light.", "weight": 1},
+        {"key": "b", "description": "Made to last.", "weight": 3},
+        {"key": "", "description": "Ignored"},
+    ]
+}
+
+
+@pytest.fixture
+def product(db):
+    return Product.objects.create(
+        name="Tee",
+        slug="tee",
+        long_description="A tee.",
+        gaio_description_variants=VARIANTS,
+    )
+
+
+@pytest.fixture
+def counter():
+    counter = ProductViewSet.experiment_counter
+    yield counter
+    counter._counts.clear()
+
+
+def test_assignment_is_stable_and_follows_weights():
+    assigned = Counter(
+        experiments.assign("product", VARIANTS, f"visitor-{i}")["key"]
+        for i in range(4000)
+    )
+    assert set(assigned) == {"a", "b"}
+    assert 0.7 < assigned["b"] / 4000 < 0.8
+    first = experiments.assign("product", VARIANTS, "visitor-1")
+    assert experiments.assign("product", VARIANTS, "visitor-1") is first
+    assert experiments.assign("product", {}, "visitor-1") is None
+
+
+@pytest.mark.django_db
+@override_settings(VIEW_COUNT_FLUSH_INTERVAL=3600)
+def test_impressions_and_conversions_are_buffered(
+    client, product, counter, django_assert_num_queries
+):
+    expected = experiments.assign(product.pk, VARIANTS, "visitor-1")
+    url = reverse("product-description-variant", kwargs={"slug": product.slug})
+    for _ in range(3):
+        response = client.get(url, {"visitor": "visitor-1"})
+        assert response.status_code == 200
+    assert response.json() == {
+        "variant": expected["key"],
+        "description": expected["description"],
+    }
+    convert = reverse("product-convert", kwargs={"slug": product.slug})
+    assert client.post(convert, {"visitor": "visitor-1"}).status_code == 202
+    assert client.get(url).status_code == 400
+    assert not DescriptionVariantStats.objects.exists()
+
+    # Product check, insert, row ids and one UPDATE per distinct increment.
+    with django_assert_num_queries(7):
+        assert counter.flush() == 1
+    stats = DescriptionVariantStats.objects.get()
+    assert (stats.variant, stats.impressions, stats.conversions) == (
+        expected["key"],
+        3,
+        1,
+    )
+
+    # The same day's row is incremented, not duplicated.
+    counter.impression(product.pk, expected["key"])
+    counter.flush()
+    stats.refresh_from_db()
+    assert stats.impressions == 4
+    assert DescriptionVariantStats.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_unknown_products_are_dropped(counter):
+    counter.impression("0196a0d2-0000-7000-8000-000000000000", "a")
+    assert counter.flush() == 0
+    assert len(counter) == 0
+
+
+@pytest.mark.django_db
+def test_rollup_writes_totals_to_the_product(product, counter):
+    counter.impression(product.pk, "a")
+    counter.impression(product.pk, "a")
+    counter.conversion(product.pk, "a")
+    counter.impression(product.pk, "retired")
+    counter.flush()
+    updated_at = product.updated_at
+
+    call_command("rollup_description_stats", stdout=None)
+    product.refresh_from_db()
+    data = product.gaio_description_variants
+    assert data["variants"] == VARIANTS["variants"]
+    assert data["stats"] == {
+        "a": {"impressions": 2, "conversions": 1, "conversion_rate": 0.5}
+    }
+    assert "stats_updated_at" in data
+    assert product.updated_at == updated_at
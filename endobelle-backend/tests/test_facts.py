@@ -0,0 +1,79 @@
+import pytest
+from django.urls import reverse
+
+from endobella.shop import facts
+from endobella.shop.models import Product, ProductFact
+
+
+@pytest.fixture
+def products(db):
+    return [
+        Product.objects.create(
+            name="Tee",
+            slug="tee",
+            gaio_structured_facts={"Material": "Organic Cotton", "Sizes": ["S", "M"]},
+            gaio_key_features=[{"feature": "Breathable", "benefit": "Cool"}],
+            gaio_faq_data=[{"q": "Is it vegan?", "a": "Yes"}],
+        ),
+        Product.objects.create(
+            name="Scarf",
+            slug="scarf",
+            gaio_structured_facts={"Material": "Linen", "Weight": 120},
+        ),
+    ]
+
+
+def test_extract_facts_flattens_lists_and_items():
+    product = Product(
+        gaio_structured_facts={"Sizes": ["S", "M"], "Weight": 120, "Nested": {}},
+        gaio_key_features=[{"feature": "Soft", "benefit": "x" * 600}],
+    )
+    assert set(facts.extract_facts(product)) == {
+        ("fact", "Sizes", "S"),
+        ("fact", "Sizes", "M"),
+        ("fact", "Weight", "120"),
+        ("feature", "feature", "Soft"),
+    }
+
+
+@pytest.mark.django_db
+def test_facts_follow_saves(products):
+    tee = products[0]
+    assert ProductFact.objects.filter(product=tee).count() == 7
+
+    tee.gaio_structured_facts = {"Material": "Bamboo"}
+    tee.save()
+    assert set(
+        ProductFact.objects.filter(product=tee, kind="fact").values_list("key", "value")
+    ) == {("Material", "Bamboo")}
+
+
+@pytest.mark.django_db
+def test_gaio_filter(products):
+    def slugs(kind, key, value):
+        return sorted(
+            Product.objects.filter(facts.gaio_filter(kind, key, value)).values_list(
+                "slug", flat=True
+            )
+        )
+
+    assert slugs("fact", "Material", "Linen") == ["scarf"]
+    assert slugs("fact", "Sizes", "M") == ["tee"]
+    assert slugs("fact", "Weight", "120") == ["scarf"]
+    assert slugs("feature", "feature", "Breathable") == ["tee"]
+    assert slugs("faq", "q", "Is it vegan?") == ["tee"]
+    assert slugs("fact", "Material", "Wool") == []
+
+
+@pytest.mark.django_db
+def test_catalog_filters_and_facets(client, products):
+    url = reverse("product-list")
+    response = client.get(url, {"fact": "Material: Organic Cotton"})
+    assert [item["slug"] for item in response.data["results"]] == ["tee"]
+    response = client.get(url, {"feature": "Breathable"})
+    assert [item["slug"] for item in response.data["results"]] == ["tee"]
+    assert client.get(url, {"fact": "Material"}).status_code == 400
+
+    response = client.get(reverse("product-facets"), {"kind": "fact"})
+    assert response.status_code == 200
+    assert {"key": "Material", "value": "Linen", "count": 1} in response.data
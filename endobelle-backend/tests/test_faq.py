@@ -0,0 +1,82 @@
+import pytest
+from django.urls import reverse
+
+from endobella.faq import index
+from endobella.faq.models import Question, QuestionTerm
+from endobella.shop.models import Product
+
+
+@pytest.fixture
+def product(db):
+    return Product.objects.create(
+        name="Heat pad",
+        slug="heat-pad",
+        gaio_faq_data=[
+            {"q": "Does heat help with cramps?", "a": "It relaxes the muscles."},
+            {"q": "Is it safe overnight?", "a": "Use the timer."},
+        ],
+    )
+
+
+def test_normalize_and_terms():
+    normalized = index.normalize("Does HEAT help with période cramps?!")
+    assert normalized == "does heat help with periode cramps"
+    assert index.terms(normalized) == {"heat", "help", "periode", "cramp"}
+
+
+@pytest.mark.django_db
+def test_index_follows_saves(test_article, product):
+    test_article.key_questions_answered = "What is endometriosis?\n\nHow is it treated?"
+    test_article.save()
+    assert list(
+        Question.objects.filter(article=test_article).values_list("text", flat=True)
+    ) == ["What is endometriosis?", "How is it treated?"]
+    assert Question.objects.filter(product=product).count() == 2
+
+    product.is_available = False
+    product.save()
+    assert not Question.objects.filter(product=product).exists()
+
+
+@pytest.mark.django_db
+def test_unchanged_questions_are_not_rewritten(product, django_assert_num_queries):
+    question_ids = set(Question.objects.values_list("pk", flat=True))
+    product.name = "Heat pad XL"
+    # The product UPDATE, then one SELECT each to compare facts and questions.
+    with django_assert_num_queries(3):
+        product.save()
+    assert set(Question.objects.values_list("pk", flat=True)) == question_ids
+
+
+@pytest.mark.django_db
+def test_search_ranks_closest_question(client, test_article, product):
+    test_article.key_questions_answered = "Can diet reduce endometriosis pain?"
+    test_article.save()
+
+    results = index.search("does heat help cramps")
+    assert results[0].text == "Does heat help with cramps?"
+    assert results[0].score == 1.0
+
+    response = client.get(reverse("faq-search"), {"q": "endometriosis pain diet"})
+    assert response.status_code == 200
+    assert response.data[0]["article"] == {
+        "slug": test_article.slug,
+        "title": test_article.title,
+    }
+    assert response.data[0]["product"] is None
+
+    response = client.get(reverse("faq-search"), {"product": "heat-pad"})
+    assert [item["answer"] for item in response.data] == [
+        "It relaxes the muscles.",
+        "Use the timer.",
+    ]
+    assert client.get(reverse("faq-search")).status_code == 400
+
+
+@pytest.mark.django_db
+def test_rebuild(product):
+    QuestionTerm.objects.all().delete()
+    Question.objects.all().delete()
+    index.rebuild(products=[product])
+    assert Question.objects.count() == 2
+    assert QuestionTerm.objects.filter(term="cramp").count() == 1
@@ -0,0 +1,130 @@
+import csv
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+from xml.etree import ElementTree
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+
+from endobella.shop import feeds
+from endobella.shop.models import Product, ProductImage, ProductVariant
+
+G = "{http://base.google.com/ns/1.0}"
+
+
+@pytest.fixture
+def catalog(db):
+    products = []
+    for i in range(3):
+        product = Product.objects.create(name=f"Cream {i}", slug=f"cream-{i}")
+        ProductVariant.objects.bulk_create(
+            [
+                ProductVariant(
+                    product=product, sku=f"C{i}-S", size="s", price=Decimal(10)
+                ),
+                ProductVariant(
+                    product=product,
+                    sku=f"C{i}-L",
+                    size="l",
+                    price=Decimal(20),
+                    discount_price=Decimal(15),
+                    stock_quantity=2,
+                    is_default=True,
+                ),
+            ]
+        )
+        ProductImage.objects.create(product=product, image=f"products/{i}.jpg")
+        products.append(product)
+    return products
+
+
+@pytest.mark.django_db
+def test_xml_feed_uses_default_variant(catalog, settings, django_assert_num_queries):
+    settings.FEED_SITE_URL = "https://shop.example"
+    settings.FEED_CHUNK_SIZE = 2
+    # One product query, then variants and images per chunk.
+    with django_assert_num_queries(5):
+        body = "".join(feeds.render("xml"))
+
+    items = ElementTree.fromstring(body).findall("channel/item")
+    assert len(items) == 3
+    item = items[0]
+    assert item.find(f"{G}id").text == "C0-L"
+    assert item.find(f"{G}price").text == "20.00 USD"
+    assert item.find(f"{G}sale_price").text == "15.00 USD"
+    assert item.find(f"{G}availability").text == "in_stock"
+    assert item.find(f"{G}link").text == "https://shop.example/products/cream-0"
+    assert (
+        item.find(f"{G}image_link").text == "https://shop.example/media/products/0.jpg"
+    )
+
+
+@pytest.mark.django_db
+def test_incremental_feed_includes_changes_only(catalog):
+    since = timezone.now()
+    catalog[1].is_available = False
+    catalog[1].save()
+
+    rows = list(csv.DictReader(StringIO("".join(feeds.render("csv", since)))))
+    assert [row["id"] for row in rows] == ["C1-L"]
+    assert rows[0]["availability"] == "out_of_stock"
+
+    past = since - timedelta(days=1)
+    assert len(list(feeds.feed_items(past))) == 3
+
+
+@pytest.mark.django_db
+def test_feed_endpoint_streams(client, catalog):
+    response = client.get(reverse("product-feed", args=["csv"]))
+    assert response.status_code == 200
+    assert response.streaming
+    body = b"".join(response.streaming_content).decode()
+    assert body.count("\n") == 4
+    assert client.get(reverse("product-feed", args=["json"])).status_code == 404
+    for since in ("yesterday", "2024-13-01T00:00"):
+        response = client.get(reverse("product-feed", args=["xml"]), {"since": since})
+        assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_export_command_writes_watermark(catalog, tmp_path):
+    output = tmp_path / "feed.xml"
+    state = tmp_path / "feed.xml.watermark"
+    call_command("export_product_feed", str(output), stdout=StringIO())
+    assert not state.exists()
+    # Without a watermark yet, an incremental run writes the full feed.
+    call_command(
+        "export_product_feed", str(output), incremental=True, stdout=StringIO()
+    )
+    assert len(ElementTree.parse(output).findall("channel/item")) == 3
+    watermark = state.read_text()
+
+    # A one-off export leaves the watermark alone.
+    call_command(
+        "export_product_feed",
+        str(output),
+        since="2000-01-01T00:00Z",
+        delta_output=str(tmp_path / "once.xml"),
+        stdout=StringIO(),
+    )
+    assert state.read_text() == watermark
+
+    out = StringIO()
+    call_command("export_product_feed", str(output), incremental=True, stdout=out)
+    assert "changes since" in out.getvalue()
+    # The full feed is kept; the changes go to a file of their own.
+    assert len(ElementTree.parse(output).findall("channel/item")) == 3
+    assert len(list(tmp_path.glob("feed.xml.delta-*"))) == 1
+
+    delta = tmp_path / "changes.xml"
+    call_command(
+        "export_product_feed",
+        str(output),
+        incremental=True,
+        delta_output=str(delta),
+        stdout=StringIO(),
+    )
+    assert delta.exists() and len(list(tmp_path.glob("feed.xml.delta-*"))) == 1
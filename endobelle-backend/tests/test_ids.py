@@ -0,0 +1,16 @@
+import time
+
+from endobella.common.ids import uuid7, uuid7_timestamp
+
+
+def test_uuid7_layout():
+    value = uuid7()
+    assert value.version == 7
+    assert value.variant == "specified in RFC 4122"
+    assert abs(uuid7_timestamp(value) - time.time()) < 1
+
+
+def test_uuid7_is_monotonic():
+    values = [uuid7() for _ in range(10_000)]
+    assert values == sorted(values)
+    assert len(set(values)) == len(values)
@@ -0,0 +1,87 @@
+import json
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from endobella.shop import inventory
+from endobella.shop.models import Product, ProductVariant
+
+
+@pytest.fixture
+def variants(db):
+    product = Product.objects.create(name="Serum", slug="serum")
+    return ProductVariant.objects.bulk_create(
+        [
+            ProductVariant(product=product, sku="S-1", size="s", price=Decimal(10)),
+            ProductVariant(
+                product=product,
+                sku="S-2",
+                size="l",
+                price=Decimal(20),
+                discount_price=Decimal(18),
+                stock_quantity=4,
+            ),
+        ]
+    )
+
+
+def test_parse_row_keeps_only_present_columns():
+    assert inventory.parse_row({"sku": "A", "price": "9.5"}) == (
+        "A",
+        {"price": Decimal("9.50")},
+    )
+    assert inventory.parse_row({"sku": "A", "discount_price": ""}) == (
+        "A",
+        {"discount_price": None},
+    )
+    with pytest.raises(inventory.InvalidRow):
+        inventory.parse_row({"sku": "A", "stock_quantity": "-1"})
+
+
+@pytest.mark.django_db
+def test_sync_writes_only_changes_and_refreshes_products(
+    variants, django_assert_num_queries
+):
+    rows = [
+        {"sku": "S-1", "price": "10.00", "stock_quantity": "7"},
+        {"sku": "S-2", "price": "20", "discount_price": ""},
+        {"sku": "NOPE", "stock_quantity": "1"},
+        {"sku": "S-3", "price": "abc"},
+    ]
+    # Select, savepoint, bulk update, release, product refresh.
+    with django_assert_num_queries(5):
+        report = inventory.sync(rows, batch_size=10)
+
+    assert (report.rows, report.matched, report.changed) == (4, 2, 2)
+    assert (report.unknown, report.invalid, report.products) == (1, 1, 1)
+    assert report.fields == {"stock_quantity": 1, "discount_price": 1}
+
+    product = Product.objects.get()
+    assert (product.min_price, product.max_price) == (Decimal(10), Decimal(20))
+    assert product.in_stock and not product.has_discount
+
+    report = inventory.sync(rows, batch_size=10)
+    assert report.changed == 0
+
+
+@pytest.mark.django_db
+def test_command_reads_jsonl(variants, tmp_path):
+    path = tmp_path / "stock.jsonl"
+    path.write_text(
+        "\n".join(json.dumps(row) for row in [{"sku": "S-1", "stock_quantity": 0}])
+    )
+    out = StringIO()
+    call_command("sync_inventory", str(path), stdout=out)
+    assert "Changed 0 of 1 matched variants" in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_malformed_jsonl_lines_are_invalid_rows(variants):
+    stream = StringIO('{"sku": "S-1", "stock_quantity": 3}\n\n{"sku": \n[1]\n')
+    report = inventory.sync(inventory.read_rows(stream, "jsonl"))
+
+    assert (report.rows, report.changed, report.invalid) == (3, 1, 2)
+    assert report.errors[0].startswith("row 2: line 3: invalid JSON")
+    assert report.errors[1] == "row 3: line 4: expected an object, got list"
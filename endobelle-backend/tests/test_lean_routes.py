@@ -0,0 +1,27 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken
+
+
+@pytest.mark.django_db
+class TestLeanRoutes:
+    def test_public_read_skips_session_stack(self, auth_client, test_article):
+        response = auth_client.get(reverse("article-list"))
+        assert response.status_code == status.HTTP_200_OK
+        assert "X-Frame-Options" not in response
+        assert "Vary" not in response or "Cookie" not in response["Vary"]
+        assert response.wsgi_request.user.is_anonymous
+
+    def test_admin_keeps_full_stack(self, auth_client):
+        response = auth_client.get(reverse("admin:login"))
+        assert response["X-Frame-Options"] == "DENY"
+        assert response.wsgi_request.user.is_authenticated
+
+    def test_jwt_still_authenticates(self, client, test_user, test_article):
+        token = AccessToken.for_user(test_user)
+        response = client.get(
+            reverse("article-list"), HTTP_AUTHORIZATION=f"JWT {token}"
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.renderer_context["request"].user == test_user
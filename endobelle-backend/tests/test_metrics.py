@@ -0,0 +1,50 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from endobella.common.metrics import Histogram, registry
+
+
+@pytest.fixture(autouse=True)
+def reset_registry():
+    registry.reset()
+
+
+@pytest.mark.django_db
+class TestPerformanceMiddleware:
+    article_list_url = reverse("article-list")
+
+    def test_server_timing_header(self, client, test_article):
+        response = client.get(self.article_list_url)
+        assert response.status_code == status.HTTP_200_OK
+        entries = [
+            entry.split(";")[0] for entry in response["Server-Timing"].split(", ")
+        ]
+        assert entries[:2] == ["total", "db"]
+        assert "serialize" in entries
+        assert "render" in entries
+
+    def test_metrics_endpoint(self, client, test_article):
+        client.get(self.article_list_url)
+        response = client.get(reverse("metrics"))
+        assert response.status_code == status.HTTP_200_OK
+        body = response.content.decode()
+        assert (
+            'endobella_requests_total{route="article-list",method="GET",status="200"} 1'
+            in body
+        )
+        assert 'endobella_db_queries_count{route="article-list"} 1' in body
+
+    @pytest.mark.parametrize("allowed", [[], ["10.0.0.1"]])
+    def test_metrics_endpoint_is_restricted(self, client, settings, allowed):
+        settings.PERFORMANCE_METRICS_ALLOWED_IPS = allowed
+        response = client.get(reverse("metrics"))
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_histogram_is_cumulative():
+    histogram = Histogram((1, 5))
+    for value in (0.5, 1, 3, 10):
+        histogram.observe(value)
+    assert list(histogram.cumulative()) == [(1, 2), (5, 3), (float("inf"), 4)]
+    assert histogram.sum == 14.5
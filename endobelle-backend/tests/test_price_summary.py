@@ -0,0 +1,108 @@
+from decimal import Decimal
+
+import pytest
+from django.urls import reverse
+
+from endobella.shop.models import Product, ProductVariant
+
+
+@pytest.fixture
+def product(db):
+    return Product.objects.create(name="Serum", slug="serum")
+
+
+def variant(product, sku, price, discount_price=None, stock_quantity=0):
+    return ProductVariant.objects.create(
+        product=product,
+        sku=sku,
+        size=sku,
+        price=Decimal(price),
+        discount_price=discount_price and Decimal(discount_price),
+        stock_quantity=stock_quantity,
+    )
+
+
+@pytest.mark.django_db
+def test_variant_saves_and_deletes_refresh_summary(
+    product, django_capture_on_commit_callbacks
+):
+    with django_capture_on_commit_callbacks(execute=True):
+        variant(product, "s", "20.00", discount_price="15.00")
+        large = variant(product, "l", "30.00", stock_quantity=3)
+    product.refresh_from_db()
+    assert (product.min_price, product.max_price) == (Decimal(15), Decimal(30))
+    assert product.has_discount and product.in_stock
+
+    with django_capture_on_commit_callbacks(execute=True):
+        large.delete()
+    product.refresh_from_db()
+    assert (product.min_price, product.max_price) == (Decimal(15), Decimal(15))
+    assert not product.in_stock
+
+
+@pytest.mark.django_db
+def test_bulk_writes_refresh_summary(product, django_assert_num_queries):
+    ProductVariant.objects.bulk_create(
+        [
+            ProductVariant(product=product, sku="a", size="a", price=Decimal(10)),
+            ProductVariant(product=product, sku="b", size="b", price=Decimal(12)),
+        ]
+    )
+    product.refresh_from_db()
+    assert product.min_price == Decimal(10)
+    assert not product.in_stock
+
+    ProductVariant.objects.filter(sku="a").update(price=Decimal(14))
+    variants = list(product.variants.all())
+    for item in variants:
+        item.stock_quantity = 1
+    # One variant UPDATE and a single product refresh.
+    with django_assert_num_queries(2):
+        ProductVariant.objects.bulk_update(variants, ["stock_quantity"])
+
+    product.refresh_from_db()
+    assert (product.min_price, product.max_price) == (Decimal(12), Decimal(14))
+    assert product.in_stock
+
+
+@pytest.mark.django_db
+def test_catalog_filters_and_sorts_on_summary(client):
+    for name, price in (("a", "30.00"), ("b", "10.00"), ("c", "20.00")):
+        item = Product.objects.create(name=name, slug=name)
+        ProductVariant.objects.bulk_create(
+            [ProductVariant(product=item, sku=name, price=Decimal(price))]
+        )
+
+    response = client.get(
+        reverse("product-list"),
+        {"min_price__gte": "15", "ordering": "min_price"},
+    )
+    assert response.status_code == 200
+    assert [item["slug"] for item in response.data["results"]] == ["c", "a"]
+
+
+@pytest.mark.django_db
+def test_moving_a_variant_refreshes_both_products(
+    product, django_capture_on_commit_callbacks
+):
+    other = Product.objects.create(name="Toner", slug="toner")
+    with django_capture_on_commit_callbacks(execute=True):
+        variant(product, "s", "20.00", discount_price="15.00", stock_quantity=2)
+
+    moved = ProductVariant.objects.get(sku="s")
+    moved.product = other
+    with django_capture_on_commit_callbacks(execute=True):
+        moved.save()
+    product.refresh_from_db()
+    other.refresh_from_db()
+    assert (product.min_price, product.in_stock, product.has_discount) == (
+        None,
+        False,
+        False,
+    )
+    assert (other.min_price, other.in_stock) == (Decimal(15), True)
+
+    moved.product = product
+    ProductVariant.objects.bulk_update([moved], ["product"])
+    other.refresh_from_db()
+    assert other.min_price is None
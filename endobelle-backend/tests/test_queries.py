@@ -0,0 +1,41 @@
+import pytest
+from django.urls import reverse
+
+from endobella.articles.models import Article
+from endobella.common.queries import normalize_sql, record_queries
+
+
+def test_normalize_sql_groups_values():
+    assert (
+        normalize_sql(
+            "SELECT * FROM t WHERE id = 12 AND name = 'it''s' AND x IN (%s, %s, %s)"
+        )
+        == "SELECT * FROM t WHERE id = ? AND name = ? AND x IN (...)"
+    )
+
+
+@pytest.mark.django_db
+def test_n_plus_one_detected(dummy_article, dummy_user):
+    for i in range(5):
+        dummy_article(
+            title=f"Article {i}",
+            slug=f"article-{i}",
+            author=dummy_user(email=f"author{i}@user.com"),
+        )
+
+    with record_queries() as report:
+        authors = [article.author.email for article in Article.objects.all()]
+
+    assert len(authors) == 5
+    (group,) = report.n_plus_one(threshold=5)
+    assert group.count == 5
+    assert any("test_queries.py" in location for location in group.locations)
+
+    with record_queries() as report:
+        list(Article.objects.select_related("author"))
+    assert report.n_plus_one(threshold=2) == []
+
+
+@pytest.mark.query_budget(2)
+def test_article_list_query_budget(client, test_article):
+    client.get(reverse("article-list"))
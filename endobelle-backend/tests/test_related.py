@@ -0,0 +1,133 @@
+import random
+import uuid
+
+import pytest
+from django.urls import reverse
+
+from endobella.articles import related
+from endobella.articles.models import Article, RelatedArticles, RelatedListing
+
+DIET = "<p>An anti inflammatory diet with omega fatty acids and fiber eases endometriosis pain.</p>"
+
+
+@pytest.fixture
+def articles(dummy_article, test_user, django_capture_on_commit_callbacks):
+    def _article(slug, content, category=Article.Category.DIET, tags=()):
+        with django_capture_on_commit_callbacks(execute=True):
+            article = dummy_article(
+                title=slug.replace("-", " "),
+                slug=slug,
+                author=test_user,
+                featured_image="x.jpg",
+                excerpt="",
+                content=content,
+                category=category,
+            )
+            article.tags.add(*tags)
+        return article
+
+    return _article
+
+
+def _slugs(article):
+    return [item["slug"] for item in RelatedArticles.objects.get(pk=article.pk).items]
+
+
+def test_text_similarity():
+    first = related.signature("omega fatty acids ease pain and support recovery")
+    second = related.signature("omega fatty acids ease pain and support sleep")
+    other = related.signature("gentle yoga breathing routine before bed")
+    assert related.text_similarity(first, first) == 1.0
+    assert related.text_similarity(first, second) > related.text_similarity(
+        first, other
+    )
+
+
+@pytest.mark.django_db
+def test_lists_update_incrementally(articles, django_capture_on_commit_callbacks):
+    diet = articles("diet", DIET, tags=["diet", "nutrition"])
+    similar = articles("similar-diet", DIET + "<p>Add iron.</p>", tags=["diet"])
+    yoga = articles(
+        "yoga",
+        "<p>Gentle yoga and breathing.</p>",
+        category=Article.Category.WELL_BEING,
+        tags=["nutrition"],
+    )
+
+    assert _slugs(diet) == ["similar-diet", "yoga"]
+    assert _slugs(similar) == ["diet"]
+    assert _slugs(yoga)[0] == "diet"
+
+    yoga.is_published = False
+    with django_capture_on_commit_callbacks(execute=True):
+        yoga.save()
+    assert _slugs(diet) == ["similar-diet"]
+
+
+@pytest.mark.django_db
+def test_rebuild_and_detail_endpoint(
+    articles, client, django_assert_num_queries, settings
+):
+    settings.RELATED_ARTICLES_AUTO_UPDATE = False
+    first = articles("first", DIET, tags=["diet"])
+    articles("second", DIET, tags=["diet"])
+    assert not RelatedArticles.objects.exists()
+
+    assert related.rebuild() == 2
+    with django_assert_num_queries(1):
+        response = client.get(reverse("article-detail", kwargs={"slug": first.slug}))
+    assert [item["slug"] for item in response.json()["related"]] == ["second"]
+    assert "related" not in client.get(reverse("article-list")).json()["results"][0]
+
+
+@pytest.mark.django_db
+def test_incremental_updates_match_a_rebuild(
+    articles, django_capture_on_commit_callbacks, monkeypatch, settings
+):
+    # Every list is made of candidates: category fill is only exact on rebuild.
+    settings.RELATED_ARTICLES_COUNT = 3
+    load = related.Corpus.load.__func__
+
+    def partial_load(cls, signatures=None, ids=None):
+        assert ids is not None, "an update loaded the whole corpus"
+        return load(cls, signatures, ids)
+
+    monkeypatch.setattr(related.Corpus, "load", classmethod(partial_load))
+    rng = random.Random(3)
+    words = ["omega", "fiber", "iron", "yoga", "sleep", "pain", "diet", "breathing"]
+    words += ["recovery", "gentle"]
+    created = [
+        articles(
+            f"article-{i}",
+            "<p>" + " ".join(rng.choice(words) for _ in range(12)) + "</p>",
+            category=rng.choice(list(Article.Category)),
+            tags=rng.sample(["diet", "sleep", "pain"], rng.randint(1, 2)),
+        )
+        for i in range(25)
+    ]
+    for article in rng.sample(created, 8):
+        with django_capture_on_commit_callbacks(execute=True):
+            article.content = "<p>" + " ".join(rng.sample(words, 6)) + "</p>"
+            article.is_published = rng.random() < 0.7
+            article.save()
+            article.tags.set(rng.sample(["diet", "sleep"], 1))
+    with django_capture_on_commit_callbacks(execute=True):
+        created[0].delete()
+
+    def snapshot():
+        rows = RelatedArticles.objects.filter(article__is_published=True)
+        return {
+            row.article_id: sorted(item["score"] for item in row.items) for row in rows
+        }
+
+    # The reverse lookup rows mirror the lists.
+    assert set(RelatedListing.objects.values_list("article_id", "listed")) == {
+        (row.article_id, uuid.UUID(item["id"]))
+        for row in RelatedArticles.objects.all()
+        for item in row.items
+    }
+    incremental = snapshot()
+    monkeypatch.setattr(related.Corpus, "load", classmethod(load))
+    related.rebuild()
+    assert incremental == snapshot()
+    assert str(created[0].pk) not in str(list(RelatedArticles.objects.values("items")))
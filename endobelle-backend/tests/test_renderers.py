@@ -0,0 +1,42 @@
+import io
+import uuid
+from datetime import UTC, datetime
+from decimal import Decimal
+
+import pytest
+from django.urls import reverse
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+
+from endobella.common.renderers import FastJSONParser, FastJSONRenderer
+
+
+def test_renders_like_stdlib():
+    data = {
+        "id": uuid.UUID("018f5b0e-0000-7000-8000-000000000000"),
+        "created_at": datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC),
+        "price": Decimal("19.99"),
+        "label": gettext_lazy("Diet"),
+        "content": "<p>Zażółć gęślą</p>",
+        "features": [{"feature": "Soft", "benefit": None}],
+    }
+    assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+def test_indent_falls_back_to_stdlib():
+    rendered = FastJSONRenderer().render({"a": 1}, "application/json; indent=2")
+    assert rendered == b'{\n  "a": 1\n}'
+
+
+def test_parser():
+    parser = FastJSONParser()
+    assert parser.parse(io.BytesIO(b'{"email": "a@b.pl"}')) == {"email": "a@b.pl"}
+    with pytest.raises(ParseError):
+        parser.parse(io.BytesIO(b"{"))
+
+
+@pytest.mark.django_db
+def test_article_list_is_json(client, test_article):
+    response = client.get(reverse("article-list"))
+    assert response.json()["results"][0]["author"] == str(test_article.author_id)
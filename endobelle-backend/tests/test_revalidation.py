@@ -0,0 +1,104 @@
+import json
+import threading
+from decimal import Decimal
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from endobella.common import revalidation
+from endobella.shop import inventory
+from endobella.shop.models import Product, ProductVariant
+
+
+@pytest.fixture
+def receiver(settings):
+    received = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            received.append((body, self.headers.get("X-Revalidate-Signature")))
+            self.send_response(204)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    settings.REVALIDATION_WEBHOOK_URL = f"http://127.0.0.1:{server.server_port}/"
+    settings.REVALIDATION_WEBHOOK_SECRET = "secret"
+    settings.REVALIDATION_DEBOUNCE_SECONDS = 60
+    yield received
+    revalidation.queue.flush()
+    server.shutdown()
+
+
+@pytest.mark.django_db
+def test_burst_is_coalesced_into_one_signed_request(
+    receiver, test_article, django_capture_on_commit_callbacks
+):
+    with django_capture_on_commit_callbacks(execute=True):
+        for title in ("One", "Two", "Three"):
+            test_article.title = title
+            test_article.save()
+        test_article.slug = "renamed"
+        test_article.save()
+    assert len(revalidation.queue) == 2
+
+    assert revalidation.queue.flush()
+    assert len(receiver) == 1
+    body, signature = receiver[0]
+    assert signature == revalidation.sign(body, "secret")
+    payload = json.loads(body)
+    assert {(e["slug"], e["action"]) for e in payload["events"]} == {
+        ("renamed", "saved"),
+        ("test-article", "deleted"),
+    }
+    assert {"articles", "bootstrap", "article:renamed", "article:test-article"} <= set(
+        payload["keys"]
+    )
+
+
+def test_failed_delivery_is_retried(settings, monkeypatch):
+    settings.REVALIDATION_WEBHOOK_URL = "http://127.0.0.1:9/"
+    settings.REVALIDATION_MAX_RETRIES = 2
+    settings.REVALIDATION_RETRY_BACKOFF = 0
+    settings.REVALIDATION_TIMEOUT = 0.5
+    calls = []
+    original = revalidation.urllib.request.urlopen
+
+    def urlopen(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(revalidation.urllib.request, "urlopen", urlopen)
+    assert not revalidation.deliver(
+        [{"type": "article", "slug": "x", "action": "saved", "keys": ["a"]}]
+    )
+    assert len(calls) == 3
+
+
+@pytest.mark.django_db
+def test_disabled_without_url(test_article, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        test_article.save()
+    assert len(revalidation.queue) == 0
+
+
+@pytest.mark.django_db
+def test_variant_and_inventory_changes_revalidate_the_product(
+    receiver, django_capture_on_commit_callbacks
+):
+    product = Product.objects.create(name="Serum", slug="serum")
+    with django_capture_on_commit_callbacks(execute=True):
+        variant = ProductVariant.objects.create(
+            product=product, sku="S-1", size="s", price=Decimal(10)
+        )
+    assert revalidation.queue.flush()
+    assert json.loads(receiver[-1][0])["keys"] == ["product:serum", "products"]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        inventory.sync([{"sku": variant.sku, "price": "12"}])
+    assert len(revalidation.queue) == 1
@@ -0,0 +1,77 @@
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+
+from endobella.auth.models import RevokedToken
+from endobella.auth.revocation import BloomFilter, RevocationList, revocations
+from endobella.auth.tokens import RefreshToken
+
+
+@pytest.fixture(autouse=True)
+def fresh_filter():
+    revocations.reset()
+    yield
+    revocations.reset()
+
+
+def test_bloom_filter_has_no_false_negatives_and_few_false_positives():
+    bloom = BloomFilter(10_000, 0.01)
+    keys = [f"jti-{i}" for i in range(10_000)]
+    for key in keys:
+        bloom.add(key)
+    assert all(key in bloom for key in keys)
+    false_positives = sum(f"other-{i}" in bloom for i in range(10_000))
+    assert false_positives < 200
+    assert bloom.nbytes < 13_000
+
+
+@pytest.mark.django_db
+def test_logout_revokes_refresh_token(client, test_user):
+    refresh = str(RefreshToken.for_user(test_user))
+
+    response = client.post(reverse("jwt-refresh"), {"refresh": refresh})
+    assert response.status_code == 200
+
+    response = client.post(reverse("auth-jwt-logout"), {"refresh": refresh})
+    assert response.status_code == 200
+    assert RevokedToken.objects.count() == 1
+
+    response = client.post(reverse("jwt-refresh"), {"refresh": refresh})
+    assert response.status_code == 401
+
+
+@pytest.mark.django_db
+def test_unrevoked_tokens_skip_the_database(test_user, django_assert_num_queries):
+    RefreshToken.for_user(test_user).revoke()
+    token = RefreshToken.for_user(test_user)
+    with django_assert_num_queries(0):
+        RefreshToken(str(token))
+
+
+@pytest.mark.django_db
+def test_other_processes_catch_up(settings, test_user):
+    settings.TOKEN_REVOCATION_REFRESH_SECONDS = 0
+    other = RevocationList()
+    token = RefreshToken.for_user(test_user)
+    assert not other.is_revoked(token["jti"])
+
+    token.revoke()
+    assert other.is_revoked(token["jti"])
+
+
+@pytest.mark.django_db
+def test_purge_deletes_expired_tokens_in_batches():
+    now = timezone.now()
+    RevokedToken.objects.bulk_create(
+        RevokedToken(jti=f"old-{i}", expires_at=now - timedelta(hours=1))
+        for i in range(5)
+    )
+    RevokedToken.objects.create(jti="live", expires_at=now + timedelta(hours=1))
+
+    call_command("purge_revoked_tokens", batch_size=2, stdout=StringIO())
+
+    assert list(RevokedToken.objects.values_list("jti", flat=True)) == ["live"]
@@ -0,0 +1,97 @@
+import pytest
+from django.test import override_settings
+from django.urls import reverse
+
+from endobella.shop import search
+from endobella.shop.models import Product, ProductVariant, Tag
+
+
+@pytest.fixture
+def index(db):
+    search.trigram_index.reset()
+    yield search.trigram_index
+    search.trigram_index.reset()
+
+
+def _product(captured, **fields):
+    with captured(execute=True):
+        return Product.objects.create(**fields)
+
+
+def test_document_normalizes_and_deduplicates():
+    text = search.document("Crème Tee", "A soft tee.", ["Cotton"], ["TEE-S"])
+    assert text == "creme tee a soft cotton s"
+
+
+def test_trigram_index_tolerates_typos_and_prefers_stock():
+    index = search.TrigramIndex()
+    index.add(1, "Organic Cotton Tee", "organic cotton tee", in_stock=False)
+    index.add(2, "Cotton Tee", "cotton tee", in_stock=True)
+    index.add(3, "Linen Shirt", "linen shirt soft cotton", in_stock=True)
+    index.add(4, "Wool Socks", "wool socks", in_stock=True)
+
+    # Every word must match on average; product 3 only has "cotton".
+    assert [pk for pk, _ in index.search("coton tea", 10)] == [2, 1]
+    # Name matches outrank description matches, unless out of stock.
+    results = index.search("coton", 10)
+    assert [pk for pk, _ in results] == [2, 3, 1]
+    assert results[0][1] > results[1][1] > results[2][1]
+    assert index.search("cashmere", 10) == []
+
+    index.remove(2)
+    assert [pk for pk, _ in index.search("cotton", 10)] == [3, 1]
+    assert len(index) == 3
+
+
+@pytest.mark.django_db
+def test_search_text_follows_tags_and_variants(django_capture_on_commit_callbacks):
+    product = _product(
+        django_capture_on_commit_callbacks, name="Tee", short_description="Soft."
+    )
+    tag = Tag.objects.create(name="Organic")
+    with django_capture_on_commit_callbacks(execute=True):
+        product.tags.add(tag)
+        ProductVariant.objects.create(product=product, sku="TEE-01", price=10)
+    product.refresh_from_db()
+    assert product.search_text == "tee soft organic 01"
+
+    with django_capture_on_commit_callbacks(execute=True):
+        tag.name = "Bamboo"
+        tag.save()
+    product.refresh_from_db()
+    assert product.search_text == "tee soft bamboo 01"
+
+    with django_capture_on_commit_callbacks(execute=True):
+        tag.products.clear()
+    product.refresh_from_db()
+    assert product.search_text == "tee soft 01"
+
+
+@pytest.mark.django_db
+@override_settings(
+    PRODUCT_SEARCH_REFRESH_SECONDS=0, PRODUCT_SEARCH_SYNC_OVERLAP_SECONDS=0
+)
+def test_search_endpoint(client, index, django_capture_on_commit_callbacks):
+    tee = _product(django_capture_on_commit_callbacks, name="Organic Cotton Tee")
+    _product(
+        django_capture_on_commit_callbacks, name="Cotton Socks", is_available=False
+    )
+    url = reverse("product-search")
+
+    response = client.get(url, {"q": "organik coton"})
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["slug"] for item in data] == [tee.slug]
+    assert 0 < data[0]["score"] <= 1
+    assert "search_text" not in data[0]
+    assert client.get(url, {"q": ""}).json() == []
+    assert client.get(url, {"q": "tee", "limit": "x"}).status_code == 400
+
+    # Renames are caught up from updated_at.
+    with django_capture_on_commit_callbacks(execute=True):
+        tee.name = "Hemp Shirt"
+        tee.save()
+    assert client.get(url, {"q": "cotton"}).json() == []
+    assert [item["slug"] for item in client.get(url, {"q": "hemp"}).json()] == [
+        tee.slug
+    ]
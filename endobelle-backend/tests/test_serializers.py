@@ -0,0 +1,44 @@
+import pytest
+from rest_framework import serializers
+
+from endobella.articles.models import Article
+from endobella.articles.serializers import ArticleSerializer
+from endobella.auth.serializers import UserSerializer
+
+
+class PlainArticleSerializer(serializers.ModelSerializer):
+    class Meta:
+        exclude = ["popularity"]
+        model = Article
+
+
+@pytest.mark.django_db
+def test_output_matches_model_serializer(test_article):
+    assert (
+        ArticleSerializer(test_article).data
+        == PlainArticleSerializer(test_article).data
+    )
+    assert ArticleSerializer([test_article], many=True).data == (
+        PlainArticleSerializer([test_article], many=True).data
+    )
+
+
+@pytest.mark.django_db
+def test_user_serializer(test_article):
+    data = UserSerializer(test_article.author).data
+    assert set(data) == {
+        "id",
+        "email",
+        "first_name",
+        "last_name",
+        "created_at",
+        "updated_at",
+    }
+
+
+def test_fields_are_built_once():
+    first, second = ArticleSerializer(), ArticleSerializer()
+    assert "_fields_prototype" in ArticleSerializer.__dict__
+    assert list(first.fields) == list(second.fields)
+    assert first.fields["title"] is not second.fields["title"]
+    assert first.fields["title"].parent is first
@@ -0,0 +1,68 @@
+import pytest
+from django.db import IntegrityError
+
+from endobella.common import slugs
+from endobella.shop.models import Category, Product, Tag
+
+
+@pytest.mark.django_db
+def test_batch_gets_unique_slugs_from_one_query(django_assert_num_queries):
+    Tag.objects.create(name="Cotton")
+    Tag.objects.create(name="Cotton 2")
+    tags = [Tag(name="Cotton"), Tag(name="Cotton"), Tag(name="Linen"), Tag(name="!")]
+    tags.append(Tag(name="Wool", slug="merino"))
+
+    with django_assert_num_queries(1):
+        allocated = slugs.allocate_slugs(tags, "name")
+    assert allocated == tags[:4]
+    assert [tag.slug for tag in tags] == [
+        "cotton-3",
+        "cotton-4",
+        "linen",
+        "tag",
+        "merino",
+    ]
+
+
+@pytest.mark.django_db
+def test_save_allocates_and_keeps_given_slugs():
+    assert Product.objects.create(name="Tee").slug == "tee"
+    assert Product.objects.create(name="Tee").slug == "tee-2"
+    long_name = Category.objects.create(name="x" * 300).slug
+    assert long_name == "x" * (255 - slugs.SUFFIX_LENGTH)
+    with pytest.raises(IntegrityError):
+        Product.objects.create(name="Other", slug="tee")
+
+
+@pytest.fixture
+def stale_read(monkeypatch):
+    """The first slug read misses the rows another process just inserted."""
+    existing = slugs._existing
+    calls = []
+
+    def read(*args):
+        calls.append(args)
+        return set() if len(calls) == 1 else existing(*args)
+
+    monkeypatch.setattr(slugs, "_existing", read)
+    return calls
+
+
+@pytest.mark.django_db
+def test_save_retries_a_slug_taken_concurrently(stale_read):
+    Product.objects.create(name="Tee")
+    stale_read.clear()
+    assert Product.objects.create(name="Tee").slug == "tee-2"
+    assert len(stale_read) == 2
+
+
+@pytest.mark.django_db
+def test_bulk_create_with_slugs(stale_read):
+    Tag.objects.create(name="Cotton")
+    stale_read.clear()
+    tags = slugs.bulk_create_with_slugs(
+        Tag, (Tag(name=name) for name in ["Cotton", "Cotton", "Linen"]), "name"
+    )
+    assert [tag.slug for tag in tags] == ["cotton-2", "cotton-3", "linen"]
+    assert Tag.objects.count() == 4
+    assert len(stale_read) == 2
@@ -0,0 +1,104 @@
+import os
+
+import pytest
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import RequestFactory
+
+from endobella.common.management.commands import gc_media
+from endobella.common.models import MediaBlob
+from endobella.common.storage import ContentAddressedStorage
+from endobella.common.views import media
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 4096
+
+
+@pytest.fixture
+def storage(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+    return ContentAddressedStorage(location=str(tmp_path))
+
+
+def _files(root):
+    return [
+        name
+        for _, dirs, names in os.walk(root)
+        for name in names
+        if not name.startswith("tmp")
+    ]
+
+
+@pytest.mark.django_db
+def test_identical_uploads_share_one_file(storage, tmp_path):
+    first = storage.save("uploads/a.PNG", SimpleUploadedFile("a.PNG", PNG))
+    second = storage.save("products/b.png", ContentFile(PNG))
+    other = storage.save("uploads/c.png", ContentFile(PNG + b"x"))
+
+    assert first == second
+    assert first.startswith("cas/") and first.endswith(".png")
+    assert other != first
+    assert len(_files(tmp_path)) == 2
+    assert not os.listdir(tmp_path / "cas" / "tmp")
+    assert MediaBlob.objects.get(name=first).refcount == 2
+
+    storage.delete(first)
+    assert storage.exists(first)
+    storage.delete(first)
+    assert not storage.exists(first)
+    assert not MediaBlob.objects.filter(name=first).exists()
+
+
+@pytest.mark.django_db
+def test_save_restores_a_file_missing_on_disk(storage):
+    # E.g. removed by a delete() that raced with this save's reference.
+    name = storage.save("uploads/a.png", ContentFile(PNG))
+    os.unlink(storage.path(name))
+    assert storage.save("uploads/b.png", ContentFile(PNG)) == name
+    assert storage.open(name).read() == PNG
+    assert MediaBlob.objects.get(name=name).refcount == 2
+
+
+@pytest.mark.django_db
+def test_gc_recounts_references(storage, test_article):
+    name = storage.save("uploads/a.png", ContentFile(PNG))
+    orphan = storage.save("uploads/b.png", ContentFile(PNG + b"orphan"))
+    storage.save("uploads/c.png", ContentFile(PNG + b"orphan"))
+    test_article.featured_image = name
+    test_article.content = f'<img src="/media/{name}">'
+    test_article.save()
+
+    with open(os.devnull, "w") as devnull:
+        call_command("gc_media", min_age=0, stdout=devnull)
+    assert MediaBlob.objects.get(name=name).refcount == 2
+    assert not storage.exists(orphan)
+
+
+@pytest.mark.django_db
+def test_gc_keeps_a_blob_saved_again_after_counting(storage, monkeypatch):
+    name = storage.save("uploads/a.png", ContentFile(PNG))
+    count_references = gc_media.Command.count_references
+
+    def count_then_upload(self):
+        references = count_references(self)
+        # The same bytes are uploaded again while gc is running.
+        storage.save("uploads/b.png", ContentFile(PNG))
+        return references
+
+    monkeypatch.setattr(gc_media.Command, "count_references", count_then_upload)
+    with open(os.devnull, "w") as devnull:
+        call_command("gc_media", min_age=0, stdout=devnull)
+    assert storage.exists(name)
+    assert MediaBlob.objects.get(name=name).refcount == 2
+
+
+@pytest.mark.django_db
+def test_media_view_is_immutable(storage):
+    name = storage.save("uploads/a.png", ContentFile(PNG))
+    response = media(RequestFactory().get(f"/media/{name}"), name)
+    assert response.status_code == 200
+    assert "immutable" in response["Cache-Control"]
+    etag = response["ETag"]
+
+    cached = media(RequestFactory().get("/", HTTP_IF_NONE_MATCH=etag), name)
+    assert cached.status_code == 304